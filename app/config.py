@@ -0,0 +1,55 @@
+"""Configuración de la aplicación leída de variables de entorno.
+
+Permite ajustar el despliegue (p. ej. en `render.yaml`, sección `envVars`) sin cambiar
+código. Cada valor tiene un default seguro para desarrollo local.
+"""
+
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Lee un booleano (`1/true/yes/on` o `0/false/no/off`) de la variable `name`."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Lee un entero de la variable `name`; usa `default` si falta o no es válido."""
+    try:
+        return int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+
+
+def _env_choice(name: str, choices: tuple, default: str) -> str:
+    """Lee uno de los valores `choices` de la variable `name`; usa `default` si falta o no es válido."""
+    value = os.environ.get(name, "").strip().lower()
+    return value if value in choices else default
+
+
+# Caché de resultados de matrices y sistemas lineales (`utils.cache`)
+CACHE_ENABLED = _env_bool("CALC_CACHE_ENABLED", True)
+CACHE_MAX_ENTRIES = _env_int("CALC_CACHE_MAX_ENTRIES", 512)
+CACHE_MAX_BYTES = _env_int("CALC_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+# Planificador de cálculos pesados (`utils.scheduler`)
+OFFLOAD_WORKERS = _env_int("CALC_OFFLOAD_WORKERS", 1)
+OFFLOAD_MIN_FLOPS = float(_env_int("CALC_OFFLOAD_MIN_FLOPS", 100_000_000))
+OFFLOAD_MAX_PENDING = _env_int("CALC_OFFLOAD_MAX_PENDING", 8)
+
+# Hilos de BLAS (`utils.blas`): presupuesto por proceso (0 = núcleos / workers de uvicorn) y
+# costo estimado desde el que una llamada usa el presupuesto completo (por debajo, 1 hilo)
+WEB_WORKERS = _env_int("WEB_CONCURRENCY", 1)
+BLAS_THREADS = _env_int("CALC_BLAS_THREADS", 0)
+BLAS_PARALLEL_MIN_FLOPS = float(_env_int("CALC_BLAS_PARALLEL_MIN_FLOPS", 16_000_000))
+
+# Almacén de matrices subidas por el cliente (`utils.store`)
+STORE_MAX_BYTES = _env_int("CALC_STORE_MAX_BYTES", 256 * 1024 * 1024)
+STORE_TTL = _env_int("CALC_STORE_TTL", 3600)
+
+# Arranque en frío (`utils.warmup`): `off`, `background` o `gate` (`/health` en 503 hasta terminar)
+WARMUP_MODE = _env_choice("CALC_WARMUP", ("off", "background", "gate"), "background")
+# También arranca un proceso del pool de cálculos pesados durante el precalentamiento
+WARMUP_POOL = _env_bool("CALC_WARMUP_POOL", False)
@@ -0,0 +1,145 @@
+"""Ejecución por lotes de operaciones matriciales con arreglos apilados de NumPy.
+
+Agrupa trabajos con la misma operación y forma y los ejecuta como un único arreglo
+`(k, n, n)`, aprovechando que `np.linalg.slogdet`, `np.linalg.inv` y `np.matmul` operan
+sobre la última pareja de ejes ("broadcasting"). Así, miles de matrices pequeñas
+(3x3, 4x4) se resuelven con una sola llamada a NumPy por grupo en lugar de una
+llamada por matriz. `pow` agrupa además por exponente (`np.linalg.matrix_power` también
+admite pilas).
+
+Referencias:
+- Álgebra lineal apilada: https://numpy.org/doc/stable/reference/routines.linalg.html#linear-algebra-on-several-matrices-at-once
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+
+from . import matrix_ops, structure
+
+# Trabajo de lote: (operación, operando principal, segundo operando o exponente de `pow`)
+Job = Tuple[str, np.ndarray, Union[np.ndarray, int, None]]
+
+BINARY_OPS = ("add", "sub", "mul")
+UNARY_OPS = ("det", "inv", "trans", "pow")
+
+
+def _group_key(job: Job):
+    """Clave de agrupación: operación, formas y tipo de los operandos (y exponente de `pow`)."""
+    op, X, Y = job
+    return (op, X.shape, Y.shape if isinstance(Y, np.ndarray) else Y, X.dtype)
+
+
+def _stackable(op: str, xshape, yshape, dtype) -> bool:
+    """Indica si un grupo cumple las reglas de forma y puede ejecutarse apilado.
+
+    Los grupos inválidos y los exactos (`dtype=object`, que `np.linalg` no admite) se
+    ejecutan trabajo a trabajo con `matrix_ops`, que produce los mismos resultados y
+    mensajes de error que el endpoint individual. En `pow`, `yshape` es el exponente; los
+    negativos (que invierten) y los fuera de `POW_MAX_EXP` también van por esa ruta.
+    """
+    if dtype == object:
+        return False
+    if op in ("add", "sub"):
+        return yshape is not None and xshape == yshape
+    if op == "mul":
+        return yshape is not None and xshape[1] == yshape[0]
+    if op in ("det", "inv"):
+        return xshape[0] == xshape[1]
+    if op == "pow":
+        return xshape[0] == xshape[1] and 0 <= yshape <= matrix_ops.POW_MAX_EXP
+    return op == "trans"
+
+
+def _single(job: Job) -> Dict[str, Any]:
+    """Ejecuta un trabajo individual con `matrix_ops` (ruta de respaldo)."""
+    op, X, Y = job
+    try:
+        if op == "add":
+            return {"resultMatrix": matrix_ops.add(X, Y)}
+        if op == "sub":
+            return {"resultMatrix": matrix_ops.subtract(X, Y)}
+        if op == "mul":
+            return {"resultMatrix": matrix_ops.multiply(X, Y)}
+        if op == "det":
+            return {"scalar": matrix_ops.det(X)}
+        if op == "inv":
+            return {"resultMatrix": matrix_ops.inv(X)}
+        if op == "trans":
+            return {"resultMatrix": matrix_ops.transpose(X)}
+        if op == "pow":
+            return {"resultMatrix": matrix_ops.power(X, Y)}
+        return {"error": "Operación no válida"}
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+def _run_stacked(op: str, Xs: np.ndarray, Ys: Union[np.ndarray, int, None]) -> List[Dict[str, Any]]:
+    """Ejecuta un grupo homogéneo sobre arreglos apilados `(k, m, n)`.
+
+    `Ys` son los segundos operandos apilados (binarias) o el exponente común (`pow`).
+
+    - `det`: `np.linalg.slogdet` sobre todo el lote (`None` si `|A|` desborda `float`).
+    - `inv`: invierte todo el lote en una sola llamada y marca como error las matrices
+      singulares (`matrix_ops.is_invertible`). Sólo si LAPACK encuentra un
+      pivote exactamente nulo se separan antes con `slogdet` y se invierte el resto.
+    - `mul`: `np.matmul` apilado; `add`/`sub`: aritmética elemento a elemento.
+    - `pow`: `np.linalg.matrix_power` apilado (cuadrados sucesivos sobre todo el lote).
+    """
+    k = Xs.shape[0]
+    if op == "det":
+        signs, logs = np.linalg.slogdet(Xs)
+        return [
+            {"scalar": structure.det_from_log(float(s), float(l))} for s, l in zip(signs, logs)
+        ]
+    if op == "inv":
+        try:
+            ok = np.ones(k, dtype=bool)
+            invs = np.linalg.inv(Xs)
+        except np.linalg.LinAlgError:
+            ok = np.linalg.slogdet(Xs)[0] != 0
+            invs = np.zeros_like(Xs, dtype=float)
+            if ok.any():
+                invs[ok] = np.linalg.inv(Xs[ok])
+        ok &= matrix_ops.is_invertible(Xs, invs)
+        return [
+            {"resultMatrix": invs[i]} if ok[i] else {"error": "La matriz no tiene inversa: |A| = 0"}
+            for i in range(k)
+        ]
+    if op == "mul":
+        R = np.matmul(Xs, Ys)
+    elif op == "add":
+        R = Xs + Ys
+    elif op == "sub":
+        R = Xs - Ys
+    elif op == "pow":
+        R = np.linalg.matrix_power(Xs, Ys)
+    else:
+        R = np.swapaxes(Xs, 1, 2)
+    return [{"resultMatrix": R[i]} for i in range(k)]
+
+
+def run(jobs: List[Job]) -> List[Dict[str, Any]]:
+    """Ejecuta una lista de trabajos y devuelve sus resultados en el mismo orden.
+
+    Pasos:
+    1. Agrupa los trabajos por operación y formas (`_group_key`).
+    2. Grupos válidos con más de un trabajo: apila con `np.stack` y ejecuta una vez.
+    3. Grupos unitarios, exactos o con formas inválidas: ruta individual con `matrix_ops`.
+
+    Cada resultado es `{"resultMatrix": np.ndarray}`, `{"scalar": float}` o `{"error": str}`.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    groups: Dict[Any, List[int]] = {}
+    for idx, job in enumerate(jobs):
+        groups.setdefault(_group_key(job), []).append(idx)
+
+    for (op, xshape, yshape, dtype), idxs in groups.items():
+        if len(idxs) == 1 or not _stackable(op, xshape, yshape, dtype):
+            for i in idxs:
+                results[i] = _single(jobs[i])
+            continue
+        Xs = np.stack([jobs[i][1] for i in idxs])
+        Ys = np.stack([jobs[i][2] for i in idxs]) if op in BINARY_OPS else jobs[idxs[0]][2]
+        for i, res in zip(idxs, _run_stacked(op, Xs, Ys)):
+            results[i] = res
+    return results
@@ -0,0 +1,132 @@
+"""Aritmética racional exacta con eliminación libre de fracciones (Bareiss).
+
+Las matrices exactas son `np.ndarray(dtype=object)` con entradas `fractions.Fraction`
+(ver `utils.parsing.parse_matrix(..., exact=True)`). Suma, resta, producto y traspuesta
+funcionan directamente sobre arreglos `object`; este módulo aporta determinante,
+inversa y solución de sistemas sin error de redondeo.
+
+Método:
+1. Cada fila se multiplica por el mínimo común múltiplo de sus denominadores, de modo
+   que la matriz queda con enteros (el sistema es equivalente y
+   `|A| = |A_entera| / Π factores`).
+2. Eliminación de Bareiss: `a_ij ← (p·a_ij − a_ik·a_kj) / p_anterior`, con división
+   entera exacta. Cada entrada intermedia es un menor de la matriz original, así que
+   los enteros crecen de forma lineal (no exponencial como en Gauss con `Fraction`).
+3. Para inversa y sistemas se usa la variante Gauss-Jordan (Bareiss-Montante) sobre
+   `[A | B]`: al final la parte izquierda es `|A|·I` y la derecha `|A|·A^{-1}B`.
+
+Referencias:
+- E. H. Bareiss, "Sylvester's identity and multistep integer-preserving Gaussian elimination" (1968).
+- https://en.wikipedia.org/wiki/Bareiss_algorithm
+"""
+
+from fractions import Fraction
+from math import lcm
+from typing import List, Tuple
+import numpy as np
+
+
+def is_exact(A: np.ndarray) -> bool:
+    """Indica si `A` es una matriz exacta (arreglo `object` de `Fraction`/enteros)."""
+    return isinstance(A, np.ndarray) and A.dtype == object
+
+
+def _integer_rows(A: np.ndarray) -> Tuple[List[List[int]], int]:
+    """Escala cada fila por el mcm de sus denominadores.
+
+    Retorna: filas enteras y el producto de los factores de escala.
+    """
+    rows = []
+    scale = 1
+    for r in A.tolist():
+        fr = [Fraction(x) for x in r]
+        m = lcm(*(f.denominator for f in fr))
+        rows.append([f.numerator * (m // f.denominator) for f in fr])
+        scale *= m
+    return rows, scale
+
+
+def _pivot(M: List[List[int]], k: int) -> int:
+    """Índice de la primera fila `>= k` con entrada no nula en la columna `k` (o -1)."""
+    for i in range(k, len(M)):
+        if M[i][k] != 0:
+            return i
+    return -1
+
+
+def det(A: np.ndarray) -> Fraction:
+    """Determinante exacto por eliminación de Bareiss (sólo fase hacia adelante)."""
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca una matriz cuadrada para el determinante")
+    M, scale = _integer_rows(A)
+    n = len(M)
+    sign = 1
+    prev = 1
+    for k in range(n - 1):
+        p_row = _pivot(M, k)
+        if p_row < 0:
+            return Fraction(0)
+        if p_row != k:
+            M[k], M[p_row] = M[p_row], M[k]
+            sign = -sign
+        p = M[k][k]
+        rk = M[k]
+        for i in range(k + 1, n):
+            ri = M[i]
+            a = ri[k]
+            M[i] = ri[:k + 1] + [(p * ri[j] - a * rk[j]) // prev for j in range(k + 1, n)]
+        prev = p
+    return Fraction(sign * M[n - 1][n - 1], scale)
+
+
+def solve(A: np.ndarray, B: np.ndarray) -> Tuple[Fraction, np.ndarray]:
+    """Resuelve `AX = B` de forma exacta con Gauss-Jordan libre de fracciones.
+
+    Parámetros:
+    - `A`: matriz cuadrada exacta `(n, n)`.
+    - `B`: vector `(n,)` o matriz `(n, k)` exacta.
+
+    Retorna: `(|A|, X)`; si `|A| = 0`, `X` es `None`.
+    """
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca un sistema de ecuaciones cuadrado")
+    n = A.shape[0]
+    if B.shape[0] != n:
+        raise ValueError("El tamaño de b debe coincidir con A")
+    vector = B.ndim == 1
+    Bm = B.reshape(n, 1) if vector else B
+    M, scale = _integer_rows(np.concatenate([A, Bm], axis=1).astype(object))
+    sign = 1
+    prev = 1
+    for k in range(n):
+        p_row = _pivot(M, k)
+        if p_row < 0:
+            return Fraction(0), None
+        if p_row != k:
+            M[k], M[p_row] = M[p_row], M[k]
+            sign = -sign
+        p = M[k][k]
+        rk = M[k]
+        for i in range(n):
+            if i == k:
+                continue
+            ri = M[i]
+            a = ri[k]
+            M[i] = [(p * x - a * y) // prev for x, y in zip(ri, rk)]
+        prev = p
+    # `prev` es el determinante de la matriz entera permutada
+    dA = Fraction(sign * prev, scale)
+    X = np.array([[Fraction(x, prev) for x in row[n:]] for row in M], dtype=object)
+    return dA, (X[:, 0] if vector else X)
+
+
+def inv(A: np.ndarray) -> np.ndarray:
+    """Inversa exacta resolviendo `AX = I`; lanza `ValueError` si `|A| = 0`."""
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca una matriz cuadrada para la inversa")
+    n = A.shape[0]
+    identity = np.array([[Fraction(int(i == j)) for j in range(n)] for i in range(n)], dtype=object)
+    dA, X = solve(A, identity)
+    if X is None:
+        raise ValueError("La matriz no tiene inversa: |A| = 0")
+    return X
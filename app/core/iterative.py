@@ -0,0 +1,350 @@
+"""Solucionadores iterativos de `Ax = b` para sistemas grandes.
+
+La LU (densa o en banda) cuesta O(n³) u O(n·banda²) y guarda los factores; en sistemas
+grandes y dispersos (diferencias finitas en 2D con decenas de miles de incógnitas) es más
+barato iterar: cada paso sólo necesita un producto matriz-vector, O(nnz) con
+`sparse.CSRMatrix` o O(n²) con una matriz densa (BLAS).
+
+Métodos (`METHODS`):
+- `cg`: gradiente conjugado. Requiere `A` simétrica definida positiva; si detecta una
+  curvatura `pᵀAp ≤ 0` lanza `ValueError`.
+- `gmres`: GMRES con reinicio cada `restart` iteraciones (Arnoldi con Gram-Schmidt
+  reortogonalizado y rotaciones de Givens); sirve para matrices generales no singulares.
+- `jacobi`: `x ← x + D⁻¹ r`. Converge si `A` es diagonalmente dominante.
+- `gauss_seidel`: `(D + L) x_{k+1} = b − U x_k`. Suele converger en la mitad de
+  iteraciones que Jacobi. En CSR las filas se agrupan por niveles de dependencia y cada
+  nivel se actualiza con una operación vectorizada; si los niveles tienen pocas filas
+  (matrices en banda), la sustitución recorre las filas una a una.
+
+Precondicionadores (`PRECONDITIONERS`, sólo `cg` y `gmres`): `none` o `jacobi` (diagonal,
+`M = D`; en GMRES se aplica por la derecha, así el residuo reportado es el verdadero).
+
+El criterio de parada es `‖r_k‖ ≤ tol · ‖b‖`. `solve` retorna la solución, el número de
+iteraciones, el historial de residuos relativos `‖r_k‖ / ‖b‖` (incluye `k = 0`) y si
+convergió; no converger no es un error.
+
+Referencias:
+- Y. Saad, "Iterative Methods for Sparse Linear Systems", 2.ª ed. (2003), caps. 4, 6 y 9.
+- R. Barrett et al., "Templates for the Solution of Linear Systems" (1994):
+  https://netlib.org/templates/templates.pdf
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import sparse, structure
+
+METHODS = ("cg", "gmres", "jacobi", "gauss_seidel")
+PRECONDITIONERS = ("none", "jacobi")
+
+# Tolerancia relativa por defecto del residuo
+DEFAULT_TOL = 1e-8
+# Tope de iteraciones aceptado (también acota el historial de residuos)
+MAX_ITER = 100_000
+# Iteraciones por defecto de los métodos estacionarios (Jacobi, Gauss-Seidel)
+STATIONARY_MAX_ITER = 1000
+# Dimensión del subespacio de Krylov antes de reiniciar GMRES
+GMRES_RESTART = 50
+# Filas promedio por nivel desde las que Gauss-Seidel disperso resuelve por niveles; por
+# debajo (p. ej. tridiagonal: un nivel por fila) recorre las filas una a una
+GS_MIN_LEVEL_ROWS = 16
+
+Vector = np.ndarray
+MatVec = Callable[[Vector], Vector]
+
+
+def default_max_iter(method: str, n: int) -> int:
+    """Iteraciones por defecto: `n` para Krylov (CG converge en ≤ n en aritmética exacta)."""
+    if method in ("cg", "gmres"):
+        return min(MAX_ITER, max(n, 100))
+    return STATIONARY_MAX_ITER
+
+
+def estimate_flops(A: Any, method: str, max_iter: int, restart: int = GMRES_RESTART) -> float:
+    """Costo máximo (todas las iteraciones) para el planificador."""
+    nnz = A.nnz if sparse.is_sparse(A) else A.size
+    per_iter = 2.0 * nnz + 10.0 * A.shape[0]
+    if method == "gmres":
+        # Ortogonalización contra hasta `restart` vectores de la base (dos pasadas)
+        per_iter += 4.0 * min(restart, A.shape[0]) * A.shape[0]
+    return per_iter * max_iter
+
+
+def _matvec(A: Any) -> MatVec:
+    if sparse.is_sparse(A):
+        return lambda x: sparse.multiply(A, x)
+    return A.dot
+
+
+def _diagonal(A: Any) -> Vector:
+    """Diagonal de `A`; `ValueError` si tiene ceros (Jacobi/Gauss-Seidel dividen por ella)."""
+    if sparse.is_sparse(A):
+        d = np.zeros(A.shape[0])
+        rows = A.row_ids()
+        on_diag = rows == A.indices
+        d[rows[on_diag]] = A.data[on_diag]
+    else:
+        d = np.diag(A).astype(float)
+    if not d.all():
+        raise ValueError("La diagonal de A tiene ceros: Jacobi y Gauss-Seidel no son aplicables")
+    return d
+
+
+def _cg(Av: MatVec, b: Vector, x: Vector, tol: float, max_iter: int, Minv: MatVec) -> Tuple[Vector, List[float]]:
+    r = b - Av(x)
+    z = Minv(r)
+    p = z.copy()
+    rz = r @ z
+    res = [float(np.linalg.norm(r))]
+    while res[-1] > tol and len(res) <= max_iter:
+        Ap = Av(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("El gradiente conjugado requiere una matriz simétrica definida positiva")
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        res.append(float(np.linalg.norm(r)))
+        z = Minv(r)
+        rz, rz_old = r @ z, rz
+        p = z + (rz / rz_old) * p
+    return x, res
+
+
+def _gmres(
+    Av: MatVec, b: Vector, x: Vector, tol: float, max_iter: int, Minv: MatVec, restart: int,
+) -> Tuple[Vector, List[float]]:
+    n = b.size
+    m = min(restart, n)
+    r = b - Av(x)
+    beta = float(np.linalg.norm(r))
+    res = [beta]
+    while res[-1] > tol and len(res) <= max_iter:
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+        k = 0
+        for j in range(m):
+            w = Av(Minv(V[j]))
+            # Gram-Schmidt clásico en dos pasadas: productos matriciales en lugar de un bucle por vector
+            h = V[:j + 1] @ w
+            w -= h @ V[:j + 1]
+            h2 = V[:j + 1] @ w
+            w -= h2 @ V[:j + 1]
+            H[:j + 1, j] = h + h2
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+            # Rotaciones de Givens previas y la nueva, que anula H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            denom = math.hypot(H[j, j], H[j + 1, j])
+            if denom == 0.0:
+                raise ValueError("GMRES no puede continuar: la matriz A es singular")
+            cs[j], sn[j] = H[j, j] / denom, H[j + 1, j] / denom
+            H[j, j], H[j + 1, j] = denom, 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] *= cs[j]
+            k = j + 1
+            res.append(abs(float(g[k])))
+            if res[-1] <= tol or len(res) > max_iter:
+                break
+        y = structure.tri_solve(H[:k, :k], g[:k], lower=False)
+        x += Minv(y @ V[:k])
+        r = b - Av(x)
+        beta = float(np.linalg.norm(r))
+        # Al reiniciar se reemplaza la estimación de Givens por el residuo verdadero
+        res[-1] = beta
+    return x, res
+
+
+def _jacobi(Av: MatVec, A: Any, b: Vector, x: Vector, tol: float, max_iter: int) -> Tuple[Vector, List[float]]:
+    d = _diagonal(A)
+    r = b - Av(x)
+    res = [float(np.linalg.norm(r))]
+    while res[-1] > tol and len(res) <= max_iter:
+        x += r / d
+        r = b - Av(x)
+        res.append(float(np.linalg.norm(r)))
+    return x, res
+
+
+def _split(A: Any) -> Tuple[Any, Any]:
+    """`(D + L, U)`: parte triangular inferior (con diagonal) y estrictamente superior de `A`."""
+    if not sparse.is_sparse(A):
+        return np.tril(A), np.triu(A, 1)
+    rows, cols, data = A.to_coo()
+    low = cols <= rows
+    return (
+        sparse.CSRMatrix.from_coo(rows[low], cols[low], data[low], A.shape),
+        sparse.CSRMatrix.from_coo(rows[~low], cols[~low], data[~low], A.shape),
+    )
+
+
+def _levels(L: "sparse.CSRMatrix", d: Vector) -> Optional[List[Tuple[np.ndarray, "sparse.CSRMatrix", Vector]]]:
+    """Agrupa las filas de `L` (triangular inferior) por nivel de dependencia.
+
+    El nivel de la fila `i` es 1 + el mayor nivel de las columnas `j < i` de las que
+    depende; las filas de un mismo nivel no dependen entre sí y se resuelven juntas.
+    Retorna, por nivel, `(filas, parte estrictamente inferior de esas filas, diagonal)`;
+    `None` si hay en promedio menos de `GS_MIN_LEVEL_ROWS` filas por nivel.
+    """
+    n = L.shape[0]
+    ptr, idx = L.indptr.tolist(), L.indices.tolist()
+    level = [0] * n
+    for i in range(n):
+        lv = 0
+        for k in range(ptr[i], ptr[i + 1]):
+            j = idx[k]
+            if j < i and level[j] >= lv:
+                lv = level[j] + 1
+        level[i] = lv
+    counts = np.bincount(level)
+    if n < GS_MIN_LEVEL_ROWS * counts.size:
+        return None
+    level = np.array(level)
+    # Posición de cada fila dentro de su nivel (un solo arreglo para todos los niveles)
+    order = np.argsort(level, kind="stable")
+    starts = np.cumsum(counts) - counts
+    pos = np.empty(n, dtype=np.int64)
+    pos[order] = np.arange(n) - np.repeat(starts, counts)
+    rows, cols, data = L.to_coo()
+    strict = cols < rows
+    rows, cols, data = rows[strict], cols[strict], data[strict]
+    by_level = np.argsort(level[rows], kind="stable")
+    rows, cols, data = rows[by_level], cols[by_level], data[by_level]
+    cuts = np.searchsorted(level[rows], np.arange(1, counts.size))
+    groups = []
+    for members, r, c, v in zip(
+        np.split(order, starts[1:]), np.split(rows, cuts), np.split(cols, cuts), np.split(data, cuts),
+    ):
+        S = sparse.CSRMatrix.from_coo(pos[r], c, v, (members.size, n))
+        groups.append((members, S, d[members]))
+    return groups
+
+
+def _row_solver(L: "sparse.CSRMatrix", d: Vector) -> Callable[[Vector], Vector]:
+    """Sustitución hacia adelante fila a fila con `L` (triangular inferior, CSR).
+
+    Para matrices con casi un nivel por fila (tridiagonales, en banda), donde agrupar por
+    niveles no vectoriza nada: cada fila cuesta sus no nulos en aritmética de Python,
+    sin la sobrecarga de una llamada de NumPy por fila.
+    """
+    rows, cols, data = L.to_coo()
+    strict = cols < rows
+    S = sparse.CSRMatrix.from_coo(rows[strict], cols[strict], data[strict], L.shape)
+    ptr, idx, val, dl = S.indptr.tolist(), S.indices.tolist(), S.data.tolist(), d.tolist()
+
+    def lower_solve(rhs: Vector) -> Vector:
+        y = rhs.tolist()
+        for i, di in enumerate(dl):
+            acc = y[i]
+            for k in range(ptr[i], ptr[i + 1]):
+                acc -= val[k] * y[idx[k]]
+            y[i] = acc / di
+        return np.array(y)
+
+    return lower_solve
+
+
+def _gauss_seidel(Av: MatVec, A: Any, b: Vector, x: Vector, tol: float, max_iter: int) -> Tuple[Vector, List[float]]:
+    d = _diagonal(A)
+    L, U = _split(A)
+    if sparse.is_sparse(A):
+        groups = _levels(L, d)
+        if groups is None:
+            lower_solve = _row_solver(L, d)
+        else:
+            def lower_solve(rhs: Vector) -> Vector:
+                y = np.empty_like(rhs)
+                for members, S, dm in groups:
+                    y[members] = (rhs[members] - sparse.multiply(S, y)) / dm
+                return y
+
+        Uv = _matvec(U)
+    else:
+        lower_solve = structure.tri_solver(L, lower=True)
+        Uv = U.dot
+    Ux = Uv(x)
+    res = [float(np.linalg.norm(b - Av(x)))]
+    while res[-1] > tol and len(res) <= max_iter:
+        x = lower_solve(b - Ux)
+        # Como (D + L) x_{k+1} = b − U x_k, el residuo es U (x_k − x_{k+1}): no hace falta `A x`
+        Ux, Ux_old = Uv(x), Ux
+        res.append(float(np.linalg.norm(Ux_old - Ux)))
+    return x, res
+
+
+def solve(
+    A: Any,
+    b: Vector,
+    method: str = "cg",
+    tol: float = DEFAULT_TOL,
+    max_iter: Optional[int] = None,
+    preconditioner: str = "none",
+    restart: int = GMRES_RESTART,
+    x0: Optional[Vector] = None,
+) -> Dict[str, Any]:
+    """Resuelve `Ax = b` con el método iterativo `method` (ver el módulo).
+
+    Retorna `solution`, `iterations`, `residuals` (historial relativo), `residual` (último
+    residuo relativo), `converged` y `method`.
+
+    Errores (`ValueError`): parámetros inválidos, diagonal nula (Jacobi, Gauss-Seidel,
+    precondicionador `jacobi`), matriz no definida positiva (`cg`) o singular (`gmres`).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Método iterativo no válido: {method}")
+    if preconditioner not in PRECONDITIONERS:
+        raise ValueError(f"Precondicionador no válido: {preconditioner}")
+    if preconditioner != "none" and method not in ("cg", "gmres"):
+        raise ValueError("El precondicionador sólo aplica a 'cg' y 'gmres'")
+    n = A.shape[0]
+    if max_iter is None:
+        max_iter = default_max_iter(method, n)
+    if not 1 <= max_iter <= MAX_ITER:
+        raise ValueError(f"maxIter debe estar entre 1 y {MAX_ITER}")
+    if not 0 < tol < 1:
+        raise ValueError("tol debe estar entre 0 y 1")
+    if restart < 1:
+        raise ValueError("restart debe ser un entero positivo")
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    if x.shape != (n,):
+        raise ValueError("El tamaño de x0 debe coincidir con A")
+    bnorm = float(np.linalg.norm(b))
+    if bnorm == 0.0:
+        # b = 0: la solución es x = 0 sin iterar
+        return {
+            "solution": np.zeros(n), "iterations": 0, "residuals": np.zeros(1), "residual": 0.0,
+            "converged": True, "method": method,
+        }
+    Av = _matvec(A)
+    if preconditioner == "jacobi":
+        d = _diagonal(A)
+        Minv: MatVec = lambda v: v / d
+    else:
+        Minv = lambda v: v
+    abs_tol = tol * bnorm
+    if method == "cg":
+        x, res = _cg(Av, b, x, abs_tol, max_iter, Minv)
+    elif method == "gmres":
+        x, res = _gmres(Av, b, x, abs_tol, max_iter, Minv, restart)
+    elif method == "jacobi":
+        x, res = _jacobi(Av, A, b, x, abs_tol, max_iter)
+    else:
+        x, res = _gauss_seidel(Av, A, b, x, abs_tol, max_iter)
+    residuals = np.array(res) / bnorm
+    return {
+        "solution": x,
+        "iterations": len(res) - 1,
+        "residuals": residuals,
+        "residual": float(residuals[-1]),
+        "converged": bool(residuals[-1] <= tol),
+        "method": method,
+    }
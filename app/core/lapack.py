@@ -0,0 +1,82 @@
+"""Rutinas de LAPACK (LU `getrf`/`getrs`/`getri`/`gecon`, triangular `trtrs`) mediante `scipy.linalg.lapack`.
+
+`np.linalg` no expone la factorización LU: `slogdet`, `inv` y `solve` factorizan `A` por
+separado cada vez. Este módulo usa los envoltorios de LAPACK de SciPy (dependencia
+opcional), con firmas verificadas y consulta del espacio de trabajo, para factorizar una
+vez y reutilizar el resultado (ver `matrix_ops.DenseLU`), y la sustitución triangular
+por bloques de `trtrs` (ver `structure.tri_solve`).
+
+Se admiten `float64` (rutinas `d*`) y `float32` (`s*`). Sin SciPy, `available()` es
+`False`: `matrix_ops.DenseLU` recurre a `np.linalg` y `structure.tri_solve` a su propia
+sustitución por bloques.
+
+Referencias:
+- `scipy.linalg.lapack`: https://docs.scipy.org/doc/scipy/reference/linalg.lapack.html
+- LAPACK `dgetrf`/`dgetrs`/`dgetri`/`dgecon`/`dtrtrs`: https://netlib.org/lapack/explore-html/
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:  # dependencia opcional: sin ella `DenseLU` usa `np.linalg`
+    from scipy.linalg import lapack as _lapack
+except ImportError:  # pragma: no cover - depende del entorno
+    _lapack = None
+
+
+def available() -> bool:
+    """Indica si las rutinas LU de LAPACK (SciPy) están disponibles."""
+    return _lapack is not None
+
+
+def _float(A: np.ndarray) -> np.ndarray:
+    """`A` como `float32` si ya lo es; `float64` en otro caso."""
+    return np.asarray(A, dtype=np.float32 if A.dtype == np.float32 else np.float64)
+
+
+def getrf(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Factoriza `A = P L U` (sobre una copia).
+
+    Retorna `(lu, piv, info)`: `lu` guarda `L` (diagonal unitaria implícita) y `U`,
+    `piv` los intercambios de filas (base 0, como en SciPy) e `info > 0` indica un pivote
+    exactamente nulo en la posición `info`.
+    """
+    A = _float(A)
+    (getrf_,) = _lapack.get_lapack_funcs(("getrf",), (A,))
+    lu, piv, info = getrf_(A, overwrite_a=False)
+    return lu, piv, int(info)
+
+
+def getrs(lu: np.ndarray, piv: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Resuelve `A X = B` con la factorización de `getrf` (`B` vector `(n,)` o matriz `(n, k)`)."""
+    (getrs_,) = _lapack.get_lapack_funcs(("getrs",), (lu,))
+    X, _ = getrs_(lu, piv, np.asarray(B, dtype=lu.dtype), overwrite_b=False)
+    return X
+
+
+def getri(lu: np.ndarray, piv: np.ndarray) -> np.ndarray:
+    """`A^{-1}` a partir de la factorización de `getrf`, con el espacio de trabajo que indica LAPACK."""
+    getri_, getri_lwork = _lapack.get_lapack_funcs(("getri", "getri_lwork"), (lu,))
+    work, _ = getri_lwork(lu.shape[0])
+    # `lwork` llega como real; se redondea hacia arriba para no quedar por debajo en `float32`
+    lwork = max(1, int(np.ceil(np.real(work))))
+    inv, _ = getri_(lu, piv, lwork=lwork, overwrite_lu=False)
+    return inv
+
+
+def gecon(lu: np.ndarray, anorm: float) -> float:
+    """Estimación del recíproco del número de condición en norma 1, dado `anorm = ‖A‖₁` (O(n²))."""
+    (gecon_,) = _lapack.get_lapack_funcs(("gecon",), (lu,))
+    rcond, _ = gecon_(lu, anorm, norm="1")
+    return float(rcond)
+
+
+def trtrs(T: np.ndarray, B: np.ndarray, lower: bool, transpose: bool = False) -> np.ndarray:
+    """Resuelve `T X = B` (o `Tᵀ X = B`) con `T` triangular (diagonal no nula; `B` vector o matriz)."""
+    (trtrs_,) = _lapack.get_lapack_funcs(("trtrs",), (T, B))
+    if T.flags.c_contiguous and not T.flags.f_contiguous:
+        # `Tᵀ` ya está en orden de Fortran: se pasa sin copiar `T` y se invierte `trans`
+        T, lower, transpose = T.T, not lower, not transpose
+    X, _ = trtrs_(T, B, lower=int(lower), trans=int(transpose), overwrite_b=False)
+    return X
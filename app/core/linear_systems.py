@@ -1,17 +1,25 @@
-"""Resolución de sistemas lineales: Regla de Cramer y método de la inversa.
+"""Resolución de sistemas lineales: Regla de Cramer, método de la inversa, LU con varios lados
+derechos y métodos iterativos para sistemas grandes (`core.iterative`).
 
 Utiliza funciones de NumPy para álgebra lineal:
-- `np.linalg.det(A)`: determinante.
-- `np.linalg.inv(A)`: inversa.
+- `matrix_ops.DenseLU`: factorización LU de LAPACK reutilizable para `|A|`, soluciones e
+  inversa (Cramer, inversa, varios lados derechos y flujos).
 - `A.dot(b)`: multiplicación matriz-vector.
+
+Las matrices exactas (`dtype=object` con `Fraction`) se resuelven con `core.exact`
+(eliminación de Bareiss) y el resultado conserva valores racionales. Las matrices
+dispersas (`sparse.CSRMatrix`) se factorizan en banda con `sparse.BandLU`.
+
+Antes de la LU general se detecta la estructura de `A` (`core.structure`): diagonal,
+triangular, tridiagonal o simétrica definida positiva usan su algoritmo especializado.
+Cada resultado informa la vía usada en `method` (`diagonal`, `triangular`, `thomas`,
+`cholesky`, `lu`, `bareiss` o `band_lu`).
 """
 
 import numpy as np
-from typing import Dict, Any
-
-# Umbral para tratar determinantes muy pequeños como cero (evita inestabilidad)
-EPS = 1e-10
+from typing import Dict, Any, Iterable, Iterator, Optional
 
+from . import exact, iterative, matrix_ops, sparse, structure
 
 def validate_square(A: np.ndarray):
     """Verifica que `A` sea una matriz cuadrada.
@@ -30,58 +38,208 @@ def _replace_column(A: np.ndarray, b: np.ndarray, col: int) -> np.ndarray:
     - `b`: vector `(n,)`.
     - `col`: índice de columna a reemplazar.
     """
-    M = A.copy()
+    M = sparse.to_dense(A).copy()
     M[:, col] = b
     return M
 
 
-def cramer(A: np.ndarray, b: np.ndarray) -> Dict[str, Any]:
-    """Resuelve `Ax = b` por Regla de Cramer.
+def cramer_matrices(A: np.ndarray, b: np.ndarray) -> Iterator:
+    """Generador perezoso de pares `(f"A{k+1}", A_k)` con la columna `k` reemplazada por `b`."""
+    return ((f"A{k+1}", _replace_column(A, b, k)) for k in range(A.shape[0]))
+
+
+def _solve_once(A: np.ndarray, B: np.ndarray):
+    """Calcula `(|A|, X, método)` con una sola factorización de `A`.
+
+    Vías: Bareiss exacto, LU en banda (dispersa), la especializada según `structure.detect`
+    o, si no aplica, LU general (`matrix_ops.DenseLU`). `X` es `None` si `A` es singular
+    (pivote nulo, o condición `rcond < matrix_ops.RCOND_MIN`, en la LU general y en las vías
+    por estructura; `|A| = 0` exacto).
+    """
+    if exact.is_exact(A):
+        return exact.solve(A, B) + ("bareiss",)
+    if sparse.is_sparse(A):
+        return sparse.solve(A, B) + ("band_lu",)
+    solved = structure.solve(A, B, structure.detect(A))
+    if solved is None:
+        lu = matrix_ops.DenseLU(A)
+        solved = (lu.det, None if lu.singular else lu.solve(B), "lu")
+    return solved
+
+
+def _identity_like(A: np.ndarray) -> np.ndarray:
+    """Identidad del mismo tipo que `A` (enteros exactos para matrices `object`)."""
+    n = A.shape[0]
+    if sparse.is_sparse(A):
+        sparse.check_dense_size(A.shape)
+    return np.eye(n, dtype=int).astype(object) if exact.is_exact(A) else np.eye(n)
+
+
+def cramer(A: np.ndarray, b: np.ndarray, include_matrices: bool = True, as_arrays: bool = False) -> Dict[str, Any]:
+    """Resuelve `Ax = b` por Regla de Cramer con una única factorización de `A`.
 
     Pasos:
     1. Valida que `A` sea cuadrada y que `b` tenga tamaño compatible.
-    2. Calcula `|A|`. Si `|A| ≈ 0`, retorna error (no hay solución única).
-    3. Para cada columna `k`, crea `A_k` reemplazando la columna por `b`, calcula `|A_k|` y `x_k = |A_k| / |A|`.
+    2. Factoriza `PA = LU` una sola vez y obtiene `|A| = sign · exp(Σ log|u_ii|)`.
+       Si `A` es singular (ver `matrix_ops.DenseLU`), retorna error (no hay solución única).
+    3. Resuelve `x` con la misma factorización y deriva cada `|A_k| = |A| · x_k`
+       (identidad de Cramer `x_k = |A_k| / |A|`), sin construir ni factorizar `A_k`.
+
+    Costo: O(n³) en lugar de O(n⁴) de calcular `n+1` determinantes. En modo exacto la
+    factorización es la eliminación de Bareiss y `detA`, `dets` y `solution` son `Fraction`.
 
-    Retorna: diccionario con `detA`, lista `dets`, dict `matrices` (A_k en listas) y `solution`.
+    Parámetros:
+    - `include_matrices`: si es `False`, omite las matrices `A_k` de la respuesta
+      (son `n` copias de `A`, costosas para sistemas grandes).
+    - `as_arrays`: si es `True`, deja `dets`/`solution` como `np.ndarray` y entrega `matrices`
+      como iterador perezoso de pares `(nombre, A_k)` (para serialización en streaming).
+
+    Retorna: diccionario con `detA`, lista `dets`, dict `matrices` (A_k en listas), `solution`
+    y `method` (vía de solución, ver el módulo).
     """
     validate_square(A)
     n = A.shape[0]
     if b.shape[0] != n:
         raise ValueError("El tamaño de b debe coincidir con A")
-    detA = float(np.linalg.det(A))
-    if abs(detA) < EPS:
-        return {"error": "El sistema de ecuaciones no tiene solución |A| = 0", "detA": detA}
-    dets = []
-    matrices = {}
-    sol = np.zeros((n,), dtype=float)
-    for k in range(n):
-        # Construye A_k y su determinante
-        Ak = _replace_column(A, b, k)
-        matrices[f"A{k+1}"] = Ak.tolist()
-        detAk = float(np.linalg.det(Ak))
-        dets.append(detAk)
-        sol[k] = detAk / detA
-    return {"detA": detA, "dets": dets, "matrices": matrices, "solution": sol.tolist()}
-
-
-def inverse_solve(A: np.ndarray, b: np.ndarray) -> Dict[str, Any]:
+    detA, sol, method = _solve_once(A, b)
+    if sol is None:
+        return {"error": "El sistema de ecuaciones no tiene solución |A| = 0", "detA": detA, "method": method}
+    # `detA` es `None` sólo si `|A|` desborda `float` (matrices grandes)
+    dets = detA * sol if detA is not None else None
+    result: Dict[str, Any] = {"detA": detA, "dets": dets if as_arrays or dets is None else dets.tolist()}
+    if include_matrices:
+        # Construye A_k sólo para presentación
+        if as_arrays:
+            result["matrices"] = cramer_matrices(A, b)
+        else:
+            result["matrices"] = {f"A{k+1}": _replace_column(A, b, k).tolist() for k in range(n)}
+    result["solution"] = sol if as_arrays else sol.tolist()
+    result["method"] = method
+    return result
+
+
+def inverse_solve(A: np.ndarray, b: np.ndarray, as_arrays: bool = False) -> Dict[str, Any]:
     """Resuelve `Ax = b` usando `A^{-1}`.
 
     Pasos:
     1. Valida cuadratura y compatibilidad de dimensiones.
-    2. Calcula `detA` y verifica que no sea cero (umbral `EPS`).
-    3. Calcula la inversa con `np.linalg.inv(A)` y la solución `x = A^{-1} b` usando `dot`.
-
-    Retorna: `detA`, `Ainv` (como listas) y `solution`.
+    2. Factoriza `A` una sola vez (`matrix_ops.DenseLU`) y obtiene de ella `detA` (`None` si
+       desborda `float`), la condición y `A^{-1}`; la solución es `x = A^{-1} b` usando `dot`.
+       `A` es singular si la condición estimada es `rcond < matrix_ops.RCOND_MIN`.
+       Si `A` tiene estructura (`structure.detect`), `A^{-1}` se obtiene resolviendo contra
+       la identidad con la vía especializada. En modo exacto, `|A|` y `A^{-1}` salen de
+       una eliminación de Bareiss sobre `[A | I]`.
+
+    Retorna: `detA`, `Ainv` (como listas), `solution` y `method`; con `as_arrays=True`, como `np.ndarray`.
     """
     validate_square(A)
     n = A.shape[0]
     if b.shape[0] != n:
         raise ValueError("El tamaño de b debe coincidir con A")
-    detA = float(np.linalg.det(A))
-    if abs(detA) < EPS:
-        return {"error": "El sistema de ecuaciones no tiene solución |A| = 0 y la matriz A no tiene inversa", "detA": detA}
-    Ainv = np.linalg.inv(A)
+    if exact.is_exact(A) or sparse.is_sparse(A):
+        detA, Ainv, method = _solve_once(A, _identity_like(A))
+    else:
+        kind = structure.detect(A)
+        solved = structure.solve(A, np.eye(n), kind) if kind != "general" else None
+        if solved is not None:
+            detA, Ainv, method = solved
+        else:
+            lu = matrix_ops.DenseLU(A)
+            detA, Ainv, method = lu.det, None if lu.singular else lu.inverse(), "lu"
+    if Ainv is None:
+        return {
+            "error": "El sistema de ecuaciones no tiene solución |A| = 0 y la matriz A no tiene inversa",
+            "detA": detA, "method": method,
+        }
     x = Ainv.dot(b)
-    return {"detA": detA, "Ainv": Ainv.tolist(), "solution": x.tolist()}
\ No newline at end of file
+    if as_arrays:
+        return {"detA": detA, "Ainv": Ainv, "solution": x, "method": method}
+    return {"detA": detA, "Ainv": Ainv.tolist(), "solution": x.tolist(), "method": method}
+
+
+def multi_solve(A: np.ndarray, B: np.ndarray, include_inverse: bool = False, as_arrays: bool = False) -> Dict[str, Any]:
+    """Resuelve `AX = B` para varios lados derechos con una sola factorización LU.
+
+    Pasos:
+    1. Valida cuadratura y que `B` tenga `n` filas (cada columna es un vector `b`).
+    2. Factoriza `PA = LU` una vez (Bareiss en modo exacto) y verifica `|A| != 0`.
+    3. Sustitución hacia adelante/atrás (por bloques) de todas las columnas.
+    4. Sólo si `include_inverse`, resuelve también contra la identidad (`[B | I]`) para `A^{-1}`.
+
+    Retorna: `detA`, `solution` (matriz `(n, k)`, columna `j` resuelve `b_j`), `method` y opcionalmente `Ainv`;
+    con `as_arrays=True` las matrices se devuelven como `np.ndarray`.
+    """
+    validate_square(A)
+    n = A.shape[0]
+    if B.ndim == 1:
+        B = B[:, None]
+    if B.shape[0] != n:
+        raise ValueError("El número de filas de B debe coincidir con A")
+    k = B.shape[1]
+    rhs = np.concatenate([B, _identity_like(A)], axis=1) if include_inverse else B
+    detA, X, method = _solve_once(A, rhs)
+    if X is None:
+        return {"error": "El sistema de ecuaciones no tiene solución |A| = 0", "detA": detA, "method": method}
+    result: Dict[str, Any] = {"detA": detA, "solution": X[:, :k] if as_arrays else X[:, :k].tolist()}
+    if include_inverse:
+        result["Ainv"] = X[:, k:] if as_arrays else X[:, k:].tolist()
+    result["method"] = method
+    return result
+
+
+def solve_stream(A: np.ndarray, bs: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+    """Generador que resuelve `Ax = b` para cada `b` de un flujo, factorizando `A` una vez.
+
+    La factorización se calcula al pedir la primera solución; lanza `ValueError` si
+    `A` no es cuadrada o es singular. En modo exacto se calcula `A^{-1}` racional una vez
+    y cada solución es `A^{-1} b`.
+    """
+    validate_square(A)
+    if exact.is_exact(A):
+        _, Ainv = exact.solve(A, _identity_like(A))
+        if Ainv is None:
+            raise ValueError("El sistema de ecuaciones no tiene solución |A| = 0")
+        for b in bs:
+            yield Ainv.dot(b)
+        return
+    if sparse.is_sparse(A):
+        lu = sparse.BandLU(A)
+        for b in bs:
+            yield lu.solve(b)
+        return
+    lu = matrix_ops.DenseLU(A)
+    if lu.singular:
+        raise ValueError("El sistema de ecuaciones no tiene solución |A| = 0")
+    for b in bs:
+        yield lu.solve(b)
+
+
+def iterative_solve(
+    A: np.ndarray,
+    b: np.ndarray,
+    method: str = "cg",
+    tol: float = iterative.DEFAULT_TOL,
+    max_iter: Optional[int] = None,
+    preconditioner: str = "none",
+    restart: int = iterative.GMRES_RESTART,
+    x0: Optional[np.ndarray] = None,
+    as_arrays: bool = False,
+) -> Dict[str, Any]:
+    """Resuelve `Ax = b` con un método iterativo (`cg`, `gmres`, `jacobi`, `gauss_seidel`).
+
+    No factoriza `A`: cada iteración es un producto matriz-vector, por lo que sirve para
+    sistemas dispersos de decenas de miles de incógnitas. Ver `iterative.solve`.
+
+    Retorna: `solution`, `iterations`, `residuals` (historial `‖r_k‖/‖b‖`), `residual`,
+    `converged` y `method`; con `as_arrays=True`, vectores como `np.ndarray`.
+    """
+    validate_square(A)
+    if exact.is_exact(A):
+        raise ValueError("Los métodos iterativos no admiten aritmética exacta")
+    if b.shape[0] != A.shape[0]:
+        raise ValueError("El tamaño de b debe coincidir con A")
+    result = iterative.solve(A, b, method, tol, max_iter, preconditioner, restart, x0)
+    if not as_arrays:
+        result["solution"] = result["solution"].tolist()
+        result["residuals"] = result["residuals"].tolist()
+    return result
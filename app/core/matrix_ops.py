@@ -3,15 +3,43 @@
 Incluye suma, resta, multiplicación, determinante, inversa y traspuesta.
 Se utilizan las siguientes funciones de NumPy:
 - `ndarray.dot(B)`: multiplicación matricial.
-- `np.linalg.det(A)`: determinante de una matriz cuadrada.
-- `np.linalg.inv(A)`: inversa de una matriz cuadrada no singular.
+- `DenseLU`: factorización LU de LAPACK (`core.lapack`, vía SciPy) para determinante e inversa.
 - `A.T`: traspuesta del arreglo.
+
+Las matrices exactas (`dtype=object` con `Fraction`) se delegan en `core.exact`
+(eliminación de Bareiss) para determinante e inversa; suma, resta, producto y
+traspuesta operan directamente sobre ellas.
+
+Las matrices dispersas (`sparse.CSRMatrix`) se delegan en `core.sparse` (CSR y LU en banda).
+
+`DenseLU` factoriza una sola vez con `getrf` de LAPACK (SciPy) y reutiliza esa factorización
+para `|A|` (vía `log|A|`), soluciones (`getrs`), `A^{-1}` (`getri`) y una estimación de la
+condición (`gecon`); `det`, `inv` y `linear_systems` la comparten. La singularidad se
+decide por el recíproco del número de condición (`RCOND_MIN`), no por `|A| ≈ 0`, que
+depende de la escala de `A`.
+
+Para productos de varias matrices, `multiply_chain` elige la parentización óptima con
+programación dinámica (cadena de matrices) y `power` calcula `A^k` por cuadrados
+sucesivos (O(log k) productos) o por diagonalización cuando la estructura lo permite.
 """
 
+from typing import List, Optional, Sequence, Tuple
+
 import numpy as np
 
-# Umbral numérico para considerar un determinante como cero (estabilidad)
-EPS = 1e-10
+from . import exact, lapack, sparse, structure
+
+# Desde este exponente, `power` usa `np.linalg.eigh` para matrices simétricas: la
+# descomposición cuesta lo que ~5 productos y no depende de `k`
+POW_EIGH_MIN_EXP = 32
+
+# Exponentes máximos de `power` (en modo exacto los numeradores crecen con `k`)
+POW_MAX_EXP = 10 ** 9
+EXACT_POW_MAX_EXP = 256
+
+# Recíproco mínimo del número de condición (norma 1) para tratar una matriz como
+# invertible (compartido con las vías por estructura, ver `structure.RCOND_MIN`)
+RCOND_MIN = structure.RCOND_MIN
 
 
 def _shape(A: np.ndarray):
@@ -25,13 +53,26 @@ def _shape(A: np.ndarray):
     return tuple(A.shape)
 
 
-def add(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+def _writable_result(A: np.ndarray, B: np.ndarray) -> bool:
+    """Indica si `A` puede recibir `A ∘ B` en su lugar: arreglo denso escribible del tipo del resultado."""
+    return (
+        isinstance(A, np.ndarray)
+        and isinstance(B, np.ndarray)
+        and A.flags.writeable
+        and A.dtype == np.result_type(A, B)
+    )
+
+
+def add(A: np.ndarray, B: np.ndarray, inplace: bool = False) -> np.ndarray:
     """Suma elemento a elemento de matrices del mismo tamaño.
 
     Parámetros:
     - `A`, `B`: matrices con igual forma.
+    - `inplace`: escribir el resultado sobre `A` (`np.add(A, B, out=A)`) en lugar de
+      reservar otra matriz. Sólo se aplica si `A` es escribible y ya tiene el tipo del
+      resultado (una matriz guardada o un búfer binario, de sólo lectura, nunca se modifica).
 
-    Retorna: `A + B` como `np.ndarray`.
+    Retorna: `A + B` como `np.ndarray` (el propio `A` si se operó en su lugar).
 
     Ejemplo:
     >>> add(np.array([[1,2],[3,4]]), np.array([[5,6],[7,8]]))
@@ -40,19 +81,28 @@ def add(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     """
     if _shape(A) != _shape(B):
         raise ValueError("Para sumar, las matrices deben tener el mismo tamaño")
+    if sparse.is_sparse(A) or sparse.is_sparse(B):
+        return sparse.add(A, B)
+    if inplace and _writable_result(A, B):
+        return np.add(A, B, out=A)
     return A + B
 
 
-def subtract(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+def subtract(A: np.ndarray, B: np.ndarray, inplace: bool = False) -> np.ndarray:
     """Resta elemento a elemento de matrices del mismo tamaño.
 
     Parámetros:
     - `A`, `B`: matrices con igual forma.
+    - `inplace`: escribir el resultado sobre `A` (ver `add`).
 
     Retorna: `A - B` como `np.ndarray`.
     """
     if _shape(A) != _shape(B):
         raise ValueError("Para restar, las matrices deben tener el mismo tamaño")
+    if sparse.is_sparse(A) or sparse.is_sparse(B):
+        return sparse.subtract(A, B)
+    if inplace and _writable_result(A, B):
+        return np.subtract(A, B, out=A)
     return A - B
 
 
@@ -71,40 +121,167 @@ def multiply(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     """
     if A.shape[1] != B.shape[0]:
         raise ValueError("Para multiplicar, las columnas de A deben igualar las filas de B")
+    if sparse.is_sparse(A) or sparse.is_sparse(B):
+        return sparse.multiply(A, B)
     return A.dot(B)
 
 
-def det(A: np.ndarray) -> float:
+def chain_order(shapes: Sequence[Tuple[int, int]]) -> Tuple[int, List[List[int]]]:
+    """Parentización óptima de un producto de matrices (programación dinámica).
+
+    `cost[i][j]` es el mínimo de multiplicaciones escalares para `A_i ⋯ A_j`:
+    `min_s cost[i][s] + cost[s+1][j] + p_i · p_{s+1} · p_{j+1}`, O(k³) en el número de
+    matrices `k`.
+
+    Retorna `(costo mínimo, split)`, donde `split[i][j]` es el índice `s` del corte óptimo.
+    """
+    k = len(shapes)
+    dims = [shapes[0][0]] + [s[1] for s in shapes]
+    cost = [[0] * k for _ in range(k)]
+    split = [[0] * k for _ in range(k)]
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            cost[i][j], split[i][j] = min(
+                (cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1], s) for s in range(i, j)
+            )
+    return cost[0][k - 1], split
+
+
+def multiply_chain(mats: Sequence[np.ndarray], return_order: bool = False):
+    """Producto `A_1 A_2 ⋯ A_k` en el orden de menor costo (ver `chain_order`).
+
+    Multiplicar de izquierda a derecha puede costar órdenes de magnitud más: con formas
+    `(10×1000)(1000×10)(10×1000)` la parentización `A_1 (A_2 A_3)` hace 100 veces más
+    operaciones que `(A_1 A_2) A_3`.
+
+    Retorna el producto; con `return_order=True`, `(producto, info)` donde `info` tiene
+    `order` (p. ej. `"((A1·A2)·A3)"`), `cost` (multiplicaciones escalares del orden
+    elegido) y `naiveCost` (de izquierda a derecha).
+    """
+    if not mats:
+        raise ValueError("Debe proporcionar al menos una matriz")
+    for i in range(len(mats) - 1):
+        if mats[i].shape[1] != mats[i + 1].shape[0]:
+            raise ValueError(f"Para multiplicar, las columnas de A{i + 1} deben igualar las filas de A{i + 2}")
+    shapes = [M.shape for M in mats]
+    cost, split = chain_order(shapes)
+
+    def product(i: int, j: int):
+        if i == j:
+            return mats[i], f"A{i + 1}"
+        s = split[i][j]
+        (L, left), (R, right) = product(i, s), product(s + 1, j)
+        return multiply(L, R), f"({left}·{right})"
+
+    result, order = product(0, len(mats) - 1)
+    if not return_order:
+        return result
+    rows = shapes[0][0]
+    naive = sum(rows * shapes[i][0] * shapes[i][1] for i in range(1, len(shapes)))
+    return result, {"order": order, "cost": cost, "naiveCost": naive}
+
+
+def _identity(A: np.ndarray) -> np.ndarray:
+    """Identidad del tamaño de `A` (enteros exactos para matrices `object`)."""
+    n = A.shape[0]
+    return np.eye(n, dtype=int).astype(object) if exact.is_exact(A) else np.eye(n)
+
+
+def power(A: np.ndarray, k: int, return_method: bool = False):
+    """Potencia entera `A^k` de una matriz cuadrada.
+
+    Vías:
+    - `diagonal`: eleva la diagonal elemento a elemento.
+    - `eigh`: simétrica (no exacta) con `|k| >= POW_EIGH_MIN_EXP`: `A = Q Λ Qᵀ` y
+      `A^k = Q Λ^k Qᵀ` (`Q` ortogonal, estable numéricamente).
+    - `squaring`: cuadrados sucesivos, `⌊log₂ k⌋ + popcount(k) − 1` productos en lugar de `k − 1`.
+
+    `k = 0` da la identidad; `k < 0` eleva `A^{-1}` (`ValueError` si `A` es singular).
+
+    Retorna `A^k`; con `return_method=True`, el par `(A^k, método)`.
+    """
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca una matriz cuadrada para la potencia")
+    limit = EXACT_POW_MAX_EXP if exact.is_exact(A) else POW_MAX_EXP
+    if abs(k) > limit:
+        raise ValueError(f"El exponente debe estar entre -{limit} y {limit}")
+    if k < 0:
+        A, k = inv(A), -k
+    dense = not sparse.is_sparse(A) and not exact.is_exact(A)
+    kind = structure.detect(A) if dense else "general"
+    if k == 0:
+        P, method = _identity(A), "squaring"
+    elif kind == "diagonal":
+        P, method = np.diag(np.diag(A) ** k), "diagonal"
+    elif dense and k >= POW_EIGH_MIN_EXP and np.array_equal(A, A.T):
+        w, Q = np.linalg.eigh(A)
+        P, method = (Q * w ** k) @ Q.T, "eigh"
+    else:
+        P, base, method = None, A, "squaring"
+        while k:
+            if k & 1:
+                P = base if P is None else multiply(P, base)
+            k >>= 1
+            if k:
+                base = multiply(base, base)
+    return (P, method) if return_method else P
+
+
+def det(A: np.ndarray) -> Optional[float]:
     """Calcula el determinante de una matriz cuadrada.
 
-    Usa `np.linalg.det(A)`.
+    Usa `DenseLU` (una LU `getrf` que acumula `log|u_ii|`): el producto de los pivotes
+    desborda `float` para `n` grande aunque cada pivote sea moderado. Para matrices
+    exactas, `exact.det` (Bareiss).
 
     Parámetros:
     - `A`: matriz cuadrada `(n, n)`.
 
-    Retorna: `float` con el determinante.
+    Retorna: `float` con el determinante (`Fraction` en modo exacto; `None` si no es
+    representable en `float`, como en `sparse.det`).
     """
     if A.shape[0] != A.shape[1]:
         raise ValueError("Introduzca una matriz cuadrada para el determinante")
-    return float(np.linalg.det(A))
+    if exact.is_exact(A):
+        return exact.det(A)
+    if sparse.is_sparse(A):
+        return sparse.det(A)
+    return DenseLU(A).det
 
 
-def inv(A: np.ndarray) -> np.ndarray:
+def inv(A: np.ndarray, return_method: bool = False):
     """Calcula la inversa de `A` si es cuadrada y no singular.
 
     Pasos:
     1. Verificación de cuadratura.
-    2. Cálculo de `|A|` con `np.linalg.det` y comparación contra `EPS`.
-    3. `np.linalg.inv(A)` si `|A|` es distinto de cero.
+    2. Detección de estructura (`structure.detect`): diagonal, triangular, tridiagonal o
+       simétrica definida positiva se invierten resolviendo contra `I` con su vía
+       especializada (división, sustitución, Thomas, Cholesky).
+    3. En otro caso, `DenseLU(A).inverse()`: una sola factorización LU (`getrf` + `getri`),
+       singular si la condición estimada es `rcond < RCOND_MIN`.
+    4. Las vías por estructura aplican el mismo criterio (`structure.solve`). Ninguna
+       depende de la escala de `A` ni desborda como `|A|`.
 
-    Retorna: `np.ndarray` con `A^{-1}`.
+    En modo exacto usa `exact.inv` (Gauss-Jordan libre de fracciones, singular si `|A| = 0`).
+
+    Retorna: `np.ndarray` con `A^{-1}`; con `return_method=True`, el par `(A^{-1}, método)`.
     """
     if A.shape[0] != A.shape[1]:
         raise ValueError("Introduzca una matriz cuadrada para la inversa")
-    d = np.linalg.det(A)
-    if abs(d) < EPS:
-        raise ValueError("La matriz no tiene inversa: |A| = 0")
-    return np.linalg.inv(A)
+    if exact.is_exact(A):
+        Ainv, method = exact.inv(A), "bareiss"
+    elif sparse.is_sparse(A):
+        Ainv, method = sparse.inv(A), "band_lu"
+    else:
+        solved = structure.solve(A, np.eye(A.shape[0]), structure.detect(A))
+        if solved is None:
+            Ainv, method = DenseLU(A).inverse(), "lu"
+        else:
+            _, Ainv, method = solved
+            if Ainv is None:
+                raise ValueError("La matriz no tiene inversa: |A| = 0")
+    return (Ainv, method) if return_method else Ainv
 
 
 def transpose(A: np.ndarray) -> np.ndarray:
@@ -112,4 +289,116 @@ def transpose(A: np.ndarray) -> np.ndarray:
 
     Implementación: acceso a atributo `A.T` (vista traspuesta de NumPy).
     """
-    return A.T
\ No newline at end of file
+    if sparse.is_sparse(A):
+        return sparse.transpose(A)
+    return A.T
+
+
+def _norm1(A: np.ndarray) -> np.ndarray:
+    """Norma 1 (máxima suma de columna) de una matriz o de cada matriz de un lote `(k, n, n)`."""
+    return np.abs(A).sum(axis=-2).max(axis=-1)
+
+
+def inverse_rcond(A: np.ndarray, Ainv: np.ndarray) -> np.ndarray:
+    """Recíproco del número de condición `1 / (‖A‖₁ ‖A^{-1}‖₁)` dada la inversa (O(n²)).
+
+    A diferencia de `|A| ≈ 0`, no depende de la escala: `10⁻⁶ I` es perfectamente
+    invertible aunque `|A| = 10⁻⁶ⁿ`. Admite lotes `(k, n, n)`; `NaN`/`inf` en `A^{-1}`
+    dan `0`.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        r = 1.0 / (_norm1(A) * _norm1(Ainv))
+    return np.where(np.isfinite(r), r, 0.0)
+
+
+def is_invertible(A: np.ndarray, Ainv: np.ndarray) -> np.ndarray:
+    """`inverse_rcond(A, A^{-1}) >= RCOND_MIN`, con el épsilon de `float32` si `A^{-1}` es `float32`."""
+    tol = max(RCOND_MIN, float(np.finfo(Ainv.dtype).eps)) if Ainv.dtype.kind == "f" else RCOND_MIN
+    return inverse_rcond(A, Ainv) >= tol
+
+
+class DenseLU:
+    """Factorización `A = P L U` densa (`getrf` de LAPACK), calculada una vez y reutilizada
+    para `|A|`, las soluciones, `A^{-1}` y la condición de `A` (contraparte densa de
+    `sparse.BandLU`).
+
+    Atributos:
+    - `sign`, `logabsdet`: `|A| = sign · exp(logabsdet)` a partir de los pivotes; no desborda
+      aunque `|A|` no quepa en `float` (`sign = 0` si algún pivote es cero).
+    - `det`: determinante (`0.0` si es singular; `None` si no es representable en `float`).
+    - `rcond`: estimación del recíproco del número de condición en norma 1 (`gecon`, O(n²)).
+    - `singular`: `True` si `rcond < RCOND_MIN` (con el épsilon de `float32` si `A` es
+      `float32`); no depende de la escala de `A`.
+
+    Sin SciPy (`core.lapack`) se recurre a `np.linalg`, con una sola factorización por
+    resultado pedido: `slogdet` para `|A|` y, para soluciones, inversa y condición, `inv`
+    (la condición es exacta, a partir de la inversa). Ambas se calculan al consultarlas.
+    """
+
+    def __init__(self, A: np.ndarray):
+        self.n = A.shape[0]
+        self.dtype = np.float32 if A.dtype == np.float32 else np.float64
+        self._A = A
+        self._lu: Optional[np.ndarray] = None
+        self._inv: Optional[np.ndarray] = None
+        self._slogdet: Optional[Tuple[float, float]] = None
+        self._rcond: Optional[float] = None
+        if lapack.available():
+            self._lu, self._piv, info = lapack.getrf(A)
+            if info == 0:
+                u = np.diag(self._lu).astype(float)
+                swaps = np.count_nonzero(self._piv != np.arange(self.n))
+                self._slogdet = ((-1.0) ** swaps * float(np.prod(np.sign(u))), float(np.log(np.abs(u)).sum()))
+                anorm = float(_norm1(A))
+                self._rcond = lapack.gecon(self._lu, anorm) if anorm else 0.0
+            else:
+                self._slogdet, self._rcond = (0.0, -np.inf), 0.0
+
+    def _logdet(self) -> Tuple[float, float]:
+        if self._slogdet is None:
+            self._slogdet = tuple(float(v) for v in np.linalg.slogdet(self._A))
+        return self._slogdet
+
+    @property
+    def sign(self) -> float:
+        return self._logdet()[0]
+
+    @property
+    def logabsdet(self) -> float:
+        return self._logdet()[1]
+
+    @property
+    def det(self) -> Optional[float]:
+        return structure.det_from_log(*self._logdet())
+
+    @property
+    def rcond(self) -> float:
+        if self._rcond is None:
+            try:
+                self._inv = np.linalg.inv(self._A)
+            except np.linalg.LinAlgError:
+                self._inv = None
+            self._rcond = float(inverse_rcond(self._A, self._inv)) if self._inv is not None else 0.0
+        return self._rcond
+
+    @property
+    def singular(self) -> bool:
+        return not self.rcond >= max(RCOND_MIN, float(np.finfo(self.dtype).eps))
+
+    def solve(self, B: np.ndarray) -> np.ndarray:
+        """Resuelve `AX = B` (`B` vector `(n,)` o matriz `(n, k)`) con la factorización (`getrs`)."""
+        if self.singular:
+            raise ValueError("El sistema de ecuaciones no tiene solución |A| = 0")
+        if B.shape[0] != self.n:
+            raise ValueError("El tamaño de b debe coincidir con A")
+        if self._lu is None:
+            return self._inv.dot(B)
+        return lapack.getrs(self._lu, self._piv, B)
+
+    def inverse(self) -> np.ndarray:
+        """`A^{-1}` a partir de la misma factorización (`getri`)."""
+        if self.singular:
+            raise ValueError("La matriz no tiene inversa: |A| = 0")
+        if self._inv is None:
+            self._inv = lapack.getri(self._lu, self._piv)
+        return self._inv
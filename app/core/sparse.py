@@ -0,0 +1,559 @@
+"""Matrices dispersas (CSR) y sistemas en banda implementados sólo con NumPy.
+
+Las matrices de los cursos de ingeniería (diferencias finitas, estructuras, circuitos)
+suelen ser bandas o casi vacías: guardar `np.zeros((n, n))` para 10.000x10.000 ocupa
+800 MB aunque sólo haya 30.000 entradas no nulas. Este módulo guarda únicamente las
+entradas no nulas en formato CSR (*Compressed Sparse Row*):
+
+- `data[k]`: valor de la `k`-ésima entrada no nula (recorridas por filas).
+- `indices[k]`: columna de esa entrada.
+- `indptr[i]:indptr[i+1]`: rango de `data`/`indices` que pertenece a la fila `i`.
+
+Operaciones:
+- `add`, `subtract`, `transpose`: concatenación de coordenadas (COO) y reagrupación.
+- `multiply`: producto disperso·denso con `np.add.reduceat` y disperso·disperso con el
+  algoritmo de Gustavson vectorizado (una fila de `B` por cada entrada de `A`).
+- Sistemas, determinante e inversa: `BandLU`, eliminación gaussiana con pivoteo parcial
+  sobre la banda `[i-kl, i+kl+ku]` de cada fila. Si la banda original es ancha se
+  reordena con Cuthill-McKee inverso (RCM), que agrupa las entradas junto a la diagonal.
+  Costo O(n·kl·(kl+ku)) en lugar de O(n³).
+
+`select` decide la representación según la densidad medida (y, para factorizaciones,
+según el ancho de banda), de modo que las matrices densas pequeñas siguen usando BLAS.
+
+Referencias:
+- Formato CSR: https://en.wikipedia.org/wiki/Sparse_matrix#Compressed_sparse_row_(CSR,_CRS_or_Yale_format)
+- LU en banda (equivalente a `gbtrf` de LAPACK): https://netlib.org/lapack/lug/node124.html
+- E. Cuthill, J. McKee, "Reducing the bandwidth of sparse symmetric matrices" (1969).
+"""
+
+import math
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from . import structure
+
+# Densidad (no nulos / celdas) por debajo de la cual conviene el formato disperso
+SPARSE_MAX_DENSITY = 0.1
+
+# Dimensión mínima para usar formato disperso: por debajo, BLAS denso siempre es más rápido
+SPARSE_MIN_SIZE = 64
+
+# Celdas máximas al convertir a denso (4e6 float64 = 32 MB)
+DENSE_MAX_CELLS = 4_000_000
+
+# Celdas máximas del almacenamiento en banda de `BandLU` (5e7 float64 = 400 MB)
+MAX_BAND_CELLS = 50_000_000
+
+# La banda (kl + ku + 1) debe ser a lo sumo esta fracción de `n` para preferir `BandLU` a LU densa
+BAND_MAX_FRACTION = 0.1
+
+# Operaciones que factorizan la matriz (el costo depende del ancho de banda)
+FACTOR_OPS = ("det", "inv", "solve", "cramer", "inverse")
+
+# Operaciones para las que `select` convierte a CSR una entrada densa: en suma, resta,
+# traspuesta o potencia la conversión de ida y vuelta cuesta más que operar en denso
+SPARSE_OPS = ("mul",) + FACTOR_OPS
+
+Matrix = Union[np.ndarray, "CSRMatrix"]
+
+
+class CSRMatrix:
+    """Matriz dispersa en formato CSR con valores `float64`.
+
+    Se construye con `from_coo`, `from_csr` o `from_dense`; las entradas repetidas se
+    suman y los ceros explícitos se descartan. Es serializable con `pickle` (viaja al
+    pool de procesos del planificador).
+    """
+
+    dtype = np.dtype(float)
+    ndim = 2
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, shape: Tuple[int, int]):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = (int(shape[0]), int(shape[1]))
+        # Memo de `_ordering` (permutación RCM y anchos de banda)
+        self._band: Optional[Tuple[Optional[np.ndarray], int, int]] = None
+
+    @classmethod
+    def from_coo(cls, row, col, data, shape: Tuple[int, int]) -> "CSRMatrix":
+        """Construye desde coordenadas `(row[k], col[k]) = data[k]` (suma repetidas)."""
+        row = np.asarray(row, dtype=np.int64).ravel()
+        col = np.asarray(col, dtype=np.int64).ravel()
+        data = np.asarray(data, dtype=float).ravel()
+        n, m = int(shape[0]), int(shape[1])
+        if n <= 0 or m <= 0:
+            raise ValueError("La matriz dispersa debe tener forma positiva")
+        if not (row.size == col.size == data.size):
+            raise ValueError("row, col y data deben tener la misma longitud")
+        if row.size and (row.min() < 0 or row.max() >= n or col.min() < 0 or col.max() >= m):
+            raise ValueError("Índice fuera de rango en la matriz dispersa")
+        if not np.isfinite(data).all():
+            raise ValueError("Valor no numérico en la matriz dispersa")
+        order = np.lexsort((col, row))
+        row, col, data = row[order], col[order], data[order]
+        if row.size:
+            first = np.empty(row.size, dtype=bool)
+            first[0] = True
+            first[1:] = (row[1:] != row[:-1]) | (col[1:] != col[:-1])
+            starts = np.flatnonzero(first)
+            data = np.add.reduceat(data, starts)
+            row, col = row[starts], col[starts]
+            keep = data != 0.0
+            row, col, data = row[keep], col[keep], data[keep]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row, minlength=n), out=indptr[1:])
+        return cls(data, col, indptr, (n, m))
+
+    @classmethod
+    def from_csr(cls, indptr, indices, data, shape: Tuple[int, int]) -> "CSRMatrix":
+        """Construye desde arreglos CSR (se validan y normalizan vía COO)."""
+        indptr = np.asarray(indptr, dtype=np.int64).ravel()
+        n = int(shape[0])
+        if indptr.size != n + 1 or indptr[0] != 0 or np.any(np.diff(indptr) < 0):
+            raise ValueError("indptr debe tener n+1 valores no decrecientes que empiecen en 0")
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        if indptr[-1] != indices.size:
+            raise ValueError("indptr no coincide con la longitud de indices/data")
+        row = np.repeat(np.arange(n), np.diff(indptr))
+        return cls.from_coo(row, indices, data, shape)
+
+    @classmethod
+    def from_dense(cls, A: np.ndarray) -> "CSRMatrix":
+        """Convierte una matriz densa conservando sólo sus entradas no nulas."""
+        row, col = np.nonzero(A)
+        return cls.from_coo(row, col, A[row, col], A.shape)
+
+    @property
+    def nnz(self) -> int:
+        """Número de entradas no nulas guardadas."""
+        return int(self.data.size)
+
+    @property
+    def density(self) -> float:
+        """Fracción de celdas no nulas."""
+        return self.nnz / float(self.shape[0] * self.shape[1])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.data.nbytes + self.indices.nbytes + self.indptr.nbytes)
+
+    def row_ids(self) -> np.ndarray:
+        """Fila de cada entrada guardada (expansión de `indptr`)."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def to_coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retorna `(row, col, data)` ordenados por fila y columna."""
+        return self.row_ids(), self.indices, self.data
+
+    def to_dense(self) -> np.ndarray:
+        """Materializa la matriz densa (valida el límite `DENSE_MAX_CELLS`)."""
+        check_dense_size(self.shape)
+        D = np.zeros(self.shape)
+        D[self.row_ids(), self.indices] = self.data
+        return D
+
+    def __getstate__(self):
+        return {"data": self.data, "indices": self.indices, "indptr": self.indptr, "shape": self.shape}
+
+    def __setstate__(self, state):
+        self.__init__(state["data"], state["indices"], state["indptr"], state["shape"])
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def is_sparse(A: Any) -> bool:
+    """Indica si `A` es una matriz dispersa `CSRMatrix`."""
+    return isinstance(A, CSRMatrix)
+
+
+def check_dense_size(shape: Tuple[int, ...]) -> None:
+    """Lanza `ValueError` si un resultado denso de forma `shape` excede `DENSE_MAX_CELLS`."""
+    if math.prod(shape) > DENSE_MAX_CELLS:
+        raise ValueError(
+            f"El resultado denso de forma {tuple(shape)} es demasiado grande; use operaciones dispersas o /api/linear/solve"
+        )
+
+
+def to_dense(A: Optional[Matrix]) -> Optional[np.ndarray]:
+    """Versión densa de `A` (las matrices densas se devuelven sin copiar)."""
+    return A.to_dense() if is_sparse(A) else A
+
+
+def match_format(result: Any, *inputs: Any) -> Any:
+    """Devuelve `result` disperso si y sólo si alguna entrada llegó en formato disperso.
+
+    Así, una matriz enviada como grilla densa recibe una grilla densa aunque `select`
+    haya elegido CSR internamente (y viceversa).
+    """
+    sparse_in = any(is_sparse(x) for x in inputs)
+    if is_sparse(result) and not sparse_in:
+        return result.to_dense()
+    if sparse_in and isinstance(result, np.ndarray) and result.ndim == 2:
+        return CSRMatrix.from_dense(result)
+    return result
+
+
+def from_json(name: str, value: Mapping[str, Any]) -> CSRMatrix:
+    """Construye una matriz dispersa desde su forma JSON.
+
+    Formatos:
+    - `{"format": "coo", "shape": [n, m], "row": [...], "col": [...], "data": [...]}`
+    - `{"format": "csr", "shape": [n, m], "indptr": [...], "indices": [...], "data": [...]}`
+    """
+    fmt = str(value.get("format", "")).lower()
+    shape = value.get("shape")
+    if not isinstance(shape, (list, tuple)) or len(shape) != 2:
+        raise ValueError(f"La matriz dispersa {name} requiere 'shape': [filas, columnas]")
+    try:
+        shape = (int(shape[0]), int(shape[1]))
+        if fmt == "coo":
+            return CSRMatrix.from_coo(value["row"], value["col"], value["data"], shape)
+        if fmt == "csr":
+            return CSRMatrix.from_csr(value["indptr"], value["indices"], value["data"], shape)
+    except KeyError as e:
+        raise ValueError(f"Falta el campo {e} en la matriz dispersa {name}")
+    except TypeError:
+        raise ValueError(f"Valor no numérico en la matriz dispersa {name}")
+    raise ValueError(f"Formato disperso desconocido en {name}: use 'coo' o 'csr'")
+
+
+def to_json(A: CSRMatrix) -> Dict[str, Any]:
+    """Forma JSON (COO) de una matriz dispersa, inversa de `from_json`."""
+    row, col, data = A.to_coo()
+    return {"format": "coo", "shape": list(A.shape), "row": row.tolist(), "col": col.tolist(), "data": data.tolist()}
+
+
+def bandwidth(A: CSRMatrix) -> Tuple[int, int]:
+    """Anchos de banda `(kl, ku)`: máxima distancia de una entrada bajo/sobre la diagonal."""
+    row, col, _ = A.to_coo()
+    if not row.size:
+        return 0, 0
+    diff = col - row
+    return int(max(0, -diff.min())), int(max(0, diff.max()))
+
+
+def _rcm(A: CSRMatrix) -> np.ndarray:
+    """Permutación de Cuthill-McKee inversa sobre el patrón simétrico de `A + Aᵀ`.
+
+    Recorre cada componente en anchura desde el nodo de menor grado, visitando vecinos
+    por grado creciente; invertir el orden reduce el perfil de la factorización.
+    """
+    n = A.shape[0]
+    row, col, _ = A.to_coo()
+    off = row != col
+    G = CSRMatrix.from_coo(
+        np.concatenate([row[off], col[off]]), np.concatenate([col[off], row[off]]),
+        np.ones(2 * int(off.sum())), (n, n),
+    )
+    degree = np.diff(G.indptr)
+    visited = np.zeros(n, dtype=bool)
+    order = []
+    for start in np.argsort(degree, kind="stable"):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [int(start)]
+        head = 0
+        while head < len(queue):
+            v = queue[head]
+            head += 1
+            nb = G.indices[G.indptr[v]:G.indptr[v + 1]]
+            nb = nb[~visited[nb]]
+            nb = nb[np.argsort(degree[nb], kind="stable")]
+            visited[nb] = True
+            queue.extend(nb.tolist())
+        order.extend(queue)
+    return np.array(order[::-1], dtype=np.int64)
+
+
+def _permute(A: CSRMatrix, perm: np.ndarray) -> CSRMatrix:
+    """`P A Pᵀ`: la nueva fila/columna `i` es la original `perm[i]`."""
+    inv = np.empty_like(perm)
+    inv[perm] = np.arange(perm.size)
+    row, col, data = A.to_coo()
+    return CSRMatrix.from_coo(inv[row], inv[col], data, A.shape)
+
+
+def _ordering(A: CSRMatrix) -> Tuple[Optional[np.ndarray], int, int]:
+    """Permutación (o `None`) y anchos `(kl, ku)` con los que se factoriza `A` (memoizado)."""
+    if A._band is None:
+        kl, ku = bandwidth(A)
+        perm = None
+        if kl + ku + 1 > BAND_MAX_FRACTION * A.shape[0] and A.shape[0] == A.shape[1]:
+            candidate = _rcm(A)
+            pkl, pku = bandwidth(_permute(A, candidate))
+            if pkl + pku < kl + ku:
+                perm, kl, ku = candidate, pkl, pku
+        A._band = (perm, kl, ku)
+    return A._band
+
+
+class BandLU:
+    """Factorización `PA = LU` en banda con pivoteo parcial, reutilizable para varios `b`.
+
+    Cada fila `i` se guarda en una ventana de columnas `[i-kl, i+kl+ku]` (el pivoteo
+    puede extender `U` hasta `kl+ku` sobre la diagonal). En el paso `k` se elige el
+    pivote entre las filas `k..k+kl` y se eliminan esas filas con una única operación
+    vectorizada sobre un bloque `kl × (kl+ku+1)`.
+
+    Atributos:
+    - `det`: determinante (`0.0` si algún pivote es cero; `None` si no es representable
+      en `float`).
+    - `rcond`: estimación del recíproco del número de condición en norma 1 a partir de los
+      factores (`structure.inv_norm1`, unas pocas soluciones O(n·kl)); se calcula al consultarla.
+    - `singular`: `True` si `rcond < RCOND_MIN`, el mismo criterio que `matrix_ops.DenseLU`
+      y `structure`: no depende de la escala de `A` ni de que la entrada llegue densa o en CSR.
+    """
+
+    def __init__(self, A: CSRMatrix):
+        n = A.shape[0]
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Introduzca una matriz cuadrada")
+        perm, kl, ku = _ordering(A)
+        if perm is not None:
+            A = _permute(A, perm)
+        width = 2 * kl + ku + 1
+        if n * width > MAX_BAND_CELLS:
+            raise ValueError("La matriz dispersa tiene un ancho de banda demasiado grande para factorizarse en memoria")
+        m = kl + ku + 1
+        W = np.zeros((n, width))
+        row, col, data = A.to_coo()
+        W[row, col - row + kl] = data
+        L = np.zeros((n, kl))
+        piv = np.arange(n)
+        sign = 1.0
+        logabs = 0.0
+        zero_pivot = not data.size
+        offsets = np.arange(kl + 1)
+        cols = np.arange(m)
+        for k in range(n):
+            rmax = min(kl, n - 1 - k)
+            t = offsets[:rmax + 1]
+            p = int(np.argmax(np.abs(W[k + t, kl - t])))
+            if p:
+                upper = W[k, kl:kl + m].copy()
+                W[k, kl:kl + m] = W[k + p, kl - p:kl - p + m]
+                W[k + p, kl - p:kl - p + m] = upper
+                piv[k] = k + p
+                sign = -sign
+            d = W[k, kl]
+            if d == 0.0:
+                zero_pivot = True
+                break
+            if d < 0:
+                sign = -sign
+            logabs += math.log(abs(d))
+            if rmax:
+                r = offsets[1:rmax + 1]
+                l = W[k + r, kl - r] / d
+                L[k, :rmax] = l
+                W[(k + r)[:, None], (kl - r)[:, None] + cols] -= l[:, None] * W[k, kl:kl + m]
+        self.n, self.kl, self.ku = n, kl, ku
+        self.perm = perm
+        self._U = W[:, kl:kl + m]
+        self._L = L
+        self._piv = piv
+        # ‖A‖₁ (la permutación simétrica de RCM no lo cambia)
+        self._anorm = float(np.bincount(col, weights=np.abs(data), minlength=n).max()) if data.size else 0.0
+        self._rcond: Optional[float] = 0.0 if zero_pivot else None
+        self.det: Optional[float] = 0.0 if zero_pivot else structure.det_from_log(sign, logabs)
+
+    @property
+    def rcond(self) -> float:
+        if self._rcond is None:
+            norm_inv = structure.inv_norm1(self.n, self._solve, lambda x: self._solve(x, transpose=True))
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                rcond = 1.0 / (self._anorm * norm_inv)
+            self._rcond = float(rcond) if np.isfinite(rcond) else 0.0
+        return self._rcond
+
+    @property
+    def singular(self) -> bool:
+        return not self.rcond >= structure.RCOND_MIN
+
+    def solve(self, B: np.ndarray) -> np.ndarray:
+        """Resuelve `AX = B` (`B` vector `(n,)` o matriz `(n, k)`) con la factorización."""
+        if self.singular:
+            raise ValueError("El sistema de ecuaciones no tiene solución |A| = 0")
+        if B.shape[0] != self.n:
+            raise ValueError("El tamaño de b debe coincidir con A")
+        return self._solve(B)
+
+    def _solve(self, B: np.ndarray, transpose: bool = False) -> np.ndarray:
+        """`A^{-1} B` (o `A^{-ᵀ} B`) con los factores, sin comprobar la condición."""
+        n, kl, m = self.n, self.kl, self.kl + self.ku + 1
+        X = np.array(B, dtype=float, copy=True)
+        if self.perm is not None:
+            X = X[self.perm]
+        L, U, piv = self._L, self._U, self._piv
+        if not transpose:
+            for k in range(n):
+                p = piv[k]
+                if p != k:
+                    X[[k, p]] = X[[p, k]]
+                rmax = min(kl, n - 1 - k)
+                if rmax:
+                    X[k + 1:k + 1 + rmax] -= np.multiply.outer(L[k, :rmax], X[k])
+            for k in range(n - 1, -1, -1):
+                hi = min(m, n - k)
+                X[k] = (X[k] - U[k, 1:hi] @ X[k + 1:k + hi]) / U[k, 0]
+        else:
+            # `Aᵀ = Uᵀ Lᵀ P`: `Uᵀ` hacia adelante y los pasos de `L` (con sus intercambios) en orden inverso
+            for k in range(n):
+                X[k] /= U[k, 0]
+                hi = min(m, n - k)
+                if hi > 1:
+                    X[k + 1:k + hi] -= np.multiply.outer(U[k, 1:hi], X[k])
+            for k in range(n - 1, -1, -1):
+                rmax = min(kl, n - 1 - k)
+                if rmax:
+                    X[k] -= L[k, :rmax] @ X[k + 1:k + 1 + rmax]
+                p = piv[k]
+                if p != k:
+                    X[[k, p]] = X[[p, k]]
+        if self.perm is not None:
+            out = np.empty_like(X)
+            out[self.perm] = X
+            X = out
+        return X
+
+
+def select(A: Optional[Matrix], op: str) -> Optional[Matrix]:
+    """Elige la representación (densa o CSR) de `A` para la operación `op`.
+
+    - Densa → CSR sólo para `SPARSE_OPS` (producto y factorizaciones), si la dimensión
+      menor es `>= SPARSE_MIN_SIZE` y la densidad medida
+      (`np.count_nonzero / celdas`) es `<= SPARSE_MAX_DENSITY`. Para factorizaciones
+      (`FACTOR_OPS`) además la banda (tras RCM) debe ser `<= BAND_MAX_FRACTION · n`.
+    - CSR → densa si no cumple esos criterios y cabe en `DENSE_MAX_CELLS`.
+
+    Las matrices exactas (`dtype=object`) no se modifican.
+    """
+    if A is None:
+        return None
+    if is_sparse(A):
+        fits = A.shape[0] * A.shape[1] <= DENSE_MAX_CELLS
+        if fits and not _prefers_sparse(A, op):
+            return A.to_dense()
+        return A
+    if op not in SPARSE_OPS or A.dtype == object or A.ndim != 2 or min(A.shape) < SPARSE_MIN_SIZE:
+        return A
+    if np.count_nonzero(A) > SPARSE_MAX_DENSITY * A.size:
+        return A
+    S = CSRMatrix.from_dense(A)
+    return S if _prefers_sparse(S, op) else A
+
+
+def _prefers_sparse(A: CSRMatrix, op: str) -> bool:
+    """Criterio de `select` para una matriz ya en CSR."""
+    if min(A.shape) < SPARSE_MIN_SIZE or A.density > SPARSE_MAX_DENSITY:
+        return False
+    if op in FACTOR_OPS:
+        _, kl, ku = _ordering(A)
+        return kl + ku + 1 <= BAND_MAX_FRACTION * A.shape[0]
+    return True
+
+
+def estimate_flops(op: str, A: Matrix, B: Optional[Matrix] = None) -> float:
+    """Costo estimado de `op` con operandos dispersos (para el planificador)."""
+    if op in FACTOR_OPS and is_sparse(A):
+        n = A.shape[0]
+        _, kl, ku = _ordering(A)
+        flops = 2.0 * n * (kl + 1) * (kl + ku + 1)
+        rhs = n if op in ("inv", "inverse") else (B.shape[1] if B is not None and B.ndim == 2 else 1)
+        return flops + 2.0 * n * (2 * kl + ku + 1) * rhs
+    nnz_a = A.nnz if is_sparse(A) else A.size
+    if op == "mul" and B is not None:
+        if is_sparse(B):
+            return 2.0 * nnz_a * B.nnz / max(B.shape[0], 1)
+        return 2.0 * nnz_a * B.shape[1]
+    return float(nnz_a + (0 if B is None else (B.nnz if is_sparse(B) else B.size)))
+
+
+def add(A: Matrix, B: Matrix) -> Matrix:
+    """`A + B`; disperso si ambos operandos lo son, denso en otro caso."""
+    if A.shape != B.shape:
+        raise ValueError("Para sumar, las matrices deben tener el mismo tamaño")
+    if is_sparse(A) and is_sparse(B):
+        (ra, ca, da), (rb, cb, db) = A.to_coo(), B.to_coo()
+        return CSRMatrix.from_coo(np.concatenate([ra, rb]), np.concatenate([ca, cb]), np.concatenate([da, db]), A.shape)
+    return to_dense(A) + to_dense(B)
+
+
+def subtract(A: Matrix, B: Matrix) -> Matrix:
+    """`A - B`; disperso si ambos operandos lo son, denso en otro caso."""
+    if A.shape != B.shape:
+        raise ValueError("Para restar, las matrices deben tener el mismo tamaño")
+    if is_sparse(B):
+        B = CSRMatrix(-B.data, B.indices, B.indptr, B.shape)
+        return add(A, B)
+    return to_dense(A) - B
+
+
+def _sparse_dense(S: CSRMatrix, D: np.ndarray) -> np.ndarray:
+    """Producto `S · D` con `D` denso (vector o matriz): una suma por fila con `reduceat`."""
+    out = np.zeros((S.shape[0],) + D.shape[1:])
+    if S.nnz:
+        prod = (S.data[:, None] * D[S.indices]) if D.ndim == 2 else S.data * D[S.indices]
+        nonempty = np.diff(S.indptr) > 0
+        out[nonempty] = np.add.reduceat(prod, S.indptr[:-1][nonempty], axis=0)
+    return out
+
+
+def multiply(A: Matrix, B: Matrix) -> Matrix:
+    """Producto matricial `A × B` con al menos un operando disperso.
+
+    - disperso · disperso → disperso (Gustavson: por cada `A[i, k]`, se acumula
+      `A[i, k] · B[k, :]`; las contribuciones repetidas se suman en `from_coo`).
+    - disperso · denso y denso · disperso → denso.
+    """
+    if A.shape[1] != B.shape[0]:
+        raise ValueError("Para multiplicar, las columnas de A deben igualar las filas de B")
+    if is_sparse(A) and is_sparse(B):
+        counts = np.diff(B.indptr)[A.indices]
+        total = int(counts.sum())
+        starts = np.repeat(B.indptr[A.indices], counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        idx = starts + offsets
+        return CSRMatrix.from_coo(
+            np.repeat(A.row_ids(), counts), B.indices[idx], np.repeat(A.data, counts) * B.data[idx],
+            (A.shape[0], B.shape[1]),
+        )
+    if is_sparse(A):
+        return _sparse_dense(A, np.asarray(B, dtype=float))
+    return _sparse_dense(transpose(B), np.asarray(A, dtype=float).T).T
+
+
+def transpose(A: CSRMatrix) -> CSRMatrix:
+    """Traspuesta dispersa (intercambia filas y columnas de las coordenadas)."""
+    row, col, data = A.to_coo()
+    return CSRMatrix.from_coo(col, row, data, (A.shape[1], A.shape[0]))
+
+
+def solve(A: CSRMatrix, B: np.ndarray) -> Tuple[Optional[float], Optional[np.ndarray]]:
+    """Resuelve `AX = B` con `BandLU`; retorna `(|A|, X)` y `X = None` si es singular."""
+    lu = BandLU(A)
+    return lu.det, None if lu.singular else lu.solve(B)
+
+
+def det(A: CSRMatrix) -> Optional[float]:
+    """Determinante por factorización en banda (`None` si desborda `float`)."""
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca una matriz cuadrada para el determinante")
+    return BandLU(A).det
+
+
+def inv(A: CSRMatrix) -> np.ndarray:
+    """Inversa densa de una matriz dispersa (la inversa de una banda suele ser densa)."""
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Introduzca una matriz cuadrada para la inversa")
+    check_dense_size(A.shape)
+    lu = BandLU(A)
+    if lu.singular:
+        raise ValueError("La matriz no tiene inversa: |A| = 0")
+    return lu.solve(np.eye(A.shape[0]))
@@ -0,0 +1,303 @@
+"""Detección de estructura y solucionadores especializados para matrices densas.
+
+La mayoría de los sistemas de los cursos tienen estructura: diagonales, triangulares
+(resultado de una eliminación previa), simétricas definidas positivas (rigidez, mínimos
+cuadrados) o tridiagonales (diferencias finitas). Para ellas hay algoritmos más baratos
+que la LU general:
+
+- `diagonal`: división directa `x_i = b_i / a_ii`, O(n).
+- `lower`/`upper` (triangular): sustitución hacia adelante/atrás, O(n²) (`trtrs` de
+  LAPACK con SciPy; si no, por bloques).
+- `tridiagonal`: algoritmo de Thomas, O(n), si la matriz es diagonalmente dominante
+  (sin pivoteo es estable en ese caso). Las sustituciones son recurrencias lineales de
+  primer orden y se evalúan con un barrido de prefijos vectorizado (log₂ n pasos).
+- `spd` (simétrica con diagonal positiva): Cholesky `A = L Lᵀ`, la mitad de operaciones
+  que LU; si la factorización falla (no es definida positiva) se recurre a LU.
+
+`solve` retorna `(|A|, X, método)` o `None` si la estructura no permite la vía rápida,
+en cuyo caso el llamador usa la LU general (`matrix_ops`). Como en la LU general, `|A|` se
+calcula en escala logarítmica y `A` se trata como singular si su condición estimada es
+`rcond < RCOND_MIN`.
+
+Referencias:
+- Algoritmo de Thomas: https://en.wikipedia.org/wiki/Tridiagonal_matrix_algorithm
+- `np.linalg.cholesky`: https://numpy.org/doc/stable/reference/generated/numpy.linalg.cholesky.html
+"""
+
+import math
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from . import lapack
+
+# Bloque de la sustitución triangular sin SciPy: bloques diagonales invertidos por
+# sustitución y actualización del resto con un producto matricial (BLAS)
+TRI_BLOCK = 64
+
+# Columnas máximas del lado derecho para evaluar las recurrencias de Thomas con un barrido
+# de prefijos (O(n log n) por columna); con más, un recorrido por filas (O(n) por columna)
+SCAN_MAX_COLS = 8
+
+# Recíproco mínimo del número de condición (norma 1) para tratar una matriz como
+# invertible: por debajo, `A^{-1}` en punto flotante no conserva ninguna cifra correcta
+RCOND_MIN = float(np.finfo(float).eps)
+
+# Iteraciones del estimador de `‖A^{-1}‖₁` (LAPACK usa 5)
+RCOND_ITERS = 5
+
+# Rango de `log|A|` representable en `float` (`exp(709)` desborda; `exp(-745)` se anula):
+# fuera de él, `|A|` es `None`
+LOG_DET_MIN, LOG_DET_MAX = -745.0, 709.0
+
+Solved = Tuple[Optional[float], Optional[np.ndarray], str]
+
+
+def detect(A: np.ndarray) -> str:
+    """Clasifica la matriz cuadrada `A`.
+
+    Retorna `diagonal`, `lower`, `upper`, `tridiagonal`, `spd` (candidata: simétrica con
+    diagonal positiva; se confirma al factorizar) o `general`.
+    """
+    n = A.shape[0]
+    if n != A.shape[1] or A.dtype == object:
+        return "general"
+    if n > 2 and A[n - 1, 0] != 0 and A[0, n - 1] != 0:
+        # Esquinas no nulas: no es triangular ni tridiagonal (evita recorrer los triángulos)
+        return "spd" if (np.diag(A) > 0).all() and np.array_equal(A, A.T) else "general"
+    below = np.tril(A, -1).any()
+    above = np.triu(A, 1).any()
+    if not below and not above:
+        return "diagonal"
+    if not above:
+        return "lower"
+    if not below:
+        return "upper"
+    if n > 2 and not np.tril(A, -2).any() and not np.triu(A, 2).any():
+        return "tridiagonal"
+    if (np.diag(A) > 0).all() and np.array_equal(A, A.T):
+        return "spd"
+    return "general"
+
+
+def _tri_inverse(D: np.ndarray, lower: bool) -> np.ndarray:
+    """Inversa de un bloque triangular: sustitución fila a fila contra la identidad."""
+    k = D.shape[0]
+    X = np.eye(k)
+    for i in (range(k) if lower else range(k - 1, -1, -1)):
+        done = slice(0, i) if lower else slice(i + 1, k)
+        X[i] = (X[i] - D[i, done] @ X[done]) / D[i, i]
+    return X
+
+
+def tri_solver(T: np.ndarray, lower: bool) -> Callable[..., np.ndarray]:
+    """Prepara la sustitución hacia adelante (`lower`) o hacia atrás con `T` triangular.
+
+    Retorna `solve(B, transpose=False)`, que calcula `T⁻¹ B` (o `T⁻ᵀ B`) para `B` vector o
+    matriz, y permite resolver varias veces con la misma `T` (p. ej. el estimador de
+    condición). Con SciPy usa `trtrs` de LAPACK (`core.lapack`); si no, sustitución por
+    bloques de `TRI_BLOCK` filas: los bloques diagonales se invierten una vez por
+    sustitución y cada solución es una secuencia de productos matriciales (BLAS).
+    """
+    if lapack.available():
+        return lambda B, transpose=False: lapack.trtrs(T, np.array(B, dtype=float), lower, transpose)
+    n = T.shape[0]
+    blocks = [(j0, min(j0 + TRI_BLOCK, n)) for j0 in range(0, n, TRI_BLOCK)]
+    blocks = [(j0, j1, _tri_inverse(T[j0:j1, j0:j1], lower)) for j0, j1 in blocks]
+
+    def solve(B: np.ndarray, transpose: bool = False) -> np.ndarray:
+        # `Tᵀ` es triangular del otro lado y sus bloques diagonales invertidos son `Dinv.T`
+        M, forward = (T.T, not lower) if transpose else (T, lower)
+        X = np.array(B, dtype=float, copy=True)
+        for j0, j1, Dinv in (blocks if forward else reversed(blocks)):
+            if forward and j0:
+                X[j0:j1] -= M[j0:j1, :j0] @ X[:j0]
+            elif not forward and j1 < n:
+                X[j0:j1] -= M[j0:j1, j1:] @ X[j1:]
+            X[j0:j1] = (Dinv.T if transpose else Dinv) @ X[j0:j1]
+        return X
+
+    return solve
+
+
+def tri_solve(T: np.ndarray, B: np.ndarray, lower: bool) -> np.ndarray:
+    """Resuelve `T X = B` con `T` triangular, una sola vez (ver `tri_solver`)."""
+    return tri_solver(T, lower)(B)
+
+
+def _recurrence(g: np.ndarray, F: np.ndarray) -> np.ndarray:
+    """Evalúa `y_0 = f_0`, `y_i = f_i + g_i · y_{i-1}` (`F` vector o matriz, por filas).
+
+    Con pocas columnas, barrido de prefijos (Hillis-Steele): en el paso `s` cada fila
+    absorbe la de `s` posiciones antes, y tras ⌈log₂ n⌉ pasos vectorizados cada `y_i`
+    acumula toda la recurrencia. Con más de `SCAN_MAX_COLS` columnas (p. ej. la inversa)
+    conviene recorrer las filas: cada paso ya es una operación sobre la fila completa.
+    Con `|g_i| <= 1` (Thomas con dominancia diagonal) no hay crecimiento.
+    """
+    y = np.array(F, dtype=float, copy=True)
+    g = np.array(g, dtype=float, copy=True)
+    n = g.size
+    if y.ndim == 2 and y.shape[1] > SCAN_MAX_COLS:
+        for i in range(1, n):
+            y[i] += g[i] * y[i - 1]
+        return y
+    g[0] = 0.0
+    s = 1
+    while s < n:
+        gs = g[s:] if y.ndim == 1 else g[s:, None]
+        y[s:] = y[s:] + gs * y[:-s]
+        g[s:] = g[s:] * g[:-s]
+        s *= 2
+    return y
+
+
+def _thomas(A: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Factorización de Thomas `A = L U` sin pivoteo (`L` bidiagonal unitaria, `U` bidiagonal).
+
+    Retorna `(l, m, c)`: subdiagonal de `L`, diagonal de `U` (pivotes) y superdiagonal de
+    `U` (la de `A`); `None` si `A` no es diagonalmente dominante o un pivote se anula.
+    Los pivotes siguen una recurrencia no lineal (`m_i = b_i − a_i c_i / m_{i-1}`) que se
+    evalúa con aritmética de Python sobre listas, sin un acceso de NumPy por elemento.
+    """
+    a = np.diag(A, -1).astype(float)
+    b = np.diag(A).astype(float)
+    c = np.diag(A, 1).astype(float)
+    off = np.abs(np.concatenate([[0.0], a])) + np.abs(np.concatenate([c, [0.0]]))
+    if (np.abs(b) < off).any() or b[0] == 0.0:
+        return None
+    ac = (a * c).tolist()
+    m = [b[0]]
+    for bi, aci in zip(b[1:].tolist(), ac):
+        m.append(bi - aci / m[-1])
+        if m[-1] == 0.0:
+            return None
+    m = np.array(m)
+    return a / m[:-1], m, c
+
+
+def _thomas_solve(f: Tuple[np.ndarray, np.ndarray, np.ndarray], B: np.ndarray, transpose: bool = False) -> np.ndarray:
+    """Resuelve `A X = B` (o `Aᵀ X = B`) con la factorización de `_thomas`, O(n log n) por columna
+    en pasos vectorizados (`_recurrence`)."""
+    l, m, c = f
+    B = np.asarray(B, dtype=float)
+    col = (lambda v: v) if B.ndim == 1 else (lambda v: v[:, None])
+    if transpose:
+        # Uᵀ w = b: w_i = b_i / m_i − (c_{i-1} / m_i) w_{i-1}
+        w = _recurrence(np.concatenate([[0.0], -c / m[1:]]), B / col(m))
+        # Lᵀ x = w: x_i = w_i − l_i x_{i+1} (recurrencia en orden inverso)
+        return _recurrence(np.concatenate([[0.0], -l[::-1]]), w[::-1])[::-1]
+    # L y = b: y_i = b_i − l_{i-1} y_{i-1}
+    y = _recurrence(np.concatenate([[0.0], -l]), B)
+    # U x = y: x_i = y_i / m_i − (c_i / m_i) x_{i+1} (en orden inverso)
+    g = np.concatenate([[0.0], (-c / m[:-1])[::-1]])
+    return _recurrence(g, (y / col(m))[::-1])[::-1]
+
+
+def det_from_log(sign: float, logabsdet: float) -> Optional[float]:
+    """`|A| = sign · exp(logabsdet)`: `0.0` si `sign = 0` y `None` si no es representable en `float`
+    (desborda, o se anularía sin que `A` sea singular)."""
+    if sign == 0.0:
+        return 0.0
+    return float(sign * math.exp(logabsdet)) if LOG_DET_MIN < logabsdet < LOG_DET_MAX else None
+
+
+def _log_det(pivots: np.ndarray, power: int = 1) -> Optional[float]:
+    """`|A| = (Π pivots)^power` acumulado en escala logarítmica (sin desbordar ni anularse)."""
+    if not pivots.all():
+        return 0.0
+    sign = float(np.prod(np.sign(pivots))) ** power
+    return det_from_log(sign, power * float(np.log(np.abs(pivots)).sum()))
+
+
+def inv_norm1(n: int, solve: Callable[[np.ndarray], np.ndarray], solve_t: Callable[[np.ndarray], np.ndarray]) -> float:
+    """Estimación de `‖A^{-1}‖₁` con unas pocas soluciones O(n²) con `A` y `Aᵀ`.
+
+    Algoritmo de Hager–Higham (el de `gecon` de LAPACK): cota inferior, casi siempre exacta
+    o a un factor ~3. `solve(x)` resuelve `A y = x` y `solve_t(x)`, `Aᵀ y = x`.
+
+    Referencia: N. J. Higham, "FORTRAN codes for estimating the one-norm of a real or
+    complex matrix", ACM TOMS 14(4), 1988.
+    """
+    x = np.full(n, 1.0 / n)
+    est = 0.0
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(RCOND_ITERS):
+            y = solve(x)
+            new = float(np.abs(y).sum())
+            if not np.isfinite(new):
+                return np.inf
+            if new <= est:
+                break
+            est = new
+            z = solve_t(np.where(y >= 0, 1.0, -1.0))
+            j = int(np.argmax(np.abs(z)))
+            if abs(z[j]) <= z @ x:
+                break
+            x = np.zeros(n)
+            x[j] = 1.0
+        # Vector alternante de Higham: cubre los casos en que el ascenso se detiene antes
+        alt = (-1.0) ** np.arange(n) * (1.0 + np.arange(n) / max(n - 1, 1))
+        extra = 2.0 * float(np.abs(solve(alt)).sum()) / (3.0 * n)
+    return max(est, extra) if np.isfinite(extra) else np.inf
+
+
+def _well_conditioned(A: np.ndarray, norm_inv: float) -> bool:
+    """`1 / (‖A‖₁ ‖A^{-1}‖₁) >= RCOND_MIN` (épsilon de `float32` si `A` es `float32`)."""
+    tol = max(RCOND_MIN, float(np.finfo(A.dtype).eps)) if A.dtype.kind == "f" else RCOND_MIN
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rcond = 1.0 / (float(np.abs(A).sum(axis=0).max()) * norm_inv)
+    return bool(np.isfinite(rcond) and rcond >= tol)
+
+
+def solve(A: np.ndarray, B: np.ndarray, kind: str) -> Optional[Solved]:
+    """Resuelve `AX = B` con la vía especializada de `kind` (ver `detect`).
+
+    Retorna `(|A|, X, método)`; `|A|` se acumula en escala logarítmica (`None` si no es
+    representable en `float`, como `matrix_ops.det`). `X` es `None` si algún pivote es cero
+    o si `A` está mal condicionada (`rcond < RCOND_MIN`, el mismo criterio que la LU
+    general; la condición se estima con `inv_norm1`, exacta para la diagonal). Retorna
+    `None` si la vía no aplica (tridiagonal no dominante, Cholesky fallida o
+    `kind == "general"`).
+    """
+    n = A.shape[0]
+    diag = np.diag(A)
+    if kind in ("diagonal", "lower", "upper"):
+        method = "diagonal" if kind == "diagonal" else "triangular"
+        if not diag.all():
+            return 0.0, None, method
+        detA = _log_det(diag.astype(float))
+        if kind == "diagonal":
+            if not _well_conditioned(A, float(np.max(1.0 / np.abs(diag)))):
+                return detA, None, method
+            return detA, B / (diag[:, None] if B.ndim == 2 else diag), method
+        lower = kind == "lower"
+        solve_a = tri_solver(A, lower)
+        if not _well_conditioned(A, inv_norm1(n, solve_a, lambda x: solve_a(x, True))):
+            return detA, None, method
+        return detA, solve_a(B), method
+    if kind == "tridiagonal":
+        f = _thomas(A)
+        if f is None:
+            return None
+        # A = L U con L unitaria: |A| = Π m_i
+        detA = _log_det(f[1])
+        if not _well_conditioned(A, inv_norm1(n, lambda x: _thomas_solve(f, x), lambda x: _thomas_solve(f, x, True))):
+            return detA, None, "thomas"
+        return detA, _thomas_solve(f, B), "thomas"
+    if kind == "spd":
+        try:
+            L = np.linalg.cholesky(A)
+        except np.linalg.LinAlgError:
+            return None
+        # |A| = (Π l_ii)²
+        detA = _log_det(np.diag(L), power=2)
+
+        solve_l = tri_solver(L, lower=True)
+
+        def chol_solve(X):
+            return solve_l(solve_l(X), True)
+
+        if not _well_conditioned(A, inv_norm1(n, chol_solve, chol_solve)):
+            return detA, None, "cholesky"
+        return detA, chol_solve(B), "cholesky"
+    return None
@@ -3,13 +3,18 @@
 Incluye conversión polar↔cartesiano, operaciones básicas (suma, resta, punto, cruz) y
 generación de especificación de trazado con control de rejilla.
 
+Las funciones `*_batch` operan sobre arreglos de `k` vectores (forma `(k, 2)` o `(k, 3)`)
+con operaciones NumPy por columnas, sin bucles de Python: miles de vectores se procesan
+en una sola pasada. En 3D la forma polar es esférica: `(magnitud, azimut, elevación)`.
+
 Referencias:
 - Trigonometría en Python: `math` (https://docs.python.org/3/library/math.html)
+- `np.arctan2`/`np.hypot`: https://numpy.org/doc/stable/reference/routines.math.html
 - Plotly (anotaciones y shapes): https://plotly.com/javascript/shapes/
 """
 
 import math
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import numpy as np
 
 
@@ -52,6 +57,100 @@ def cross(u: np.ndarray, v: np.ndarray):
     return float(u[0] * v[1] - u[1] * v[0])
 
 
+def check_batch(name: str, V: np.ndarray) -> np.ndarray:
+    """Valida un lote de vectores: arreglo `(k, 2)` o `(k, 3)` con `k ≥ 1`."""
+    V = np.asarray(V, dtype=float)
+    if V.ndim != 2 or V.shape[1] not in (2, 3) or V.shape[0] == 0:
+        raise ValueError(f"'{name}' debe ser una lista de vectores de 2 o 3 componentes")
+    return V
+
+
+def to_components_batch(P: np.ndarray, name: str = "polar") -> np.ndarray:
+    """Convierte filas polares a componentes.
+
+    - 2D: `(mag, deg)` → `(x, y)`.
+    - 3D: `(mag, azimut, elevación)` en grados → `(x, y, z)`.
+    """
+    P = check_batch(name, P)
+    mag = P[:, 0]
+    az = np.radians(P[:, 1])
+    if P.shape[1] == 2:
+        return np.column_stack((mag * np.cos(az), mag * np.sin(az)))
+    el = np.radians(P[:, 2])
+    horiz = mag * np.cos(el)
+    return np.column_stack((horiz * np.cos(az), horiz * np.sin(az), mag * np.sin(el)))
+
+
+def from_components_batch(V: np.ndarray) -> np.ndarray:
+    """Convierte filas de componentes a forma polar (inversa de `to_components_batch`).
+
+    Los ángulos de vectores nulos valen 0, como en `from_components`.
+    """
+    V = check_batch("componentes", V)
+    x, y = V[:, 0], V[:, 1]
+    if V.shape[1] == 2:
+        # `arctan2(0, 0)` ya es 0: no hace falta tratar aparte los vectores nulos
+        return np.column_stack((np.hypot(x, y), np.degrees(np.arctan2(y, x))))
+    horiz = np.hypot(x, y)
+    z = V[:, 2]
+    return np.column_stack((np.hypot(horiz, z), np.degrees(np.arctan2(y, x)), np.degrees(np.arctan2(z, horiz))))
+
+
+def batch(U: np.ndarray, V: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """Operaciones por pares `(u_i, v_i)` sobre lotes de vectores en componentes.
+
+    Retorna `u`, `uPolar` y `resultant` (suma de todos los `u_i`); si se da `V` (de la
+    misma forma que `U`) agrega `v`, `vPolar`, `sum`, `diff`, `dot` (forma `(k,)`) y
+    `cross`: componente z `(k,)` en 2D o vectores `(k, 3)` en 3D.
+    """
+    U = check_batch("u", U)
+    out: Dict[str, Any] = {"u": U, "uPolar": from_components_batch(U), "resultant": U.sum(axis=0)}
+    if V is None:
+        return out
+    V = check_batch("v", V)
+    if V.shape != U.shape:
+        raise ValueError("'u' y 'v' deben tener la misma cantidad de vectores y de componentes")
+    if U.shape[1] == 2:
+        cp = U[:, 0] * V[:, 1] - U[:, 1] * V[:, 0]
+    else:
+        cp = np.cross(U, V)
+    out.update({
+        "v": V,
+        "vPolar": from_components_batch(V),
+        "sum": U + V,
+        "diff": U - V,
+        "dot": np.einsum("ij,ij->i", U, V),
+        "cross": cp,
+    })
+    return out
+
+
+# Modos de rejilla de `plot_data` (`show.grid.mode`):
+# - `shapes` (por defecto): una línea por `shape` (formato original).
+# - `path`: un trazo SVG de varios segmentos por capa (menor y principal).
+# - `axis`: la dibuja Plotly con `dtick` y `minor` del eje; sin `shapes` (respuesta compacta).
+GRID_MODES = ("shapes", "path", "axis")
+# Máximo de líneas por eje y capa en todos los modos
+GRID_MAX_LINES = 200
+
+
+def _grid_values(vmin: float, vmax: float, step: float) -> np.ndarray:
+    """Múltiplos de `step` en `[vmin, vmax]` (a lo más `GRID_MAX_LINES`), con `np.arange`."""
+    if step <= 0:
+        return np.empty(0)
+    start = math.floor(vmin / step) * step
+    count = min(GRID_MAX_LINES, int(math.floor((vmax + 1e-12 - start) / step)) + 1)
+    return np.round(start + step * np.arange(max(count, 0)), 12)
+
+
+def _capped_step(vmin: float, vmax: float, step: float) -> float:
+    """Menor múltiplo entero de `step` que deja a lo más `GRID_MAX_LINES` líneas en `[vmin, vmax]`."""
+    if step <= 0:
+        return step
+    lines = (vmax - vmin) / step + 1
+    return step * max(1, math.ceil(lines / GRID_MAX_LINES))
+
+
 def _axis_limits(points, pad=0.1):
     """Cálculo de rangos de ejes X/Y con holgura `pad`.
 
@@ -71,7 +170,8 @@ def _axis_limits(points, pad=0.1):
 def plot_data(u: np.ndarray, v: np.ndarray, show: Dict[str, Any]):
     """Genera datos y layout para graficar `u`, `v`, `u+v`, `u−v` en Plotly.
 
-    `show.grid` permite personalizar rejilla principal y menor, con control de densidad.
+    `show.grid` permite personalizar rejilla principal y menor, con control de densidad;
+    `show.grid.mode` elige cómo se codifica (ver `GRID_MODES`; por defecto `shapes`).
     """
     show = show or {}
     s = add(u, v)
@@ -122,53 +222,45 @@ def plot_data(u: np.ndarray, v: np.ndarray, show: Dict[str, Any]):
         minor_dash = grid_cfg.get("minorDash", "dot")
         show_minor = bool(grid_cfg.get("showMinor", True))
 
-        def frange(vmin, vmax, step):
-            if step <= 0:
-                return []
-            start = math.floor(vmin / step) * step
-            vals = []
-            x = start
-            # Protección frente a errores de punto flotante y rejillas densas
-            count = 0
-            limit = 200
-            while x <= vmax + 1e-12 and count < limit:
-                vals.append(round(x, 12))
-                x += step
-                count += 1
-            return vals
-
-        # Rejilla menor (debajo)
-        if show_minor:
-            for xv in frange(xr[0], xr[1], minor_step_x):
-                if abs(xv) < 1e-12:
-                    continue  # La línea 0 se dibuja como principal
+        grid_mode = grid_cfg.get("mode", "shapes")
+        if grid_mode not in GRID_MODES:
+            raise ValueError(f"Modo de rejilla no válido: {grid_mode}")
+
+        def layer(step_x, step_y, color, width, dash, skip_zero):
+            """Líneas verticales y horizontales de una capa de rejilla (según `grid_mode`)."""
+            xs = _grid_values(xr[0], xr[1], step_x)
+            ys = _grid_values(yr[0], yr[1], step_y)
+            if skip_zero:
+                # La línea 0 se dibuja como principal
+                xs = xs[np.abs(xs) >= 1e-12]
+                ys = ys[np.abs(ys) >= 1e-12]
+            line = {"color": color, "width": width, "dash": dash}
+            if grid_mode == "path":
+                # Un solo trazo SVG con todos los segmentos de la capa
+                y0, y1, x0, x1 = (float(t) for t in (*yr, *xr))
+                path = "".join(f"M{x!r},{y0!r}V{y1!r}" for x in xs.tolist())
+                path += "".join(f"M{x0!r},{y!r}H{x1!r}" for y in ys.tolist())
+                if path:
+                    shapes.append({"type": "path", "xref": "x", "yref": "y", "layer": "below", "path": path, "line": line})
+                return
+            for xv in xs.tolist():
                 shapes.append({
                     "type": "line", "xref": "x", "yref": "y", "layer": "below",
-                    "x0": xv, "x1": xv, "y0": yr[0], "y1": yr[1],
-                    "line": {"color": minor_color, "width": minor_width, "dash": minor_dash}
+                    "x0": xv, "x1": xv, "y0": yr[0], "y1": yr[1], "line": line,
                 })
-            for yv in frange(yr[0], yr[1], minor_step_y):
-                if abs(yv) < 1e-12:
-                    continue
+            for yv in ys.tolist():
                 shapes.append({
                     "type": "line", "xref": "x", "yref": "y", "layer": "below",
-                    "x0": xr[0], "x1": xr[1], "y0": yv, "y1": yv,
-                    "line": {"color": minor_color, "width": minor_width, "dash": minor_dash}
+                    "x0": xr[0], "x1": xr[1], "y0": yv, "y1": yv, "line": line,
                 })
 
-        # Rejilla principal (debajo) alineada con las marcas principales
-        for xv in frange(xr[0], xr[1], main_step_x):
-            shapes.append({
-                "type": "line", "xref": "x", "yref": "y", "layer": "below",
-                "x0": xv, "x1": xv, "y0": yr[0], "y1": yr[1],
-                "line": {"color": main_color, "width": main_width, "dash": main_dash}
-            })
-        for yv in frange(yr[0], yr[1], main_step_y):
-            shapes.append({
-                "type": "line", "xref": "x", "yref": "y", "layer": "below",
-                "x0": xr[0], "x1": xr[1], "y0": yv, "y1": yv,
-                "line": {"color": main_color, "width": main_width, "dash": main_dash}
-            })
+        # En modo `axis` la rejilla la dibuja Plotly desde `dtick` y `minor` (ver layout)
+        if grid_mode != "axis":
+            # Rejilla menor (debajo)
+            if show_minor:
+                layer(minor_step_x, minor_step_y, minor_color, minor_width, minor_dash, skip_zero=True)
+            # Rejilla principal (debajo) alineada con las marcas principales
+            layer(main_step_x, main_step_y, main_color, main_width, main_dash, skip_zero=False)
 
     def arrow(x0, y0, x1, y1, text, color="black", width=2):
         """Crea una flecha que representa un vector en la gráfica.
@@ -277,5 +369,20 @@ def plot_data(u: np.ndarray, v: np.ndarray, show: Dict[str, Any]):
         "xaxis_fixedrange": False,
         "yaxis_fixedrange": False,
     }
+    if grid_enabled and grid_mode == "axis":
+        # Rejilla nativa de Plotly: principal por `dtick` y menor por `minor.dtick`,
+        # con pasos ampliados para respetar `GRID_MAX_LINES` como en los demás modos
+        for axis, rng, main_step, minor_step in (
+            ("xaxis", xr, main_step_x, minor_step_x),
+            ("yaxis", yr, main_step_y, minor_step_y),
+        ):
+            layout[axis].update({
+                "dtick": _capped_step(rng[0], rng[1], main_step),
+                "gridcolor": main_color, "gridwidth": main_width, "griddash": main_dash,
+                "minor": {
+                    "dtick": _capped_step(rng[0], rng[1], minor_step), "showgrid": show_minor,
+                    "gridcolor": minor_color, "gridwidth": minor_width, "griddash": minor_dash,
+                },
+            })
 
     return {"data": data, "layout": layout}
\ No newline at end of file
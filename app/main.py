@@ -11,18 +11,49 @@ Referencias:
 - NumPy (álgebra lineal): https://numpy.org/doc/stable/
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import List, Optional, Literal, Dict, Any
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import List, Optional, Literal, Dict, Any, Mapping, Union
 import numpy as np
 
 from .utils.parsing import parse_matrix, parse_vector
-from .core import matrix_ops, linear_systems, vectors
+from .utils import metrics, payloads, responses, streaming, warmup
+from .utils.responses import ArrayJSONResponse
+from .utils.cache import ResultCache
+from .utils.scheduler import Scheduler, SchedulerBusy, estimate_flops
+from .utils.store import MatrixStore
+from .utils.assets import StaticAssets
+from .utils.blas import BlasThreads, default_budget
+from . import config
+from .core import matrix_ops, linear_systems, vectors, batch, sparse, iterative
 
+# Valores de la opción `dtype` (ver `parsing.FLOAT_DTYPES`)
+FloatDType = Literal["float64", "float32"]
 
-class MatrixOperateRequest(BaseModel):
+
+class MatrixOperateOptions(BaseModel):
+    """Opciones escalares de `/api/matrix/operate` (en formatos binarios llegan por query).
+
+    - `op`: operación a ejecutar: `add` (suma), `sub` (resta), `mul` (multiplicación), `det` (determinante), `inv` (inversa), `trans` (traspuesta), `pow` (potencia entera).
+    - `target`: objetivo para operaciones unarias (`A` o `B`). Si no se indica, se usa `A`.
+    - `exact`: aritmética racional exacta (resultados como texto `"p/q"`).
+    - `exponent`: exponente entero de `pow` (negativo: potencia de la inversa).
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas; no admite `exact`).
+    """
+    op: Literal["add", "sub", "mul", "det", "inv", "trans", "pow"]
+    target: Optional[Literal["A", "B"]] = None
+    exact: bool = False
+    exponent: Optional[int] = None
+    dtype: FloatDType = "float64"
+
+
+class MatrixOperateRequest(MatrixOperateOptions):
     """Modelo de entrada para operaciones de matrices.
 
     Propósito: encapsular las matrices `A` y `B` en formato de texto y la operación a realizar.
@@ -30,29 +61,119 @@ class MatrixOperateRequest(BaseModel):
     Atributos:
     - `A`: matriz A como lista de listas de strings (acepta enteros, decimales y fracciones "a/b").
     - `B`: matriz B opcional en el mismo formato que A.
-    - `op`: operación a ejecutar: `add` (suma), `sub` (resta), `mul` (multiplicación), `det` (determinante), `inv` (inversa), `trans` (traspuesta).
+    - `op`: operación a ejecutar: `add` (suma), `sub` (resta), `mul` (multiplicación), `det` (determinante), `inv` (inversa), `trans` (traspuesta), `pow` (potencia entera).
     - `target`: objetivo para operaciones unarias (`A` o `B`). Si no se indica, se usa `A`.
+    - `exponent`: exponente entero de `pow`, obligatorio en esa operación (negativo: potencia de la inversa).
+    - `exact`, `dtype`: como en `MatrixOperateOptions`.
 
     Ejemplo:
     >>> MatrixOperateRequest(A=[["1","2"],["3","4"]], B=[["5","6"],["7","8"]], op="add")
+    >>> MatrixOperateRequest(A=[["1","1"],["0","1"]], op="pow", exponent=3)
     """
     A: List[List[str]]
     B: Optional[List[List[str]]] = None
-    op: Literal["add", "sub", "mul", "det", "inv", "trans"]
+
+
+class MatrixBatchJob(BaseModel):
+    """Trabajo de un lote: como `MatrixOperateRequest`, con `A`/`B` como grilla o ID guardado.
+
+    Los lotes admiten las mismas operaciones que `MatrixOperateOptions`, incluida `pow`.
+    - `target`, `exact` y `dtype`: como en `MatrixOperateOptions`; los trabajos exactos se
+      ejecutan uno a uno con `core.exact` (Bareiss), sin apilar.
+    - `exponent`: exponente entero de `pow` (obligatorio en esa operación); los trabajos con
+      el mismo exponente no negativo y la misma forma se apilan.
+    """
+    op: Literal["add", "sub", "mul", "det", "inv", "trans", "pow"]
     target: Optional[Literal["A", "B"]] = None
+    exact: bool = False
+    exponent: Optional[int] = None
+    dtype: FloatDType = "float64"
+    A: Union[List[List[str]], str]
+    B: Optional[Union[List[List[str]], str]] = None
+
+
+class MatrixBatchRequest(BaseModel):
+    """Lote de operaciones matriciales para ejecutar en una sola llamada.
+
+    - `jobs`: lista de trabajos con el mismo formato que `MatrixOperateRequest`
+      (las matrices pueden ser IDs de `/api/matrix/store`).
+    """
+    jobs: List[MatrixBatchJob]
+
+
+class MatrixChainOptions(BaseModel):
+    """Opciones de `/api/matrix/chain`.
+
+    - `exact`: aritmética racional exacta (resultados como texto `"p/q"`).
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas; no admite `exact`).
+    """
+    exact: bool = False
+    dtype: FloatDType = "float64"
+
+
+class MatrixChainRequest(MatrixChainOptions):
+    """Producto de varias matrices `A1 · A2 ⋯ Ak`.
+
+    - `matrices`: lista de matrices (grilla de strings o ID de `/api/matrix/store`).
+    """
+    matrices: List[Union[List[List[str]], str]]
+
 
+class MatrixStoreOptions(BaseModel):
+    """Opciones de `/api/matrix/store`.
 
-class LinearCramerRequest(BaseModel):
+    - `exact`: guardar la matriz en aritmética racional exacta (`Fraction`).
+    - `dtype`: guardar la matriz en `float64` (por defecto) o `float32` (la mitad de memoria).
+    """
+    exact: bool = False
+    dtype: FloatDType = "float64"
+
+
+class MatrixStoreRequest(MatrixStoreOptions):
+    """Matriz a guardar en el servidor (mismos formatos que los campos matriciales).
+
+    - `A`: grilla de strings, grilla numérica, matriz dispersa o binario (`.npy`, float64).
+    """
+    A: List[List[str]]
+
+
+class LinearCramerOptions(BaseModel):
+    """Opciones escalares de `/api/linear/cramer`.
+
+    - `includeMatrices`: incluir las matrices `A_k` en la respuesta (por defecto `True`).
+    - `exact`: aritmética racional exacta (eliminación de Bareiss).
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas; no admite `exact`).
+    """
+    includeMatrices: bool = True
+    exact: bool = False
+    dtype: FloatDType = "float64"
+
+
+class LinearCramerRequest(LinearCramerOptions):
     """Entrada para resolver un sistema lineal por la Regla de Cramer.
 
     - `A`: matriz de coeficientes como grilla de strings.
     - `b`: vector independiente como lista de strings.
+    - `includeMatrices`: incluir las matrices `A_k` en la respuesta (por defecto `True`).
     """
     A: List[List[str]]
     b: List[str]
 
 
-class LinearInverseRequest(BaseModel):
+class LinearInverseOptions(BaseModel):
+    """Opciones escalares de `/api/linear/inverse`.
+
+    - `exact`: aritmética racional exacta (eliminación de Bareiss).
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas; no admite `exact`).
+    """
+    exact: bool = False
+    dtype: FloatDType = "float64"
+
+
+class LinearInverseRequest(LinearInverseOptions):
     """Entrada para resolver un sistema lineal por método de la inversa.
 
     - `A`: matriz cuadrada de coeficientes.
@@ -62,6 +183,61 @@ class LinearInverseRequest(BaseModel):
     b: List[str]
 
 
+class LinearSolveOptions(BaseModel):
+    """Opciones escalares de `/api/linear/solve`.
+
+    - `includeInverse`: devolver también `A^{-1}` (por defecto `False`).
+    - `exact`: aritmética racional exacta (eliminación de Bareiss).
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas; no admite `exact`).
+    """
+    includeInverse: bool = False
+    exact: bool = False
+    dtype: FloatDType = "float64"
+
+
+class LinearSolveRequest(LinearSolveOptions):
+    """Entrada para resolver `AX = B` con varios lados derechos (factorización LU).
+
+    - `A`: matriz cuadrada de coeficientes.
+    - `B`: matriz `(n, k)`; cada columna es un vector independiente `b`.
+    - `includeInverse`: devolver también `A^{-1}` (por defecto `False`).
+    """
+    A: List[List[str]]
+    B: List[List[str]]
+
+
+class LinearIterativeOptions(BaseModel):
+    """Opciones escalares de `/api/linear/iterative`.
+
+    - `method`: `cg` (simétrica definida positiva), `gmres` (general), `jacobi` o `gauss_seidel`.
+    - `tol`: tolerancia relativa del residuo `‖b − Ax‖ / ‖b‖`.
+    - `maxIter`: máximo de iteraciones (por defecto `n` en `cg`/`gmres` y 1000 en los demás).
+    - `preconditioner`: `none` o `jacobi` (diagonal; sólo `cg` y `gmres`).
+    - `restart`: iteraciones entre reinicios de `gmres`.
+    - `dtype`: precisión de punto flotante de entradas y resultados: `float64` (por defecto)
+      o `float32` (la mitad de memoria, ~7 cifras significativas).
+    """
+    method: Literal["cg", "gmres", "jacobi", "gauss_seidel"] = "cg"
+    tol: float = 1e-8
+    maxIter: Optional[int] = None
+    preconditioner: Literal["none", "jacobi"] = "none"
+    restart: int = 50
+    dtype: FloatDType = "float64"
+
+
+class LinearIterativeRequest(LinearIterativeOptions):
+    """Entrada para resolver `Ax = b` con un método iterativo.
+
+    - `A`: matriz cuadrada (grilla o formato disperso COO/CSR).
+    - `b`: vector independiente.
+    - `x0`: aproximación inicial opcional (por defecto, el vector cero).
+    """
+    A: List[List[str]]
+    b: List[str]
+    x0: Optional[List[str]] = None
+
+
 class VectorsRequest(BaseModel):
     """Entrada para cálculos de vectores 2D y especificación de visualización.
 
@@ -75,132 +251,607 @@ class VectorsRequest(BaseModel):
     show: Dict[str, Any]
 
 
-app = FastAPI(title="Calculadora de Matrices, Ecuaciones y Vectores")
-# Monta archivos estáticos para la interfaz (HTML/JS/CSS)
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+class VectorsBatchOptions(BaseModel):
+    """Opciones escalares de `/api/vectors/batch`.
+
+    - `inputMode`: `cart` (filas de componentes) o `polar` (filas `[mag, deg]` en 2D,
+      `[mag, azimut, elevación]` en 3D; ángulos en grados).
+    """
+    inputMode: Literal["polar", "cart"] = "cart"
+
+
+class VectorsBatchRequest(VectorsBatchOptions):
+    """Entrada para operar lotes de vectores 2D/3D.
+
+    - `u`: lista de `k` vectores (filas de 2 o 3 valores).
+    - `v`: lista opcional de `k` vectores de la misma forma; se opera por pares `(u_i, v_i)`.
+    """
+    u: List[List[str]]
+    v: Optional[List[List[str]]] = None
+
+
+# Caché LRU de resultados de matrices y sistemas (configurable por variables de entorno)
+result_cache = ResultCache(config.CACHE_MAX_ENTRIES, config.CACHE_MAX_BYTES, enabled=config.CACHE_ENABLED)
+# Hilos de BLAS: presupuesto por worker de uvicorn y un solo hilo para llamadas pequeñas
+blas_threads = BlasThreads(config.BLAS_THREADS or default_budget(config.WEB_WORKERS), config.BLAS_PARALLEL_MIN_FLOPS)
+blas_threads.apply()
+# Cálculos pesados (O(n³) grandes) se envían a un pool de procesos acotado
+scheduler = Scheduler(config.OFFLOAD_WORKERS, config.OFFLOAD_MIN_FLOPS, config.OFFLOAD_MAX_PENDING, blas=blas_threads)
+# Matrices subidas una vez y referenciadas por ID en peticiones posteriores
+matrix_store = MatrixStore(config.STORE_MAX_BYTES, config.STORE_TTL)
+
+
+# Duración de las fases de arranque y preparación de la instancia (ver `utils.warmup`)
+startup = warmup.StartupProfile()
+startup.record("imports", warmup.process_age())
+
+
+def _warmup_steps() -> List[warmup.Step]:
+    """Pasos de `core` más la primera decodificación, serialización y (opcional) el pool."""
+    sample = payloads.RawPayload(
+        "application/json", b'{"op": "mul", "A": [["1", "2"], ["3", "4"]], "B": [["1", "0"], ["0", "1"]]}', {}, {},
+    )
+    steps = warmup.core_steps()
+    steps.append(("warmup.decode", lambda: _decode(sample, MatrixOperateOptions, MatrixOperateRequest, {"A": "matrix", "B": "matrix"})))
+    steps.append(("warmup.serialize", lambda: ArrayJSONResponse({"result": np.eye(4), "det": 1.0})))
+    if config.WARMUP_POOL:
+        steps.append(("warmup.scheduler", lambda: scheduler.warm(matrix_ops.det, np.eye(2))))
+    return steps
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ciclo de vida de la aplicación.
+
+    Al iniciar, precalienta las rutinas en un hilo (según `config.WARMUP_MODE`) para no
+    retrasar el arranque del servidor; al apagar, detiene el pool de procesos.
+    """
+    if config.WARMUP_MODE == "off":
+        startup.ready.set()
+    else:
+        threading.Thread(target=warmup.run, args=(startup, _warmup_steps()), name="warmup", daemon=True).start()
+    yield
+    scheduler.shutdown()
+
+
+app = FastAPI(
+    title="Calculadora de Matrices, Ecuaciones y Vectores",
+    lifespan=lifespan,
+    default_response_class=ArrayJSONResponse,
+)
+# Tiempos por etapa: cabecera `Server-Timing` e histogramas para `/metrics`
+app.add_middleware(metrics.TimingMiddleware)
+# Archivos de la interfaz (HTML/JS/CSS) leídos y comprimidos una sola vez al iniciar
+with startup.phase("static"):
+    static_assets = StaticAssets("app/static")
+
+
+async def read_payload(request: Request) -> payloads.RawPayload:
+    """Dependencia que lee el cuerpo crudo para decodificarlo según `Content-Type`.
+
+    La decodificación (parseo de grillas, `np.frombuffer`) se hace en el endpoint síncrono,
+    fuera del bucle de eventos.
+    """
+    return payloads.RawPayload(
+        content_type=request.headers.get("content-type", ""),
+        body=await request.body(),
+        query=request.query_params,
+        headers=request.headers,
+    )
+
+
+def _body_docs(model) -> Dict[str, Any]:
+    """Documenta en OpenAPI los formatos de cuerpo aceptados por un endpoint matricial."""
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    return {"requestBody": {"required": True, "content": {
+        "application/json": {"schema": model.model_json_schema()},
+        payloads.NPY_TYPE: binary,
+        payloads.NPZ_TYPE: binary,
+        payloads.RAW_TYPE: binary,
+    }}}
+
+
+def _decode(raw: payloads.RawPayload, options_model, request_model, kinds):
+    """Decodifica la petición con `payloads.decode` y traduce errores de validación a 422."""
+    try:
+        return payloads.decode(raw, options_model, request_model, kinds, store=matrix_store)
+    except ValidationError as e:
+        where = "query" if payloads.is_binary(raw) else "body"
+        raise RequestValidationError(
+            [{**err, "loc": (where,) + tuple(err["loc"])} for err in e.errors(include_context=False)]
+        )
+
+
+def _encode(result: Dict[str, Any], query: Mapping[str, str], headers: Mapping[str, str]):
+    """Codifica `result` con `ArrayJSONResponse` (o NDJSON si se pidió), midiendo `serialize`.
+
+    `?precision=N` redondea los valores a `N` decimales; con `Accept-Encoding: gzip` los
+    cuerpos grandes se comprimen (ver `utils.responses`).
+    """
+    try:
+        precision = responses.parse_precision(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if streaming.wants_ndjson(query, headers.get("accept", "")):
+        if precision is not None:
+            result = responses.round_floats(result, precision)
+        return StreamingResponse(streaming.iter_ndjson(result), media_type=streaming.NDJSON_TYPE)
+    with metrics.stage("serialize"):
+        return ArrayJSONResponse(result, precision=precision, accept_encoding=headers.get("accept-encoding", ""))
+
+
+def _respond(raw: payloads.RawPayload, result: Dict[str, Any]):
+    """Entrega el resultado como JSON o, si el cliente lo pide, en streaming NDJSON.
+
+    Los resultados llegan con `np.ndarray`; ambos formatos los codifican directamente desde
+    el arreglo (`ArrayJSONResponse`, `streaming.iter_ndjson`) sin `tolist()` completo.
+    """
+    return _encode(result, raw.query, raw.headers)
+
+
+def _json(request: Request, content: Dict[str, Any]) -> ArrayJSONResponse:
+    """Como `_respond`, para endpoints que reciben el cuerpo como modelo Pydantic."""
+    return _encode(content, request.query_params, request.headers)
+
+
+def _flops(op: str, *arrays: Any, exact: bool = False) -> float:
+    """Costo estimado para el planificador; con operandos dispersos, según no nulos y banda."""
+    if any(sparse.is_sparse(a) for a in arrays):
+        return sparse.estimate_flops(op, *arrays)
+    return estimate_flops(op, *(None if a is None else a.shape for a in arrays), exact=exact)
 
 
-@app.get("/", response_class=HTMLResponse)
-def index():
-    """Sirve la página principal HTML.
+def _compute(endpoint: str, options: Dict[str, Any], arrays: Dict[str, Any], compute):
+    """Ejecuta `compute` a través de la caché, midiendo la etapa `compute`.
 
-    Retorna: contenido HTML de `app/static/index.html`.
-    Nota: se utiliza lectura simple de archivo; FastAPI lo entrega como `HTMLResponse`.
+    También etiqueta la petición con la operación y la dimensión mayor de los operandos
+    para los histogramas de `/metrics`.
     """
-    # Carga el HTML de la interfaz
-    with open("app/static/index.html", "r", encoding="utf-8") as f:
-        return f.read()
+    sizes = [max(a.shape) for a in arrays.values() if a is not None]
+    metrics.annotate(op=options.get("op", endpoint.split("/")[-1]), size=max(sizes) if sizes else None)
+    dtype = options.get("dtype", "float64")
+    if dtype != "float64":
+        # El resultado se guarda y se serializa en la precisión pedida (`responses.cast_floats`)
+        compute = (lambda fn: lambda: responses.cast_floats(fn(), dtype))(compute)
+    with metrics.stage("compute"):
+        return result_cache.get_or_compute(endpoint, options, arrays, compute)
+
+
+@app.exception_handler(SchedulerBusy)
+def scheduler_busy_handler(request: Request, exc: SchedulerBusy):
+    """Responde 503 cuando no hay capacidad para otro cálculo pesado."""
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
+def index(request: Request):
+    """Sirve la página principal HTML (`app/static/index.html`) desde memoria.
+
+    Usa la variante comprimida según `Accept-Encoding` y responde 304 si el ETag coincide
+    (ver `utils.assets`).
+    """
+    return static_assets.get("index.html").response(request.headers)
+
+
+@app.api_route("/static/{name:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def static_file(name: str, request: Request):
+    """Sirve `app.js`, `styles.css` y demás archivos de `app/static` desde memoria; 404 si no existe."""
+    asset = static_assets.get(name)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return asset.response(request.headers)
 
 
 @app.get("/health")
 def health():
-    """Endpoint de salud para Render/monitoreo."""
-    return {"status": "ok"}
+    """Endpoint de salud para Render/monitoreo.
+
+    Con `CALC_WARMUP=gate` responde 503 (`"warming"`) hasta que termina el precalentamiento,
+    para que el balanceador no envíe tráfico a una instancia fría.
+    """
+    ready = startup.ready.is_set()
+    if not ready and config.WARMUP_MODE == "gate":
+        return JSONResponse({"status": "warming", "ready": False}, status_code=503)
+    return {"status": "ok", "ready": ready}
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Métricas en formato Prometheus: histogramas por etapa, peticiones, caché y planificador."""
+    cache = result_cache.stats()
+    sched = scheduler.stats()
+    store = matrix_store.stats()
+    extra = {
+        "calc_cache_events_total": ("counter", "Eventos de la caché de resultados.", {
+            'event="hit"': cache["hits"], 'event="miss"': cache["misses"], 'event="eviction"': cache["evictions"],
+        }),
+        "calc_cache_bytes": ("gauge", "Bytes ocupados por la caché de resultados.", {"": cache["bytes"]}),
+        "calc_scheduler_jobs_total": ("counter", "Trabajos por ruta de ejecución.", {
+            'route="inline"': sched["inline"], 'route="offloaded"': sched["offloaded"], 'route="rejected"': sched["rejected"],
+        }),
+        "calc_store_bytes": ("gauge", "Bytes ocupados por las matrices guardadas.", {"": store["bytes"]}),
+    }
+    return PlainTextResponse(metrics.registry.render(extra), media_type="text/plain; version=0.0.4")
 
 
-@app.post("/api/matrix/operate")
-def matrix_operate(payload: MatrixOperateRequest):
+@app.get("/api/cache/stats")
+def cache_stats():
+    """Estado de la caché de resultados: aciertos, fallos, expulsiones y ocupación."""
+    return result_cache.stats()
+
+
+@app.get("/api/store/stats")
+def store_stats():
+    """Estado del almacén de matrices: entradas, bytes, expulsiones y expiraciones."""
+    return matrix_store.stats()
+
+
+@app.get("/api/scheduler/stats")
+def scheduler_stats():
+    """Estado del planificador: trabajos en línea, enviados al pool de procesos y rechazados."""
+    return scheduler.stats()
+
+
+@app.get("/api/blas/stats")
+def blas_stats():
+    """Hilos de BLAS: backend detectado, presupuesto por worker, umbral y llamadas con 1 hilo o en paralelo."""
+    return {"webWorkers": config.WEB_WORKERS, **blas_threads.stats()}
+
+
+@app.get("/api/startup/stats")
+def startup_stats():
+    """Perfil de arranque: duración (ms) de importaciones, estáticos y cada paso de precalentamiento."""
+    return startup.stats()
+
+
+@app.post("/api/matrix/operate", openapi_extra=_body_docs(MatrixOperateRequest))
+def matrix_operate(raw: payloads.RawPayload = Depends(read_payload)):
     """Ejecuta operaciones matriciales sobre A y B.
 
     Parámetros:
-    - `payload`: `MatrixOperateRequest` con matrices como texto y el tipo de operación.
+    - `raw`: cuerpo de la petición; JSON `MatrixOperateRequest` (grillas de strings o numéricas),
+      `.npy`/`.npz` o búfer float64 con `X-Matrix-Shape` (ver `utils.payloads`).
 
     Flujo:
-    1. Convierte las entradas de texto a `np.ndarray(float)` con `parse_matrix`.
-    2. Selecciona la operación:
+    1. Decodifica las entradas a `np.ndarray(float)` (`parse_matrix` para texto, carga directa para formatos numéricos)
+       o `sparse.CSRMatrix` (JSON `{"format": "coo"|"csr", ...}`).
+    2. Elige representación densa o dispersa según la densidad medida (`sparse.select`).
+    3. Selecciona la operación:
        - Binaria: `add`, `sub`, `mul` usando `np.ndarray` y `np.dot`.
-       - Unaria: `det` (usa `np.linalg.det`), `inv` (usa `np.linalg.inv`), `trans` (traspuesta `A.T`).
-    3. Devuelve matriz resultado como listas (para JSON) o un escalar.
+       - Unaria: `det` e `inv` (una LU de LAPACK, `matrix_ops.DenseLU`), `trans` (traspuesta `A.T`).
+    4. Devuelve matriz resultado como listas (para JSON) o un escalar. Si alguna entrada
+       llegó en formato disperso, la matriz resultado se devuelve en formato COO.
 
     Retornos:
     - `{ "resultMatrix": List[List[float]] }` para operaciones con matriz de salida.
     - `{ "scalar": float }` para `det`.
+    - `inv` agrega `method`: vía usada según la estructura de la matriz (`diagonal`,
+      `triangular`, `thomas`, `cholesky`, `lu`, `bareiss`, `band_lu`).
+    - Con `exact=true`, los valores se devuelven como texto racional (`"7/3"`).
+    - Con `?stream=ndjson` o `Accept: application/x-ndjson`, la matriz resultado se emite
+      fila a fila en NDJSON (`utils.streaming`).
 
     Errores:
     - 400 si los tamaños son inválidos o la matriz no es cuadrada/invertible.
     """
     try:
-        # Parseo y validación de entradas desde strings a números (incluye fracciones "a/b")
-        A = parse_matrix(payload.A)
-        B = parse_matrix(payload.B) if payload.B is not None else None
+        # Parseo y validación de entradas (texto con fracciones "a/b", JSON numérico o binario)
+        payload, arrays = _decode(raw, MatrixOperateOptions, MatrixOperateRequest, {"A": "matrix", "B": "matrix"})
+        A, B = arrays["A"], arrays["B"]
     except ValueError as e:
         # Propaga errores de validación como HTTP 400
         raise HTTPException(status_code=400, detail=str(e))
 
     op = payload.op
+    options = {"op": op, "exact": payload.exact, "dtype": payload.dtype}
     try:
         # Operaciones binarias requieren B
         if op in ("add", "sub", "mul"):
             if B is None:
                 raise HTTPException(status_code=400, detail="Debe proporcionar la matriz B para esta operación")
-            if op == "add":
-                R = matrix_ops.add(A, B)
-            elif op == "sub":
-                R = matrix_ops.subtract(A, B)
-            else:
-                R = matrix_ops.multiply(A, B)  # usa `A.dot(B)` internamente
-            return {"resultMatrix": R.tolist()}
+
+            def compute():
+                fn = {"add": matrix_ops.add, "sub": matrix_ops.subtract, "mul": matrix_ops.multiply}[op]
+                X, Y = sparse.select(A, op), sparse.select(B, op)
+                # `multiply` usa `A.dot(B)`; productos grandes van al pool de procesos. La suma y
+                # la resta escriben sobre `A` si es un arreglo propio de la petición (no guardado)
+                kw = {} if op == "mul" else {"inplace": True}
+                out = scheduler.run(_flops(op, X, Y, exact=payload.exact), fn, X, Y, **kw)
+                return {"resultMatrix": sparse.match_format(out, A, B)}
+
+            return _respond(raw, _compute("matrix/operate", options, {"A": A, "B": B}, compute))
         # Operaciones unarias sobre A o B
-        elif op in ("det", "inv", "trans"):
+        elif op in ("det", "inv", "trans", "pow"):
             target = payload.target or "A"
             M = A if target == "A" else (B if B is not None else None)
             if M is None:
                 raise HTTPException(status_code=400, detail="Matriz objetivo no proporcionada")
-            if op == "det":
-                d = matrix_ops.det(M)  # usa `np.linalg.det`
-                return {"scalar": float(d)}
-            if op == "inv":
-                inv = matrix_ops.inv(M)  # valida |A| != 0 y usa `np.linalg.inv`
-                return {"resultMatrix": inv.tolist()}
-            tr = matrix_ops.transpose(M)  # acceso a traspuesta con `A.T`
-            return {"resultMatrix": tr.tolist()}
+            if op == "pow":
+                if payload.exponent is None:
+                    raise HTTPException(status_code=400, detail="Debe proporcionar el exponente para la potencia")
+                options["exponent"] = payload.exponent
+
+            def compute():
+                X = sparse.select(M, op)
+                flops = _flops(op, X, exact=payload.exact)
+                if op == "det":
+                    # usa la LU de `matrix_ops.DenseLU` (Bareiss en modo exacto, LU en banda si es dispersa);
+                    # `null` si |A| no cabe en `float`
+                    return {"scalar": scheduler.run(flops, matrix_ops.det, X)}
+                if op == "inv":
+                    # usa la vía según la estructura (o `getrf` + `getri`) y valida la condición de A
+                    Ainv, method = scheduler.run(flops, matrix_ops.inv, X, return_method=True)
+                    return {"resultMatrix": Ainv, "method": method}
+                if op == "pow":
+                    # cuadrados sucesivos: ~2·log2|k| productos (o diagonalización)
+                    steps = 2 * max(1, abs(payload.exponent).bit_length())
+                    P, method = scheduler.run(
+                        _flops("mul", X, X, exact=payload.exact) * steps,
+                        matrix_ops.power, X, payload.exponent, return_method=True,
+                    )
+                    return {"resultMatrix": sparse.match_format(P, M), "method": method}
+                # acceso a traspuesta con `A.T`
+                return {"resultMatrix": sparse.match_format(matrix_ops.transpose(X), M)}
+
+            # La clave usa sólo el operando objetivo: `det` de A cachea igual con o sin B
+            return _respond(raw, _compute("matrix/operate", options, {"M": M}, compute))
         else:
             raise HTTPException(status_code=400, detail="Operación no válida")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.post("/api/linear/cramer")
-def linear_cramer(payload: LinearCramerRequest):
+@app.post("/api/matrix/store", openapi_extra=_body_docs(MatrixStoreRequest))
+def matrix_store_put(raw: payloads.RawPayload = Depends(read_payload)):
+    """Guarda una matriz ya parseada y retorna su ID para usarla en otros endpoints.
+
+    Acepta los mismos formatos que `/api/matrix/operate` en el campo `A`. El ID
+    (`{"id": "m_...", "shape": [n, m], "nbytes": ..., "ttl": ...}`) puede enviarse luego en
+    lugar de cualquier grilla (`"A": "m_..."`). La matriz expira tras `ttl` segundos sin uso.
+
+    Errores:
+    - 400 si la matriz es inválida.
+    - 413 si excede el tamaño máximo del almacén.
+    """
+    try:
+        _, arrays = _decode(raw, MatrixStoreOptions, MatrixStoreRequest, {"A": "matrix"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    info = matrix_store.put(arrays["A"])
+    if info is None:
+        raise HTTPException(status_code=413, detail="La matriz excede el tamaño máximo del almacén")
+    return info
+
+
+@app.get("/api/matrix/store/{mid}")
+def matrix_store_info(mid: str):
+    """Metadatos de una matriz guardada (renueva su expiración); 404 si no existe."""
+    try:
+        return matrix_store.info(mid)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@app.delete("/api/matrix/store/{mid}")
+def matrix_store_delete(mid: str):
+    """Elimina una matriz guardada; 404 si no existe."""
+    if not matrix_store.delete(mid):
+        raise HTTPException(status_code=404, detail=f"Matriz '{mid}' no encontrada o expirada")
+    return {"deleted": mid}
+
+
+def _batch_operand(value: Any, exact: bool = False, dtype: str = "float64") -> np.ndarray:
+    """Operando de un trabajo por lotes: grilla de strings o matriz guardada (densa; `dtype` salvo en modo exacto)."""
+    if exact and dtype != "float64":
+        raise ValueError("El modo exacto no admite dtype float32")
+    if isinstance(value, str):
+        arr = sparse.to_dense(matrix_store.get(value))
+        return arr if exact and arr.dtype == object else np.asarray(arr, dtype=dtype)
+    return parse_matrix(value, exact=exact, dtype=dtype)
+
+
+@app.post("/api/matrix/chain")
+@metrics.records_validation
+def matrix_chain(payload: MatrixChainRequest, request: Request):
+    """Multiplica una lista de matrices en el orden de menor costo.
+
+    Flujo:
+    1. Parsea cada matriz (grilla o ID guardado) y valida que las formas encadenen.
+    2. `matrix_ops.multiply_chain` calcula la parentización óptima con programación
+       dinámica y multiplica en ese orden.
+
+    Retorna `resultMatrix`, `order` (p. ej. `"((A1·A2)·A3)"`), `cost` y `naiveCost`
+    (multiplicaciones escalares del orden elegido y de izquierda a derecha).
+
+    Errores:
+    - 400 si alguna matriz es inválida o las dimensiones no encadenan.
+    """
+    try:
+        with metrics.stage("parse"):
+            mats = [_batch_operand(M, exact=payload.exact, dtype=payload.dtype) for M in payload.matrices]
+        arrays = {f"A{i + 1}": M for i, M in enumerate(mats)}
+
+        def compute():
+            if not mats:
+                raise ValueError("Debe proporcionar al menos una matriz")
+            flops = 2.0 * matrix_ops.chain_order([M.shape for M in mats])[0]
+            product, info = scheduler.run(flops, matrix_ops.multiply_chain, mats, return_order=True)
+            return {"resultMatrix": product, **info}
+
+        options = {"op": "chain", "exact": payload.exact, "dtype": payload.dtype}
+        return _json(request, _compute("matrix/chain", options, arrays, compute))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/matrix/batch")
+@metrics.records_validation
+def matrix_batch(payload: MatrixBatchRequest, request: Request):
+    """Ejecuta muchas operaciones matriciales en una sola petición.
+
+    Flujo:
+    1. Parsea cada trabajo con `parse_matrix`; los errores de parseo o de operandos
+       faltantes se reportan en la posición del trabajo, sin abortar el lote.
+    2. Delega en `batch.run`, que agrupa trabajos de igual operación y forma y los
+       ejecuta como arreglos apilados `(k, n, n)` (`np.linalg.slogdet`, `np.linalg.inv`, `np.matmul`).
+       Los trabajos con `exact` se ejecutan uno a uno en aritmética racional (`"p/q"`).
+
+    Retorna `{ "results": [...] }` en el orden de `jobs`; cada elemento tiene
+    `resultMatrix`, `scalar` o `error`.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(payload.jobs)
+    jobs = []
+    positions = []
+    with metrics.stage("parse"):
+        for i, job in enumerate(payload.jobs):
+            try:
+                A = _batch_operand(job.A, job.exact, job.dtype)
+                B = _batch_operand(job.B, job.exact, job.dtype) if job.B is not None else None
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+                continue
+            if job.op in batch.BINARY_OPS:
+                if B is None:
+                    results[i] = {"error": "Debe proporcionar la matriz B para esta operación"}
+                    continue
+                jobs.append((job.op, A, B))
+            else:
+                M = A if (job.target or "A") == "A" else B
+                if M is None:
+                    results[i] = {"error": "Matriz objetivo no proporcionada"}
+                    continue
+                if job.op == "pow" and job.exponent is None:
+                    results[i] = {"error": "Debe proporcionar el exponente para la potencia"}
+                    continue
+                jobs.append((job.op, M, job.exponent if job.op == "pow" else None))
+            positions.append(i)
+
+    metrics.annotate(op="batch", size=max((max(j[1].shape) for j in jobs), default=None))
+    with metrics.stage("compute"):
+        computed = batch.run(jobs)
+    for i, res in zip(positions, computed):
+        results[i] = res
+    return _json(request, {"results": results})
+
+
+@app.post("/api/linear/cramer", openapi_extra=_body_docs(LinearCramerRequest))
+def linear_cramer(raw: payloads.RawPayload = Depends(read_payload)):
     """Resuelve un sistema lineal por la Regla de Cramer.
 
-    - Convierte `A` y `b` con los parsers.
-    - Calcula `|A|` y los determinantes `|A_k|` reemplazando columnas por `b`.
+    - Decodifica `A` y `b` (texto, JSON numérico, `.npy` aumentada `[A | b]`, `.npz` o búfer float64).
+    - Factoriza `A` una vez (LU) y deriva `|A|` y los determinantes `|A_k|` de esa factorización.
     - Si `|A| == 0`, reporta que no hay solución única.
 
     Retorna un diccionario con `detA`, `dets`, `matrices` y `solution`.
     Referencia: https://es.wikipedia.org/wiki/Regla_de_Cramer
     """
     try:
-        A = parse_matrix(payload.A)
-        b = parse_vector(payload.b)
-        result = linear_systems.cramer(A, b)
-        return result
+        payload, arrays = _decode(raw, LinearCramerOptions, LinearCramerRequest, {"A": "matrix", "b": "vector"})
+        A, b = arrays["A"], arrays["b"]
+
+        def compute():
+            X = sparse.select(A, "cramer")
+            flops = _flops("cramer", X, exact=payload.exact)
+            result = scheduler.run(flops, linear_systems.cramer, X, b, include_matrices=False, as_arrays=True)
+            # Con `A` dispersa se omiten las `A_k` (serían `n` copias densas de `A`)
+            if payload.includeMatrices and "error" not in result and not sparse.is_sparse(A):
+                # Las A_k se generan aquí de forma perezosa (no viajan desde el pool de procesos)
+                result["matrices"] = linear_systems.cramer_matrices(A, b)
+            return result
+
+        result = _compute("linear/cramer", payload.model_dump(), arrays, compute)
+        return _respond(raw, result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.post("/api/linear/inverse")
-def linear_inverse(payload: LinearInverseRequest):
+@app.post("/api/linear/inverse", openapi_extra=_body_docs(LinearInverseRequest))
+def linear_inverse(raw: payloads.RawPayload = Depends(read_payload)):
     """Resuelve un sistema lineal usando la matriz inversa.
 
     Flujo:
-    - Verifica que `A` sea cuadrada y `|A| != 0`.
-    - Calcula `A^{-1}` con `np.linalg.inv` y la solución `x = A^{-1} b` (multiplicación matricial `dot`).
+    - Verifica que `A` sea cuadrada y no singular (condición estimada, ver `matrix_ops.DenseLU`).
+    - Calcula `A^{-1}` con la misma factorización LU y la solución `x = A^{-1} b` (multiplicación matricial `dot`).
 
     Retorna `detA`, opcionalmente `Ainv`, y `solution`.
     """
     try:
-        A = parse_matrix(payload.A)
-        b = parse_vector(payload.b)
-        result = linear_systems.inverse_solve(A, b)
-        return result
+        payload, arrays = _decode(raw, LinearInverseOptions, LinearInverseRequest, {"A": "matrix", "b": "vector"})
+
+        def compute():
+            X = sparse.select(arrays["A"], "inverse")
+            flops = _flops("inverse", X, exact=payload.exact)
+            return scheduler.run(flops, linear_systems.inverse_solve, X, arrays["b"], as_arrays=True)
+
+        result = _compute("linear/inverse", payload.model_dump(), arrays, compute)
+        return _respond(raw, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/linear/solve", openapi_extra=_body_docs(LinearSolveRequest))
+def linear_solve(raw: payloads.RawPayload = Depends(read_payload)):
+    """Resuelve `AX = B` para muchos lados derechos reutilizando una factorización LU.
+
+    - Factoriza `A` una vez y resuelve cada columna de `B` por sustitución.
+    - No forma `A^{-1}` salvo que `includeInverse` sea verdadero.
+
+    Retorna `detA`, `solution` (matriz `(n, k)`) y opcionalmente `Ainv`.
+    """
+    try:
+        payload, arrays = _decode(raw, LinearSolveOptions, LinearSolveRequest, {"A": "matrix", "B": "matrix"})
+
+        def compute():
+            X, B = sparse.select(arrays["A"], "solve"), sparse.to_dense(arrays["B"])
+            flops = _flops("solve", X, B, exact=payload.exact)
+            return scheduler.run(
+                flops, linear_systems.multi_solve, X, B, include_inverse=payload.includeInverse, as_arrays=True,
+            )
+
+        result = _compute("linear/solve", payload.model_dump(), arrays, compute)
+        return _respond(raw, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/linear/iterative", openapi_extra=_body_docs(LinearIterativeRequest))
+def linear_iterative(raw: payloads.RawPayload = Depends(read_payload)):
+    """Resuelve `Ax = b` con gradiente conjugado, GMRES, Jacobi o Gauss-Seidel.
+
+    Cada iteración es un producto matriz-vector (CSR si `A` es poco densa), sin
+    factorizar `A`: apto para sistemas de diferencias finitas con miles de incógnitas.
+
+    Retorna `solution`, `iterations`, `residuals` (historial `‖r_k‖/‖b‖`), `residual`,
+    `converged` y `method`. No converger en `maxIter` no es un error (`converged: false`).
+
+    Errores:
+    - 400 si las dimensiones o parámetros son inválidos, la diagonal tiene ceros (Jacobi,
+      Gauss-Seidel), `A` no es definida positiva (`cg`) o es singular (`gmres`).
+    """
+    try:
+        payload, arrays = _decode(
+            raw, LinearIterativeOptions, LinearIterativeRequest, {"A": "matrix", "b": "vector", "x0": "vector"},
+        )
+
+        def compute():
+            X = sparse.select(arrays["A"], "mul")
+            max_iter = payload.maxIter if payload.maxIter is not None else iterative.default_max_iter(payload.method, X.shape[0])
+            flops = iterative.estimate_flops(X, payload.method, max_iter, payload.restart)
+            return scheduler.run(
+                flops, linear_systems.iterative_solve, X, arrays["b"], method=payload.method, tol=payload.tol,
+                max_iter=payload.maxIter, preconditioner=payload.preconditioner, restart=payload.restart,
+                x0=arrays["x0"], as_arrays=True,
+            )
+
+        result = _compute("linear/iterative", payload.model_dump(), arrays, compute)
+        return _respond(raw, result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/api/vectors/calc")
-def vectors_calc(payload: VectorsRequest):
+@metrics.records_validation
+def vectors_calc(payload: VectorsRequest, request: Request):
     """Calcula operaciones básicas de vectores 2D y datos para graficación.
 
     Entrada:
@@ -215,38 +866,40 @@ def vectors_calc(payload: VectorsRequest):
 
     Retorna un diccionario con valores numéricos y `plotSpec`.
     """
+    metrics.annotate(op="vectors")
     try:
-        mode = payload.inputMode
-        show = payload.show or {}
-
-        # Normaliza entradas según modo polar o cartesiano
-        if mode == "polar":
-            ux, uy = vectors.to_components(float(payload.v1.get("mag", 0)), float(payload.v1.get("deg", 0)))
-            vx, vy = vectors.to_components(float(payload.v2.get("mag", 0)), float(payload.v2.get("deg", 0)))
-        else:
-            ux = float(payload.v1.get("x", 0))
-            uy = float(payload.v1.get("y", 0))
-            vx = float(payload.v2.get("x", 0))
-            vy = float(payload.v2.get("y", 0))
+        with metrics.stage("compute"):
+            mode = payload.inputMode
+            show = payload.show or {}
+
+            # Normaliza entradas según modo polar o cartesiano
+            if mode == "polar":
+                ux, uy = vectors.to_components(float(payload.v1.get("mag", 0)), float(payload.v1.get("deg", 0)))
+                vx, vy = vectors.to_components(float(payload.v2.get("mag", 0)), float(payload.v2.get("deg", 0)))
+            else:
+                ux = float(payload.v1.get("x", 0))
+                uy = float(payload.v1.get("y", 0))
+                vx = float(payload.v2.get("x", 0))
+                vy = float(payload.v2.get("y", 0))
 
-        # Construye arrays NumPy para operar de forma vectorizada
-        u = np.array([ux, uy], dtype=float)
-        v = np.array([vx, vy], dtype=float)
+            # Construye arrays NumPy para operar de forma vectorizada
+            u = np.array([ux, uy], dtype=float)
+            v = np.array([vx, vy], dtype=float)
 
-        # Operaciones básicas
-        s = vectors.add(u, v)
-        d = vectors.subtract(u, v)
-        dp = vectors.dot(u, v)
-        cp = vectors.cross(u, v)
+            # Operaciones básicas
+            s = vectors.add(u, v)
+            d = vectors.subtract(u, v)
+            dp = vectors.dot(u, v)
+            cp = vectors.cross(u, v)
 
-        # Conversión a magnitud/ángulo para presentar
-        u_md = vectors.from_components(u[0], u[1])
-        v_md = vectors.from_components(v[0], v[1])
+            # Conversión a magnitud/ángulo para presentar
+            u_md = vectors.from_components(u[0], u[1])
+            v_md = vectors.from_components(v[0], v[1])
 
-        # Datos de trazado para Plotly
-        plot = vectors.plot_data(u, v, show)
+            # Datos de trazado para Plotly
+            plot = vectors.plot_data(u, v, show)
 
-        return {
+        return _json(request, {
             "v1": {"xy": [u[0], u[1]], "mag": u_md[0], "deg": u_md[1]},
             "v2": {"xy": [v[0], v[1]], "mag": v_md[0], "deg": v_md[1]},
             "sum": [s[0], s[1]],
@@ -254,6 +907,36 @@ def vectors_calc(payload: VectorsRequest):
             "dot": float(dp),
             "cross": float(cp),
             "plotSpec": plot,
-        }
+        })
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/vectors/batch", openapi_extra=_body_docs(VectorsBatchRequest))
+def vectors_batch(raw: payloads.RawPayload = Depends(read_payload)):
+    """Opera lotes de vectores 2D o 3D en una sola petición, sin bucles por vector.
+
+    Entrada (mismos formatos que `/api/matrix/operate`: JSON textual o numérico, `.npy`,
+    `.npz`, búfer con `X-Matrix-Shape` o ID de matriz guardada):
+    - `u`: arreglo `(k, 2)` o `(k, 3)`; `v` opcional, de la misma forma.
+    - `inputMode`: `cart` o `polar` (ver `VectorsBatchOptions`).
+
+    Retorna (ver `vectors.batch`) `u`, `uPolar`, `resultant` y, con `v`, además `v`,
+    `vPolar`, `sum`, `diff`, `dot` y `cross`. Admite streaming NDJSON como los endpoints
+    matriciales.
+
+    Errores:
+    - 400 si las formas son inválidas o `u` y `v` no coinciden.
+    """
+    try:
+        payload, arrays = _decode(raw, VectorsBatchOptions, VectorsBatchRequest, {"u": "matrix", "v": "matrix"})
+        U, V = sparse.to_dense(arrays["u"]), sparse.to_dense(arrays["v"])
+        metrics.annotate(op="vectors_batch", size=U.shape[0])
+        with metrics.stage("compute"):
+            if payload.inputMode == "polar":
+                U = vectors.to_components_batch(U, "u")
+                V = None if V is None else vectors.to_components_batch(V, "v")
+            result = vectors.batch(U, V)
+        return _respond(raw, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
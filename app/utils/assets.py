@@ -0,0 +1,124 @@
+"""Archivos estáticos de la interfaz servidos desde memoria, precomprimidos y con ETag.
+
+Al iniciar se leen una sola vez los archivos de `app/static` y, para cada uno, se
+precalculan:
+
+- Variantes `gzip` (`gzip.compress`, nivel 9) y `br` (si el paquete opcional `brotli`
+  está instalado); sólo se guardan si resultan más pequeñas que el original.
+- Un ETag fuerte por variante (hash del contenido + codificación), como exige HTTP para
+  representaciones con distinto `Content-Encoding`.
+
+Cada petición sólo elige la variante según `Accept-Encoding` y responde `304 Not Modified`
+si `If-None-Match` coincide, sin tocar el disco ni comprimir.
+
+Referencias:
+- Codificación de contenido: https://developer.mozilla.org/docs/Web/HTTP/Headers/Accept-Encoding
+- ETag e `If-None-Match`: https://developer.mozilla.org/docs/Web/HTTP/Headers/ETag
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Mapping, Optional
+
+from starlette.responses import Response
+
+try:  # dependencia opcional: sin ella sólo se ofrece gzip
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+# Codificaciones en orden de preferencia del servidor
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+# Por debajo de este tamaño comprimir no compensa las cabeceras extra
+MIN_COMPRESS_BYTES = 512
+# Los nombres no llevan hash de contenido: el navegador revalida con el ETag en cada uso
+CACHE_CONTROL = "no-cache"
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Codificaciones de `Accept-Encoding` con su peso `q` (las de `q=0` quedan en 0)."""
+    weights: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[token.strip().lower()] = q
+    return weights
+
+
+def accepts(weights: Mapping[str, float], encoding: str) -> bool:
+    """Si `encoding` tiene peso positivo en `accepted_encodings` (o, sin mencionarla, `*`)."""
+    return weights.get(encoding, weights.get("*", 0.0)) > 0
+
+
+class StaticAsset:
+    """Un archivo estático: tipo MIME y cuerpo por codificación (`identity`, `gzip`, `br`)."""
+
+    def __init__(self, body: bytes, media_type: str):
+        self.media_type = media_type
+        digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.bodies: Dict[str, bytes] = {"identity": body}
+        if len(body) >= MIN_COMPRESS_BYTES:
+            for encoding in ENCODINGS:
+                packed = _compress(body, encoding)
+                if len(packed) < len(body):
+                    self.bodies[encoding] = packed
+        self.etags = {
+            encoding: f'"{digest}"' if encoding == "identity" else f'"{digest}-{encoding}"'
+            for encoding in self.bodies
+        }
+
+    def select(self, accept_encoding: str) -> str:
+        """Codificación a enviar: la preferida del servidor entre las aceptadas por el cliente."""
+        weights = accepted_encodings(accept_encoding)
+        for encoding in ENCODINGS:
+            if encoding in self.bodies and accepts(weights, encoding):
+                return encoding
+        return "identity"
+
+    def response(self, headers: Mapping[str, str]) -> Response:
+        """Respuesta completa o `304` según `If-None-Match`, con la variante elegida."""
+        encoding = self.select(headers.get("accept-encoding", ""))
+        etag = self.etags[encoding]
+        out = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        match = headers.get("if-none-match", "")
+        if match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in match.split(",")):
+            return Response(status_code=304, headers=out)
+        if encoding != "identity":
+            out["Content-Encoding"] = encoding
+        return Response(self.bodies[encoding], media_type=self.media_type, headers=out)
+
+
+class StaticAssets:
+    """Archivos de un directorio cargados en memoria al construir la instancia."""
+
+    def __init__(self, directory: str):
+        self.assets: Dict[str, StaticAsset] = {}
+        for root, _, files in os.walk(directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, directory).replace(os.sep, "/")
+                media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                if media_type.startswith("text/") or media_type == "application/javascript":
+                    media_type += "; charset=utf-8"
+                with open(path, "rb") as f:
+                    self.assets[name] = StaticAsset(f.read(), media_type)
+
+    def get(self, name: str) -> Optional[StaticAsset]:
+        return self.assets.get(name)
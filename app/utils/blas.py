@@ -0,0 +1,197 @@
+"""Presupuesto de hilos de BLAS por proceso y por llamada.
+
+OpenBLAS (el BLAS que trae NumPy) crea un hilo por núcleo en cada proceso. Con varios
+workers de uvicorn (`WEB_CONCURRENCY`) más el pool de `utils.scheduler`, cada proceso
+intenta usar todos los núcleos: los hilos compiten entre sí y `mul`/`inv` rinden menos
+que con un solo hilo por worker. Este módulo:
+
+- Fija un presupuesto por proceso (`budget`): `CALC_BLAS_THREADS` o, si vale 0,
+  núcleos disponibles / workers de uvicorn (al menos 1).
+- Elige los hilos de cada llamada según su costo estimado (los mismos flops que usa el
+  planificador): un hilo por debajo de `min_flops`, donde repartir el trabajo cuesta más
+  que hacerlo, y el presupuesto completo para `mul`/`inv`/`det` grandes.
+
+El número de hilos de BLAS es global al proceso. Con peticiones concurrentes se aplica el
+mayor de los pedidos en curso (una petición pequeña no reduce a una grande) y, sin
+llamadas en curso, el presupuesto.
+
+El control usa `threadpoolctl` (dependencia opcional) o, sin él, `openblas_set_num_threads`
+de la biblioteca OpenBLAS cargada (`ctypes`). Si no se encuentra ninguno (p. ej. otro BLAS),
+los límites no tienen efecto y `/api/blas/stats` lo indica con `backend: null`.
+
+Referencias:
+- https://github.com/OpenMathLib/OpenBLAS/wiki/faq#multi-threaded
+- https://github.com/joblib/threadpoolctl
+"""
+
+import ctypes
+import functools
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:  # dependencia opcional: sin ella se usa OpenBLAS directamente
+    import threadpoolctl
+except ImportError:  # pragma: no cover - depende del entorno
+    threadpoolctl = None
+
+
+def cpu_count() -> int:
+    """Núcleos utilizables por el proceso (respeta la afinidad de CPU de contenedores)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - no disponible fuera de Linux
+        return os.cpu_count() or 1
+
+
+def default_budget(workers: int) -> int:
+    """Hilos por proceso para repartir los núcleos entre `workers` procesos (al menos 1)."""
+    return max(1, cpu_count() // max(1, workers))
+
+
+class _ThreadpoolctlBackend:
+    """Control mediante `threadpoolctl` (cualquier BLAS que reconozca)."""
+
+    def __init__(self, controller: Any):
+        self._libs = controller.lib_controllers
+        self.name = "+".join(lib.internal_api for lib in self._libs)
+        self.version = ", ".join(str(lib.version) for lib in self._libs)
+
+    def get(self) -> int:
+        return max(lib.num_threads for lib in self._libs)
+
+    def set(self, threads: int) -> None:
+        for lib in self._libs:
+            lib.set_num_threads(threads)
+
+
+class _OpenBLASBackend:
+    """Control mediante las funciones de OpenBLAS (con o sin el prefijo `scipy_` y sufijo `64_`)."""
+
+    name = "openblas"
+
+    def __init__(self, lib: ctypes.CDLL, prefix: str, suffix: str):
+        # `void openblas_set_num_threads(int)` / `int openblas_get_num_threads(void)`
+        self._set = getattr(lib, f"{prefix}_set_num_threads{suffix}")
+        self._set.argtypes, self._set.restype = [ctypes.c_int], None
+        self._get = getattr(lib, f"{prefix}_get_num_threads{suffix}")
+        self._get.argtypes, self._get.restype = [], ctypes.c_int
+        get_config = getattr(lib, f"{prefix}_get_config{suffix}", None)
+        self.version = None
+        if get_config is not None:
+            get_config.argtypes, get_config.restype = [], ctypes.c_char_p
+            self.version = get_config().decode("ascii", "replace").strip()
+
+    def get(self) -> int:
+        return int(self._get())
+
+    def set(self, threads: int) -> None:
+        self._set(int(threads))
+
+
+def _loaded_openblas() -> Optional[_OpenBLASBackend]:
+    """Busca la biblioteca OpenBLAS cargada por NumPy entre las del proceso (Linux)."""
+    try:
+        with open("/proc/self/maps") as f:
+            paths = {line.split()[-1] for line in f if "openblas" in line.lower()}
+    except OSError:  # pragma: no cover - no disponible fuera de Linux
+        return None
+    for path in sorted(paths):
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        for prefix in ("scipy_openblas", "openblas"):
+            for suffix in ("64_", ""):
+                if hasattr(lib, f"{prefix}_set_num_threads{suffix}"):
+                    return _OpenBLASBackend(lib, prefix, suffix)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def backend() -> Optional[Any]:
+    """Control de hilos de BLAS del proceso (`None` si no se encontró); se detecta una vez."""
+    import numpy  # noqa: F401 - carga la biblioteca BLAS antes de buscarla
+
+    if threadpoolctl is not None:
+        controller = threadpoolctl.ThreadpoolController().select(user_api="blas")
+        if controller.lib_controllers:
+            return _ThreadpoolctlBackend(controller)
+    return _loaded_openblas()
+
+
+def call_with_threads(threads: int, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Ejecuta `fn` con `threads` hilos de BLAS; usado en los procesos del pool (un trabajo a la vez)."""
+    ctl = backend()
+    if ctl is not None:
+        ctl.set(threads)
+    return fn(*args, **kwargs)
+
+
+class BlasThreads:
+    """Presupuesto de hilos de BLAS del proceso y elección de hilos por llamada.
+
+    Parámetros:
+    - `budget`: hilos máximos del proceso (ver `default_budget`).
+    - `min_flops`: costo estimado desde el que una llamada usa el presupuesto completo;
+      por debajo usa un solo hilo.
+    - `ctl`: control de hilos (por defecto `backend()`; inyectable en pruebas).
+    """
+
+    def __init__(self, budget: int, min_flops: float, ctl: Any = "auto"):
+        self.budget = max(1, budget)
+        self.min_flops = min_flops
+        self._ctl = backend() if ctl == "auto" else ctl
+        self._lock = threading.Lock()
+        # hilos pedidos por las llamadas en curso → cantidad
+        self._active: Counter = Counter()
+        self._current: Optional[int] = None
+        self.calls = Counter()
+
+    def _set(self, threads: int) -> None:
+        """Aplica `threads` si cambia (con el candado tomado)."""
+        if self._ctl is not None and threads != self._current:
+            self._ctl.set(threads)
+            self._current = threads
+
+    def apply(self) -> None:
+        """Fija el presupuesto como número de hilos del proceso (al iniciar)."""
+        with self._lock:
+            self._set(self.budget)
+
+    def threads_for(self, flops: float) -> int:
+        """Hilos para una llamada de costo `flops`: 1 si es pequeña, el presupuesto si es grande."""
+        return 1 if flops < self.min_flops else self.budget
+
+    @contextmanager
+    def limit(self, threads: int) -> Iterator[None]:
+        """Ejecuta el bloque con `threads` hilos (o más, si otra llamada en curso pidió más)."""
+        with self._lock:
+            self._active[threads] += 1
+            self.calls["single" if threads == 1 else "parallel"] += 1
+            self._set(max(self._active))
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active[threads] -= 1
+                if not self._active[threads]:
+                    del self._active[threads]
+                self._set(max(self._active) if self._active else self.budget)
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend detectado, presupuesto, umbral, hilos actuales y llamadas por modo."""
+        with self._lock:
+            return {
+                "backend": getattr(self._ctl, "name", None),
+                "version": getattr(self._ctl, "version", None),
+                "cpuCount": cpu_count(),
+                "budget": self.budget,
+                "minFlops": self.min_flops,
+                "threads": self._ctl.get() if self._ctl is not None else None,
+                "active": sum(self._active.values()),
+                "single": self.calls["single"],
+                "parallel": self.calls["parallel"],
+            }
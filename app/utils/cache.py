@@ -0,0 +1,173 @@
+"""Caché de resultados en memoria con expulsión LRU acotada por entradas y bytes.
+
+La clave es un hash canónico (`hashlib.blake2b`) del endpoint, las opciones y los
+arreglos ya parseados (tipo, forma y bytes), de modo que la misma matriz escrita como
+`"0.5"` o `"1/2"`, o enviada en JSON o binario, comparte entrada.
+
+Los resultados cacheados se marcan de sólo lectura para que ningún consumidor los
+modifique. Los iteradores perezosos (p. ej. las `A_k` de Cramer) se materializan sólo
+si caben en el presupuesto de bytes; si no, el resultado no se guarda.
+
+Referencia: https://docs.python.org/3/library/collections.html#collections.OrderedDict
+"""
+
+import hashlib
+import itertools
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+from ..core import sparse
+
+
+def _nbytes(value: Any) -> int:
+    """Tamaño aproximado en bytes de un valor de resultado."""
+    if isinstance(value, np.ndarray):
+        # Arreglos `object` (modo exacto): estimación por elemento
+        return value.nbytes if value.dtype != object else value.size * 64
+    if sparse.is_sparse(value):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value) + 8 * len(value)
+    return 64
+
+
+class ResultCache:
+    """Caché LRU segura entre hilos (los endpoints síncronos corren en un pool de hilos).
+
+    Parámetros:
+    - `max_entries`: número máximo de resultados guardados.
+    - `max_bytes`: presupuesto total de bytes de los resultados.
+    - `enabled`: si es `False`, `get` siempre falla y `put` no guarda nada.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(endpoint: str, options: Mapping[str, Any], arrays: Mapping[str, Optional[np.ndarray]]) -> str:
+        """Hash canónico de endpoint, opciones (JSON ordenado) y arreglos."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(endpoint.encode())
+        h.update(json.dumps(dict(options), sort_keys=True, default=str).encode())
+        for name in sorted(arrays):
+            arr = arrays[name]
+            h.update(f"|{name}:".encode())
+            if arr is None:
+                h.update(b"-")
+                continue
+            h.update(f"{arr.dtype.str}{arr.shape}".encode())
+            if sparse.is_sparse(arr):
+                # CSR normalizado (ordenado y sin repetidos): misma matriz, mismos bytes
+                h.update(b"csr")
+                for part in (arr.indptr, arr.indices, arr.data):
+                    h.update(part.data)
+            elif arr.dtype == object:
+                h.update(repr(arr.tolist()).encode())
+            else:
+                h.update(np.ascontiguousarray(arr).data)
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retorna el resultado guardado (y lo marca como reciente) o `None`."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Guarda `result` si cabe en el presupuesto y retorna el resultado a usar.
+
+        Los iteradores se materializan en un dict mientras quepan; si exceden
+        `max_bytes`, se devuelve un iterador equivalente y no se guarda nada.
+        """
+        if not self.enabled:
+            return result
+        stored: Dict[str, Any] = {}
+        size = 0
+        for name, value in result.items():
+            if hasattr(value, "__next__"):
+                items = []
+                for item in value:
+                    items.append(item)
+                    size += _nbytes(item[1])
+                    if size > self.max_bytes:
+                        out = dict(result)
+                        out[name] = itertools.chain(items, value)
+                        return out
+                value = dict(items)
+            else:
+                size += _nbytes(value)
+            stored[name] = value
+        if size > self.max_bytes:
+            return stored
+        for value in stored.values():
+            for arr in (value.values() if isinstance(value, dict) else (value,)):
+                if isinstance(arr, np.ndarray):
+                    arr.setflags(write=False)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (stored, size)
+            self._bytes += size
+            while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, freed) = self._data.popitem(last=False)
+                self._bytes -= freed
+                self.evictions += 1
+        return stored
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        options: Mapping[str, Any],
+        arrays: Mapping[str, Optional[np.ndarray]],
+        compute: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Consulta la caché y, si falla, calcula con `compute()` y guarda el resultado."""
+        if not self.enabled:
+            return compute()
+        key = self.key(endpoint, options, arrays)
+        result = self.get(key)
+        if result is None:
+            result = self.put(key, compute())
+        return result
+
+    def clear(self) -> None:
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de aciertos/fallos y ocupación actual."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,224 @@
+"""Instrumentación por etapas de cada petición: cabecera `Server-Timing` y `/metrics`.
+
+Cada petición lleva un registro de tiempos (en un `ContextVar`, que Starlette copia
+al hilo donde corren los endpoints síncronos). El código marca etapas con
+`with stage("parse"): ...`; el middleware `TimingMiddleware` añade la cabecera
+`Server-Timing` y acumula histogramas por endpoint, operación, tamaño y etapa.
+
+Etapas usadas por la API:
+- `validate`: lectura del JSON y validación Pydantic. En los endpoints que reciben el cuerpo
+  como modelo Pydantic, FastAPI lo valida antes de llamar al endpoint; esa etapa se mide
+  desde que llega el cuerpo hasta que empieza el endpoint (`records_validation`).
+- `parse`: conversión de celdas/arreglos (`parse_matrix`, `np.frombuffer`, ...).
+- `compute`: operación NumPy (incluye la consulta a la caché y el planificador).
+- `serialize`: `tolist()` y codificación JSON de la respuesta.
+- `total`: duración completa medida por el middleware.
+
+La etiqueta `endpoint` es la plantilla de la ruta atendida (p. ej. `/api/matrix/store/{mid}`),
+no la URL: las peticiones que no coinciden con ninguna ruta se agrupan como `other`, de modo
+que la cantidad de series no crece con los IDs ni con URLs desconocidas.
+
+El formato de `/metrics` es el de exposición de texto de Prometheus.
+
+Referencias:
+- Server-Timing: https://www.w3.org/TR/server-timing/
+- Formato Prometheus: https://prometheus.io/docs/instrumenting/exposition_formats/
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Límites superiores (segundos) de los buckets de los histogramas
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Límites de los buckets de tamaño de matriz (dimensión mayor)
+SIZE_BUCKETS = (4, 16, 64, 256, 1024)
+
+# Etiqueta de las peticiones que no coinciden con ninguna ruta (404)
+OTHER_ENDPOINT = "other"
+
+
+class RequestTimings:
+    """Duraciones por etapa y etiquetas (`op`, `size`) de una petición."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.labels: Dict[str, str] = {}
+        # Momento (`perf_counter`) en que terminó de llegar el cuerpo de la petición
+        self.body_received: Optional[float] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mide el bloque como etapa `name` de la petición actual (no hace nada fuera de una petición)."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - t0)
+
+
+def records_validation(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Decora un endpoint con cuerpo Pydantic: mide como `validate` la lectura y validación previas.
+
+    FastAPI decodifica y valida el cuerpo antes de llamar al endpoint, fuera de cualquier
+    bloque `stage`; se registra el tiempo desde que llegó el cuerpo hasta la llamada.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timings = _current.get()
+        if timings is not None and timings.body_received is not None:
+            timings.add("validate", time.perf_counter() - timings.body_received)
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def size_bucket(n: int) -> str:
+    """Etiqueta del bucket de tamaño: `1-4`, `5-16`, ..., `>1024`."""
+    low = 1
+    for high in SIZE_BUCKETS:
+        if n <= high:
+            return f"{low}-{high}"
+        low = high + 1
+    return f">{SIZE_BUCKETS[-1]}"
+
+
+def annotate(op: Optional[str] = None, size: Optional[int] = None) -> None:
+    """Asocia la operación y el tamaño (dimensión mayor) a la petición actual."""
+    timings = _current.get()
+    if timings is None:
+        return
+    if op is not None:
+        timings.labels["op"] = op
+    if size is not None:
+        timings.labels["size"] = size_bucket(int(size))
+
+
+def server_timing(timings: RequestTimings) -> str:
+    """Valor de la cabecera `Server-Timing` (duraciones en milisegundos)."""
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings.stages.items())
+
+
+class Registry:
+    """Histogramas y contadores acumulados en memoria (seguros entre hilos)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # clave: (endpoint, op, size, stage) → [conteos por bucket..., suma, total]
+        self._hist: Dict[Tuple[str, str, str, str], List[float]] = {}
+        self._requests: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, endpoint: str, status: int, timings: RequestTimings) -> None:
+        op = timings.labels.get("op", "")
+        size = timings.labels.get("size", "")
+        with self._lock:
+            key = (endpoint, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            for name, seconds in timings.stages.items():
+                h = self._hist.setdefault((endpoint, op, size, name), [0.0] * (len(BUCKETS) + 2))
+                for i, bound in enumerate(BUCKETS):
+                    if seconds <= bound:
+                        h[i] += 1
+                h[-2] += seconds
+                h[-1] += 1
+
+    def render(self, extra: Optional[Dict[str, Tuple[str, str, Dict[str, Any]]]] = None) -> str:
+        """Texto en formato Prometheus.
+
+        `extra` añade métricas simples: `{nombre: (tipo, ayuda, {etiqueta_valor: valor})}`
+        (p. ej. contadores de la caché y del planificador).
+        """
+        lines = [
+            "# HELP calc_requests_total Peticiones atendidas por endpoint y código HTTP.",
+            "# TYPE calc_requests_total counter",
+        ]
+        with self._lock:
+            requests = dict(self._requests)
+            hist = {k: list(v) for k, v in self._hist.items()}
+        for (endpoint, status), count in sorted(requests.items()):
+            lines.append(f'calc_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+        lines += [
+            "# HELP calc_request_stage_seconds Duración de cada etapa de la petición.",
+            "# TYPE calc_request_stage_seconds histogram",
+        ]
+        for (endpoint, op, size, name), h in sorted(hist.items()):
+            labels = f'endpoint="{endpoint}",op="{op}",size="{size}",stage="{name}"'
+            for bound, count in zip(BUCKETS, h):
+                lines.append(f'calc_request_stage_seconds_bucket{{{labels},le="{bound}"}} {int(count)}')
+            lines.append(f'calc_request_stage_seconds_bucket{{{labels},le="+Inf"}} {int(h[-1])}')
+            lines.append(f"calc_request_stage_seconds_sum{{{labels}}} {h[-2]:.9f}")
+            lines.append(f"calc_request_stage_seconds_count{{{labels}}} {int(h[-1])}")
+        for name, (kind, help_text, values) in (extra or {}).items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for label, value in values.items():
+                lines.append(f"{name}{{{label}}} {value}" if label else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def endpoint_label(scope: Mapping[str, Any]) -> str:
+    """Plantilla de la ruta que atendió la petición (`scope["route"]`) u `other` si ninguna coincidió."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or OTHER_ENDPOINT
+
+
+class TimingMiddleware:
+    """Middleware ASGI: mide la petición, añade `Server-Timing` y registra histogramas.
+
+    Es ASGI puro (no `BaseHTTPMiddleware`) para no envolver el cuerpo de las respuestas
+    en streaming; la cabecera se inyecta en el mensaje `http.response.start`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = _current.set(timings)
+        t0 = time.perf_counter()
+        status = 500
+
+        async def receive_wrapper():
+            message = await receive()
+            if message["type"] == "http.request" and not message.get("more_body", False):
+                timings.body_received = time.perf_counter()
+            return message
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timings.stages["total"] = time.perf_counter() - t0
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(timings).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            _current.reset(token)
+            # El enrutador agrega la ruta elegida al mismo `scope`
+            registry.observe(endpoint_label(scope), status, timings)
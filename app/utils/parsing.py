@@ -1,12 +1,30 @@
 """Funciones de parseo para convertir entradas de texto en arreglos NumPy.
 
-Admite enteros, decimales y fracciones `a/b` con signo.
+Admite enteros, decimales y fracciones `a/b` con signo. En modo exacto (`exact=True`)
+las celdas se conservan como `fractions.Fraction` en arreglos `dtype=object`.
+
+Las grillas se convierten en bloque: las celdas decimales pasan por una única
+conversión `np.fromiter` y sólo las fracciones se interpretan una a una (una vez por
+token distinto).
+
+`dtype` elige la precisión de punto flotante del resultado (`FLOAT_DTYPES`): con
+`float32` el arreglo ocupa la mitad de memoria a cambio de ~7 cifras significativas.
 """
 
 from fractions import Fraction
-from typing import List
+from typing import Dict, List
 import numpy as np
 
+# Precisiones admitidas en la opción `dtype` de las peticiones
+FLOAT_DTYPES = ("float64", "float32")
+
+
+def resolve_dtype(name: str) -> np.dtype:
+    """Convierte el nombre de la opción `dtype` en `np.dtype`; `ValueError` si no es admitido."""
+    if name not in FLOAT_DTYPES:
+        raise ValueError(f"'dtype' debe ser uno de {', '.join(FLOAT_DTYPES)}")
+    return np.dtype(name)
+
 
 def parse_number(text: str) -> float:
     """Convierte una cadena en `float`.
@@ -30,12 +48,103 @@ def parse_number(text: str) -> float:
         raise ValueError(f"Valor no numérico o fracción inválida: '{text}'")
 
 
-def parse_matrix(cells: List[List[str]]) -> np.ndarray:
+def parse_fraction(text: str) -> Fraction:
+    """Convierte una cadena en `Fraction` exacta (mismos formatos que `parse_number`).
+
+    Los decimales se interpretan de forma exacta: "0.1" → `1/10`.
+    """
+    if text is None:
+        raise ValueError("Campo vacío no válido")
+    s = str(text).strip()
+    if s == "":
+        raise ValueError("Campo vacío no válido")
+    try:
+        return Fraction(s)
+    except Exception:
+        raise ValueError(f"Valor no numérico o fracción inválida: '{text}'")
+
+
+def to_exact(data: np.ndarray) -> np.ndarray:
+    """Convierte un arreglo numérico a `dtype=object` con `Fraction`.
+
+    Usa la representación decimal más corta de cada `float` (`0.1` → `1/10`), que es
+    lo que el usuario escribió en formatos numéricos o binarios.
+    """
+    out = np.empty(data.shape, dtype=object)
+    flat = out.reshape(-1)
+    for i, x in enumerate(np.asarray(data, dtype=float).reshape(-1).tolist()):
+        flat[i] = parse_fraction(repr(x))
+    return out
+
+
+def format_number(value) -> str:
+    """Representa un valor exacto como texto reutilizable por el parser (`"7/3"`, `"-2"`)."""
+    f = Fraction(value)
+    return str(f.numerator) if f.denominator == 1 else f"{f.numerator}/{f.denominator}"
+
+
+def _parse_cells_exact(flat: List[str]) -> np.ndarray:
+    """Convierte celdas a `np.ndarray(object)` de `Fraction`, parseando cada token distinto una vez."""
+    interned: Dict[str, Fraction] = {}
+    data = np.empty((len(flat),), dtype=object)
+    for i, c in enumerate(flat):
+        key = c if isinstance(c, str) else repr(c)
+        v = interned.get(key)
+        if v is None:
+            v = interned[key] = parse_fraction(c)
+        data[i] = v
+    return data
+
+
+def _parse_cells(flat: List[str], dtype=float) -> np.ndarray:
+    """Convierte una lista plana de celdas a `np.ndarray(dtype)` en bloque.
+
+    1. Ruta rápida: si todas las celdas son decimales, una sola pasada
+       `np.fromiter(map(float, ...))` sin `try`/`Fraction` por celda.
+    2. Si hay fracciones `a/b`, convierte en bloque las celdas restantes y evalúa con
+       `parse_number` sólo los tokens de fracción distintos (se reutiliza el valor
+       para las repeticiones).
+    3. Si alguna celda es inválida, recorre en orden con `parse_number` para reportar
+       el mismo error que la conversión celda a celda.
+    """
+    n = len(flat)
+    try:
+        return np.fromiter(map(float, flat), dtype=dtype, count=n)
+    except (ValueError, TypeError):
+        pass
+    frac = [i for i, c in enumerate(flat) if isinstance(c, str) and "/" in c]
+    if frac:
+        is_frac = np.zeros((n,), dtype=bool)
+        is_frac[frac] = True
+        rest = [c for c, f in zip(flat, is_frac) if not f]
+        try:
+            data = np.empty((n,), dtype=dtype)
+            data[~is_frac] = np.fromiter(map(float, rest), dtype=dtype, count=len(rest))
+            interned: Dict[str, float] = {}
+            for i in frac:
+                t = flat[i]
+                v = interned.get(t)
+                if v is None:
+                    v = interned[t] = parse_number(t)
+                data[i] = v
+            return data
+        except (ValueError, TypeError):
+            pass
+    # Reporta el primer error en orden de lectura (mismos mensajes que `parse_number`)
+    for c in flat:
+        parse_number(c)
+    raise ValueError("Valor no numérico o fracción inválida")
+
+
+def parse_matrix(cells: List[List[str]], exact: bool = False, dtype=float) -> np.ndarray:
     """Convierte una grilla de strings a `np.ndarray(float)` validando dimensiones.
 
     Validaciones:
     - No vacío; filas y columnas consistentes.
-    - Cada celda debe ser interpretable por `parse_number`.
+    - Cada celda debe ser interpretable por `parse_number` (conversión en bloque con `_parse_cells`).
+
+    Con `exact=True` retorna `np.ndarray(dtype=object)` de `Fraction` (`parse_fraction`);
+    si no, un arreglo de `dtype` (`float64` por defecto, o `float32`).
     """
     if cells is None or not isinstance(cells, list) or len(cells) == 0:
         raise ValueError("Matriz vacía no válida")
@@ -46,21 +155,16 @@ def parse_matrix(cells: List[List[str]]) -> np.ndarray:
     for r in cells:
         if len(r) != cols:
             raise ValueError("Todas las filas deben tener el mismo número de columnas")
-    data = np.zeros((rows, cols), dtype=float)
-    for i in range(rows):
-        for j in range(cols):
-            data[i, j] = parse_number(cells[i][j])
-    return data
+    flat = [c for r in cells for c in r]
+    data = _parse_cells_exact(flat) if exact else _parse_cells(flat, dtype)
+    return data.reshape(rows, cols)
 
 
-def parse_vector(cells: List[str]) -> np.ndarray:
+def parse_vector(cells: List[str], exact: bool = False, dtype=float) -> np.ndarray:
     """Convierte una lista de strings a vector `np.ndarray(float)` de tamaño `n`.
 
-    Útil para el vector `b` de sistemas lineales.
+    Útil para el vector `b` de sistemas lineales. Con `exact=True`, vector de `Fraction`.
     """
     if cells is None or not isinstance(cells, list) or len(cells) == 0:
         raise ValueError("Vector b vacío no válido")
-    data = np.zeros((len(cells),), dtype=float)
-    for i, v in enumerate(cells):
-        data[i] = parse_number(v)
-    return data
\ No newline at end of file
+    return _parse_cells_exact(list(cells)) if exact else _parse_cells(list(cells), dtype)
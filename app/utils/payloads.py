@@ -0,0 +1,313 @@
+"""Decodificación de cuerpos de petición en varios formatos (negociación por `Content-Type`).
+
+Formatos admitidos para los campos matriciales (`A`, `B`, `b`):
+- `application/json` con grillas de strings (formato original, validado con Pydantic y
+  convertido con `parse_matrix`/`parse_vector`).
+- `application/json` con arreglos numéricos (`[[1, 2], [3, 4]]`): se convierten en bloque
+  con `np.asarray(..., dtype=float)` sin validar celda a celda.
+- `application/json` con matrices dispersas: `{"format": "coo", "shape": [n, m], "row": [...],
+  "col": [...], "data": [...]}` o `{"format": "csr", ..., "indptr": [...], "indices": [...]}`
+  (ver `core.sparse`); se convierten a `sparse.CSRMatrix` sin materializar la matriz densa.
+- `application/x-npy`: un único arreglo `.npy` (se asigna a `A`; en sistemas lineales puede
+  ser la matriz aumentada `[A | b]` de forma `(n, n+1)`).
+- `application/x-npz`: varios arreglos con nombre (`A`, `B`, `b`).
+- `application/octet-stream`: búfer plano float64 little-endian (float32 con
+  `?dtype=float32`) con la forma en la cabecera `X-Matrix-Shape` (p. ej. `3x3` o
+  `A=3x3;b=3`, en el orden del búfer). Se carga sin copia con `np.frombuffer` (los
+  arreglos resultantes son de sólo lectura).
+
+Cualquier campo puede ser también el ID de una matriz guardada con `POST /api/matrix/store`
+(`"A": "m_..."` en JSON, o `?A=m_...` en formatos binarios para campos que no van en el
+cuerpo); ver `utils.store`.
+
+Si las opciones incluyen `exact=True`, las grillas de texto se parsean como `Fraction` y
+los arreglos numéricos se convierten con `parsing.to_exact` (arreglos `dtype=object`).
+Si incluyen `dtype="float32"`, los campos densos se convierten a `float32` (la mitad de
+memoria); las matrices dispersas conservan `float64`.
+
+En los formatos binarios las opciones escalares (`op`, `target`, ...) se leen de los
+parámetros de consulta (`?op=det&target=A`).
+
+Referencias:
+- Formato `.npy`: https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html
+- `np.frombuffer`: https://numpy.org/doc/stable/reference/generated/numpy.frombuffer.html
+"""
+
+import io
+import json
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Type
+
+import numpy as np
+from pydantic import BaseModel
+
+from ..core import sparse
+from .metrics import stage
+from .parsing import parse_matrix, parse_vector, resolve_dtype, to_exact
+from .store import MatrixStore, is_handle
+
+NPY_TYPE = "application/x-npy"
+NPZ_TYPE = "application/x-npz"
+RAW_TYPE = "application/octet-stream"
+SHAPE_HEADER = "x-matrix-shape"
+
+# Tipo de cada campo matricial: "matrix" (2D) o "vector" (1D)
+FieldKinds = Mapping[str, str]
+
+# Tipos de datos numéricos admitidos (`dtype.kind`): enteros con y sin signo y reales
+NUMERIC_KINDS = "iuf"
+
+
+class RawPayload(NamedTuple):
+    """Cuerpo crudo de la petición junto con los datos necesarios para decodificarlo."""
+    content_type: str
+    body: bytes
+    query: Mapping[str, str]
+    headers: Mapping[str, str]
+
+
+def _media_type(content_type: str) -> str:
+    """Extrae el tipo MIME sin parámetros (`application/json; charset=utf-8` → `application/json`)."""
+    return (content_type or "application/json").split(";")[0].strip().lower()
+
+
+def is_binary(raw: RawPayload) -> bool:
+    """Indica si la petición usa uno de los formatos binarios (opciones por query)."""
+    return _media_type(raw.content_type) in (NPY_TYPE, NPZ_TYPE, RAW_TYPE)
+
+
+def _check_kind(name: str, arr: np.ndarray, kind: str, dtype=float) -> np.ndarray:
+    """Valida la dimensión de un arreglo numérico y lo convierte a `dtype` (`float` por defecto)."""
+    arr = np.asarray(arr, dtype=dtype)
+    if kind == "matrix":
+        if arr.ndim != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+            raise ValueError(f"La matriz {name} debe ser una grilla 2D no vacía")
+    elif arr.ndim != 1 or arr.shape[0] == 0:
+        raise ValueError(f"El vector {name} debe ser una lista 1D no vacía")
+    return arr
+
+
+def _is_numeric(value: Any) -> bool:
+    """Indica si una grilla/lista JSON contiene números (primer elemento no string)."""
+    while isinstance(value, list) and value:
+        value = value[0]
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_sparse_json(value: Any) -> bool:
+    """Indica si un campo JSON es una matriz dispersa (`{"format": "coo"|"csr", ...}`)."""
+    return isinstance(value, dict) and "format" in value
+
+
+def _check_sparse(name: str, kind: str, exact: bool) -> None:
+    """Valida que el campo `name` admita una matriz dispersa."""
+    if kind != "matrix":
+        raise ValueError(f"El vector {name} no admite formato disperso")
+    if exact:
+        raise ValueError("El modo exacto no admite matrices dispersas")
+
+
+def _sparse_json(name: str, value: Dict[str, Any], kind: str, exact: bool) -> "sparse.CSRMatrix":
+    """Convierte una matriz dispersa JSON a `sparse.CSRMatrix`."""
+    _check_sparse(name, kind, exact)
+    return sparse.from_json(name, value)
+
+
+def _stored(name: str, mid: str, kind: str, exact: bool, store: Optional[MatrixStore], dtype=float) -> Any:
+    """Recupera la matriz guardada `mid` y la adapta al campo (tipo y modo exacto)."""
+    if store is None:
+        raise ValueError(f"El campo {name} no admite referencias a matrices guardadas")
+    arr = store.get(mid)
+    if sparse.is_sparse(arr):
+        _check_sparse(name, kind, exact)
+        return arr
+    if arr.dtype == object:
+        # Guardada en modo exacto: se valida la dimensión y se conserva racional si se pide
+        as_float = _check_kind(name, arr, kind, dtype)
+        return arr if exact else as_float
+    return _numeric(name, arr, kind, exact, dtype)
+
+
+def _grid_error(name: str, value: Any) -> str:
+    """Motivo por el que una grilla JSON numérica no se pudo convertir: filas desiguales o la
+    primera celda que no es un número."""
+    if all(isinstance(row, list) for row in value):
+        if len({len(row) for row in value}) > 1:
+            return "Todas las filas deben tener el mismo número de columnas"
+        cells = ((f"[{i}][{j}]", c) for i, row in enumerate(value) for j, c in enumerate(row))
+    else:
+        cells = ((f"[{i}]", c) for i, c in enumerate(value))
+    for where, cell in cells:
+        if isinstance(cell, bool) or not isinstance(cell, (int, float)):
+            return f"Valor no numérico en {name}{where}: {json.dumps(cell)} (no mezcle números y textos)"
+    return "Todas las filas deben tener el mismo número de columnas"
+
+
+def _numeric_json(name: str, value: Any, dtype=float) -> np.ndarray:
+    """Convierte una grilla JSON numérica a `np.ndarray` en un solo paso."""
+    try:
+        return np.asarray(value, dtype=dtype)
+    except (ValueError, TypeError, OverflowError):
+        raise ValueError(_grid_error(name, value))
+
+
+def _numeric(name: str, arr: np.ndarray, kind: str, exact: bool, dtype=float) -> np.ndarray:
+    """Valida un arreglo numérico (JSON, `.npy`, `.npz` o búfer) y, en modo exacto, lo convierte a `Fraction`.
+
+    Rechaza tipos de datos no numéricos (texto, estructurados, complejos, booleanos) y
+    valores `NaN`/`inf`, también los que aparecen al convertir a `float32`.
+    """
+    if arr.dtype.kind not in NUMERIC_KINDS:
+        raise ValueError(f"Tipo de datos no numérico en {name}: {arr.dtype}")
+    checked = _check_kind(name, arr, kind, float if exact else dtype)
+    if not np.isfinite(checked).all():
+        raise ValueError(f"Valor no finito (NaN o infinito) en {name}")
+    return to_exact(checked) if exact else checked
+
+
+def _parse_text(value: Any, kind: str, exact: bool, dtype=float) -> np.ndarray:
+    """Parsea una grilla/lista de strings con `parse_matrix`/`parse_vector`."""
+    parse = parse_matrix if kind == "matrix" else parse_vector
+    return parse(value, exact=exact, dtype=dtype)
+
+
+def _precision(options: BaseModel) -> Tuple[bool, np.dtype]:
+    """`(exact, dtype)` de las opciones; el modo exacto no admite `float32`."""
+    exact = bool(getattr(options, "exact", False))
+    dtype = resolve_dtype(getattr(options, "dtype", "float64"))
+    if exact and dtype != np.float64:
+        raise ValueError("El modo exacto no admite dtype float32")
+    return exact, dtype
+
+
+def _split_augmented(arrays: Dict[str, np.ndarray], kinds: FieldKinds) -> None:
+    """Si falta `b` y `A` es `(n, n+1)`, interpreta `A` como matriz aumentada `[A | b]`."""
+    if "b" in kinds and "b" not in arrays and "A" in arrays:
+        A = np.asarray(arrays["A"])
+        if A.ndim == 2 and A.shape[1] == A.shape[0] + 1:
+            arrays["A"], arrays["b"] = A[:, :-1], A[:, -1]
+
+
+def _parse_shapes(header: str, kinds: FieldKinds):
+    """Interpreta `X-Matrix-Shape`: `3x3` (campo `A`) o `A=3x3;b=3` en orden de búfer."""
+    if not header:
+        raise ValueError("Falta la cabecera X-Matrix-Shape para el búfer binario")
+    specs = []
+    for part in header.split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, dims = part.rpartition("=")
+        name = name.strip() or "A"
+        if name not in kinds:
+            raise ValueError(f"Campo desconocido en X-Matrix-Shape: '{name}'")
+        try:
+            shape = tuple(int(d) for d in dims.lower().split("x"))
+        except ValueError:
+            raise ValueError(f"Forma inválida en X-Matrix-Shape: '{part}'")
+        if any(d <= 0 for d in shape):
+            raise ValueError(f"Forma inválida en X-Matrix-Shape: '{part}'")
+        specs.append((name, shape))
+    return specs
+
+
+def _decode_binary(raw: RawPayload, media: str, kinds: FieldKinds, dtype=float) -> Dict[str, np.ndarray]:
+    """Decodifica `.npy`, `.npz` o búfer plano (float64, o `dtype`) a arreglos por campo."""
+    arrays: Dict[str, np.ndarray] = {}
+    if media == NPY_TYPE:
+        try:
+            arrays["A"] = np.load(io.BytesIO(raw.body), allow_pickle=False)
+        except Exception:
+            raise ValueError("Contenido .npy inválido")
+    elif media == NPZ_TYPE:
+        try:
+            with np.load(io.BytesIO(raw.body), allow_pickle=False) as npz:
+                arrays = {k: npz[k] for k in npz.files if k in kinds}
+        except Exception:
+            raise ValueError("Contenido .npz inválido")
+    else:
+        item = np.dtype(dtype).newbyteorder("<")
+        offset = 0
+        for name, shape in _parse_shapes(raw.headers.get(SHAPE_HEADER, ""), kinds):
+            count = int(np.prod(shape))
+            if offset + count * item.itemsize > len(raw.body):
+                raise ValueError("El búfer binario es más corto que las formas declaradas")
+            arrays[name] = np.frombuffer(raw.body, dtype=item, count=count, offset=offset).reshape(shape)
+            offset += count * item.itemsize
+        if offset != len(raw.body):
+            raise ValueError("El búfer binario no coincide con las formas declaradas")
+    _split_augmented(arrays, kinds)
+    return arrays
+
+
+def decode(
+    raw: RawPayload,
+    options_model: Type[BaseModel],
+    request_model: Type[BaseModel],
+    kinds: FieldKinds,
+    store: Optional[MatrixStore] = None,
+) -> Tuple[BaseModel, Dict[str, Optional[np.ndarray]]]:
+    """Decodifica una petición en opciones validadas y arreglos NumPy por campo.
+
+    Parámetros:
+    - `options_model`: modelo Pydantic con los campos escalares (`op`, `target`, ...).
+    - `request_model`: modelo completo (grillas de strings) usado para JSON textual.
+    - `kinds`: campos matriciales y su tipo (`matrix`/`vector`).
+    - `store`: almacén para resolver campos dados como ID (`"m_..."`).
+
+    Retorna `(opciones, arreglos)`; los campos ausentes valen `None`.
+
+    Errores:
+    - `pydantic.ValidationError` si las opciones o el JSON textual no son válidos.
+    - `ValueError` si el contenido binario/numérico es inválido o falta un campo requerido.
+    """
+    arrays: Dict[str, Optional[np.ndarray]] = {}
+    if is_binary(raw):
+        with stage("validate"):
+            options = options_model.model_validate(dict(raw.query))
+        exact, dtype = _precision(options)
+        with stage("parse"):
+            decoded = _decode_binary(raw, _media_type(raw.content_type), kinds, dtype)
+            for name, kind in kinds.items():
+                if name in decoded:
+                    arrays[name] = _numeric(name, decoded[name], kind, exact, dtype)
+                elif is_handle(raw.query.get(name)):
+                    arrays[name] = _stored(name, raw.query[name], kind, exact, store, dtype)
+                else:
+                    arrays[name] = None
+    else:
+        with stage("validate"):
+            try:
+                data = json.loads(raw.body or b"null")
+            except ValueError:
+                raise ValueError("JSON inválido en el cuerpo de la petición")
+            if not isinstance(data, dict):
+                raise ValueError("El cuerpo JSON debe ser un objeto")
+            textual = not any(
+                _is_numeric(data.get(name)) or _is_sparse_json(data.get(name)) or is_handle(data.get(name))
+                for name in kinds
+            )
+            if textual:
+                # Formato original: grillas de strings validadas por el modelo completo
+                payload = request_model.model_validate(data)
+                options = options_model.model_validate(payload.model_dump(include=set(options_model.model_fields)))
+            else:
+                options = options_model.model_validate({k: v for k, v in data.items() if k not in kinds})
+        exact, dtype = _precision(options)
+        with stage("parse"):
+            for name, kind in kinds.items():
+                value = getattr(payload, name, None) if textual else data.get(name)
+                if value is None:
+                    arrays[name] = None
+                elif is_handle(value):
+                    arrays[name] = _stored(name, value, kind, exact, store, dtype)
+                elif _is_sparse_json(value):
+                    arrays[name] = _sparse_json(name, value, kind, exact)
+                elif _is_numeric(value):
+                    arrays[name] = _numeric(name, _numeric_json(name, value, dtype), kind, exact, dtype)
+                else:
+                    arrays[name] = _parse_text(value, kind, exact, dtype)
+    required = [n for n, f in request_model.model_fields.items() if n in kinds and f.is_required()]
+    for name in required:
+        if arrays.get(name) is None:
+            raise ValueError(f"Falta el campo requerido '{name}'")
+    return options, arrays
@@ -0,0 +1,172 @@
+"""Respuesta JSON que serializa arreglos NumPy directamente.
+
+`JSONResponse` de Starlette exige tipos de Python: cada matriz pasaba por `ndarray.tolist()`
+y luego `json.dumps` recorría cada `float` como objeto. `ArrayJSONResponse` codifica los
+`np.ndarray` sin esa conversión:
+
+- Con `orjson` (dependencia opcional) se usa `OPT_SERIALIZE_NUMPY`, que escribe el búfer
+  del arreglo en C. Sin `orjson` se recurre a `json` con `tolist()` (comportamiento original).
+- `precision` redondea los valores de punto flotante a esa cantidad de decimales
+  (`np.round`) antes de codificar; acorta el cuerpo cuando el cliente no necesita 17 cifras.
+- Los resultados pedidos con `dtype="float32"` se convierten con `cast_floats` y se
+  codifican con la representación más corta de `float32`.
+- Si el cliente acepta `gzip` y el cuerpo supera `GZIP_MIN_BYTES`, se comprime.
+
+Los valores exactos (`Fraction`, arreglos `dtype=object`) se emiten como texto `"p/q"`, las
+matrices dispersas como objeto COO y las colecciones de matrices (iteradores de pares
+`(nombre, matriz)`, ver `utils.streaming`) como objeto, igual que en `streaming.to_jsonable`.
+`NaN`/`inf` se emiten como `null`, con `orjson` y sin él.
+
+Referencia: https://github.com/ijl/orjson#numpy
+"""
+
+import gzip
+import json
+import math
+from fractions import Fraction
+from typing import Any, Mapping, Optional
+
+import numpy as np
+from starlette.responses import JSONResponse
+
+from ..core import sparse
+from .assets import accepted_encodings, accepts
+from .parsing import format_number
+
+try:  # dependencia opcional: sin ella se usa `json` de la biblioteca estándar
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+# Cuerpos menores no se comprimen (el ahorro no compensa el costo de `gzip`)
+GZIP_MIN_BYTES = 64 * 1024
+# Nivel bajo: los números en texto ya se comprimen bien y el objetivo es la latencia
+GZIP_LEVEL = 1
+# Decimales admitidos en `precision`
+MAX_PRECISION = 17
+
+
+def parse_precision(query: Mapping[str, str]) -> Optional[int]:
+    """Lee `?precision=N` (decimales, 0 ≤ N ≤ 17); `None` si no se pidió. `ValueError` si es inválido."""
+    value = query.get("precision")
+    if value is None or value == "":
+        return None
+    try:
+        digits = int(value)
+    except ValueError:
+        digits = -1
+    if not 0 <= digits <= MAX_PRECISION:
+        raise ValueError(f"'precision' debe ser un entero entre 0 y {MAX_PRECISION}")
+    return digits
+
+
+def round_floats(value: Any, digits: int) -> Any:
+    """Copia de `value` con los `float` (escalares y arreglos) redondeados a `digits` decimales."""
+    if isinstance(value, np.ndarray):
+        return np.round(value, digits) if value.dtype.kind in "fc" else value
+    if isinstance(value, (float, np.floating)):
+        return round(float(value), digits)
+    if isinstance(value, dict):
+        return {k: round_floats(v, digits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_floats(v, digits) for v in value]
+    if hasattr(value, "__next__"):
+        return {name: round_floats(np.asarray(M), digits) for name, M in value}
+    return value
+
+
+def cast_floats(value: Any, dtype: Any) -> Any:
+    """Copia de `value` con los arreglos de punto flotante convertidos a `dtype`.
+
+    Con `float32`, `orjson` escribe la representación más corta de cada `float32`
+    (`0.1`, no `0.10000000149011612`), así que el cuerpo también se acorta. Los escalares
+    se conservan (un `|A|` grande no cabe en `float32`).
+    """
+    if isinstance(value, np.ndarray):
+        return value.astype(dtype, copy=False) if value.dtype.kind == "f" else value
+    if isinstance(value, dict):
+        return {k: cast_floats(v, dtype) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [cast_floats(v, dtype) for v in value]
+    if hasattr(value, "__next__"):
+        return ((name, cast_floats(np.asarray(M), dtype)) for name, M in value)
+    return value
+
+
+def _default(value: Any) -> Any:
+    """Tipos que el codificador no maneja por sí mismo."""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return np.vectorize(format_number, otypes=[object])(value).tolist()
+        if orjson is not None and not value.flags.c_contiguous:
+            # `orjson` sólo codifica arreglos C-contiguos (p. ej. una traspuesta no lo es)
+            return np.ascontiguousarray(value)
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Fraction):
+        return format_number(value)
+    if sparse.is_sparse(value):
+        return sparse.to_json(value)
+    if hasattr(value, "__next__"):
+        return {name: np.asarray(M) for name, M in value}
+    raise TypeError(f"Tipo no serializable en JSON: {type(value).__name__}")
+
+
+def _null_nonfinite(value: Any) -> Any:
+    """Copia de `value` con los `float` no finitos como `None` (lo que hace `orjson`)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _null_nonfinite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_nonfinite(v) for v in value]
+    return value
+
+
+def _default_json(value: Any) -> Any:
+    """`_default` para `json`, que escribiría `NaN`/`Infinity` (JSON inválido) en lugar de `null`."""
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        finite = np.isfinite(value)
+        return value.tolist() if finite.all() else np.where(finite, value, None).tolist()
+    return _null_nonfinite(_default(value))
+
+
+def dumps(content: Any) -> bytes:
+    """Codifica `content` (con arreglos NumPy) como JSON UTF-8; `NaN`/`inf` como `null`."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        _null_nonfinite(content), default=_default_json, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class ArrayJSONResponse(JSONResponse):
+    """`JSONResponse` que acepta `np.ndarray` y opcionalmente redondea y comprime.
+
+    Parámetros adicionales:
+    - `precision`: decimales para redondear los `float` (ver `parse_precision`).
+    - `accept_encoding`: cabecera `Accept-Encoding` del cliente; habilita `gzip` para
+      cuerpos de al menos `GZIP_MIN_BYTES`.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        precision: Optional[int] = None,
+        accept_encoding: str = "",
+        **kwargs: Any,
+    ):
+        if precision is not None:
+            content = round_floats(content, precision)
+        super().__init__(content, status_code=status_code, headers=headers, **kwargs)
+        if len(self.body) >= GZIP_MIN_BYTES and accepts(accepted_encodings(accept_encoding), "gzip"):
+            self.body = gzip.compress(self.body, compresslevel=GZIP_LEVEL)
+            self.headers["content-encoding"] = "gzip"
+            self.headers["content-length"] = str(len(self.body))
+            self.headers["vary"] = "Accept-Encoding"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,154 @@
+"""Planificador de ejecución según el costo estimado de cada operación.
+
+Los endpoints síncronos comparten el pool de hilos de Starlette; una inversa de
+3000x3000 ocupa CPU durante segundos y frena a las peticiones pequeñas. El planificador
+estima el costo a partir de la forma y la operación y decide:
+
+- Costo bajo (`< min_flops`): se ejecuta en línea, en el mismo hilo del endpoint.
+- Costo alto: se envía a un `ProcessPoolExecutor` dedicado y acotado (`workers`
+  procesos). Si ya hay `max_pending` trabajos pesados en curso o en cola, se rechaza
+  con `SchedulerBusy` (HTTP 503) en lugar de acumular hilos bloqueados.
+
+Con `blas` (ver `utils.blas`), cada trabajo se ejecuta además con los hilos de BLAS que
+corresponden a su costo: en línea con `BlasThreads.limit` y en el pool con
+`blas.call_with_threads`.
+
+Las funciones enviadas al pool deben ser de nivel de módulo (serializables con `pickle`),
+por ejemplo `matrix_ops.inv` o `linear_systems.cramer`.
+
+Referencia: https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .blas import BlasThreads, call_with_threads
+
+# Factor de costo de la aritmética exacta (`Fraction`, enteros grandes) frente a flops de BLAS
+EXACT_COST_FACTOR = 2000.0
+
+
+class SchedulerBusy(RuntimeError):
+    """No hay capacidad para otro trabajo pesado (se traduce a HTTP 503)."""
+
+
+def estimate_flops(op: str, *shapes: Optional[Tuple[int, ...]], exact: bool = False) -> float:
+    """Estima el número de operaciones de punto flotante de `op` sobre operandos con `shapes`.
+
+    - `det`, `inv`, `cramer`, `inverse`: O(n³).
+    - `solve`: O(n³ + n²·k) para `k` lados derechos.
+    - `mul`: O(m·n·p).
+    - `add`, `sub`, `trans` y otras: O(m·n).
+    """
+    shapes = tuple(s for s in shapes if s is not None)
+    if not shapes:
+        return 0.0
+    first = shapes[0]
+    rows = first[0]
+    cols = first[1] if len(first) > 1 else 1
+    if op in ("det", "inv", "cramer", "inverse"):
+        flops = float(rows) ** 3
+    elif op == "solve":
+        k = shapes[1][1] if len(shapes) > 1 and len(shapes[1]) > 1 else 1
+        flops = float(rows) ** 3 + 2.0 * rows * rows * k
+    elif op == "mul" and len(shapes) > 1:
+        flops = 2.0 * rows * cols * (shapes[1][1] if len(shapes[1]) > 1 else 1)
+    else:
+        flops = float(rows) * cols
+    return flops * (EXACT_COST_FACTOR if exact else 1.0)
+
+
+class Scheduler:
+    """Enruta trabajos en línea o a un pool de procesos acotado según su costo.
+
+    Parámetros:
+    - `workers`: procesos del pool dedicado (0 desactiva el envío: todo en línea).
+    - `min_flops`: costo estimado a partir del cual un trabajo se considera pesado.
+    - `max_pending`: trabajos pesados simultáneos admitidos (en ejecución + en cola).
+    - `blas`: presupuesto de hilos de BLAS por llamada (`None`: sin límites).
+    """
+
+    def __init__(self, workers: int, min_flops: float, max_pending: int, blas: Optional[BlasThreads] = None):
+        self.workers = workers
+        self.blas = blas
+        self.min_flops = min_flops
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.inline = 0
+        self.offloaded = 0
+        self.rejected = 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Crea el pool de forma perezosa (contexto `spawn`: seguro con hilos en el padre)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def run(self, flops: float, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Ejecuta `fn(*args, **kwargs)` en línea o en el pool según `flops`.
+
+        Las excepciones de `fn` (p. ej. `ValueError`) se propagan igual en ambos casos.
+        """
+        if self.workers <= 0 or flops < self.min_flops:
+            with self._lock:
+                self.inline += 1
+            if self.blas is None:
+                return fn(*args, **kwargs)
+            with self.blas.limit(self.blas.threads_for(flops)):
+                return fn(*args, **kwargs)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise SchedulerBusy("Servidor ocupado con cálculos pesados; intente de nuevo en unos segundos")
+            self._pending += 1
+            self.offloaded += 1
+        try:
+            if self.blas is not None:
+                args = (self.blas.threads_for(flops), fn) + args
+                fn = call_with_threads
+            return self._pool().submit(fn, *args, **kwargs).result()
+        except BrokenProcessPool:
+            # Un proceso murió (p. ej. sin memoria): se recrea el pool en la próxima llamada
+            with self._lock:
+                self._executor = None
+            raise SchedulerBusy("El proceso de cálculo se interrumpió; intente de nuevo")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def warm(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Arranca el pool ejecutando `fn(*args)` en un proceso (sin efecto si `workers` es 0).
+
+        Con `spawn`, el primer trabajo pagaba crear el proceso e importar NumPy y `core`;
+        no cuenta como trabajo enviado ni ocupa un lugar de `max_pending`.
+        """
+        if self.workers > 0:
+            self._pool().submit(fn, *args).result()
+
+    def shutdown(self) -> None:
+        """Detiene el pool de procesos (al apagar la aplicación)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de trabajos en línea, enviados al pool y rechazados."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "minFlops": self.min_flops,
+                "maxPending": self.max_pending,
+                "pending": self._pending,
+                "inline": self.inline,
+                "offloaded": self.offloaded,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,123 @@
+"""Almacén en memoria de matrices ya parseadas, referenciadas por un identificador.
+
+El cliente sube una matriz una vez (`POST /api/matrix/store`) y recibe un ID; después
+cualquier campo matricial (`A`, `B`, `b`) acepta ese ID en lugar de la grilla completa,
+de modo que no se repiten la subida ni `parse_matrix`.
+
+- El ID es un hash del contenido (`ResultCache.key`): subir la misma matriz dos veces
+  devuelve el mismo ID y no duplica memoria.
+- Cada entrada expira `ttl` segundos después de su último uso.
+- El total de bytes está acotado por `max_bytes`; al excederlo se expulsan primero las
+  entradas expiradas y luego las menos usadas recientemente (LRU).
+- Los arreglos guardados son de sólo lectura (se comparten entre peticiones).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .cache import ResultCache, _nbytes
+
+# Prefijo de los identificadores (distingue un ID de otros textos en los campos)
+ID_PREFIX = "m_"
+
+
+def is_handle(value: Any) -> bool:
+    """Indica si un valor de campo es una referencia a una matriz guardada."""
+    return isinstance(value, str) and value.startswith(ID_PREFIX)
+
+
+class MatrixStore:
+    """Matrices guardadas con expiración por inactividad y límite de bytes (LRU).
+
+    Parámetros:
+    - `max_bytes`: bytes máximos del total de matrices guardadas.
+    - `ttl`: segundos de inactividad tras los que una matriz expira.
+    - `clock`: reloj monotónico (inyectable en pruebas).
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        # id → (arreglo, bytes, instante del último uso)
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def _info(self, mid: str, arr: Any, size: int) -> Dict[str, Any]:
+        return {"id": mid, "shape": list(arr.shape), "nbytes": size, "ttl": self.ttl}
+
+    def _expire(self, now: float) -> None:
+        """Elimina las entradas inactivas (se llama con el candado tomado)."""
+        for mid in [m for m, (_, _, used) in self._data.items() if now - used > self.ttl]:
+            _, size, _ = self._data.pop(mid)
+            self._bytes -= size
+            self.expirations += 1
+
+    def put(self, arr: Any) -> Optional[Dict[str, Any]]:
+        """Guarda `arr` y retorna `{id, shape, nbytes, ttl}`; `None` si excede `max_bytes`."""
+        size = _nbytes(arr)
+        if size > self.max_bytes:
+            return None
+        mid = ID_PREFIX + ResultCache.key("store", {}, {"M": arr})[:32]
+        if isinstance(arr, np.ndarray):
+            arr.setflags(write=False)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            old = self._data.pop(mid, None)
+            if old is not None:
+                arr, size = old[0], old[1]
+                self._bytes -= size
+            self._data[mid] = (arr, size, now)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, freed, _) = self._data.popitem(last=False)
+                self._bytes -= freed
+                self.evictions += 1
+        return self._info(mid, arr, size)
+
+    def get(self, mid: str) -> Any:
+        """Retorna la matriz `mid` y renueva su expiración; `ValueError` si no existe."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._data.get(mid)
+            if entry is None:
+                raise ValueError(f"Matriz '{mid}' no encontrada o expirada; súbala de nuevo")
+            self._data[mid] = (entry[0], entry[1], now)
+            self._data.move_to_end(mid)
+            return entry[0]
+
+    def info(self, mid: str) -> Dict[str, Any]:
+        """Metadatos de la matriz `mid` (también renueva su expiración)."""
+        arr = self.get(mid)
+        return self._info(mid, arr, _nbytes(arr))
+
+    def delete(self, mid: str) -> bool:
+        """Elimina la matriz `mid`; retorna `False` si no existía."""
+        with self._lock:
+            entry = self._data.pop(mid, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[1]
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupación actual y contadores de expulsiones por LRU y por expiración."""
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "ttl": self.ttl,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
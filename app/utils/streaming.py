@@ -0,0 +1,107 @@
+"""Serialización en streaming (NDJSON) de resultados matriciales grandes.
+
+En lugar de convertir la matriz completa con `ndarray.tolist()` y construir un único
+cuerpo JSON, se emiten las filas directamente desde el `np.ndarray` en bloques de
+`ROWS_PER_CHUNK` filas. La memoria adicional queda acotada a un bloque y el cliente
+recibe las primeras filas de inmediato.
+
+Formato (una línea JSON por registro, `application/x-ndjson`):
+1. Cabecera con los campos escalares y vectores: `{"detA": 2.0, "solution": [...]}`.
+2. Por cada matriz: `{"field": "Ainv", "shape": [n, m]}` seguida de `n` líneas, una por
+   fila: `[a_00, a_01, ...]`. Las matrices anidadas (p. ej. `matrices` de Cramer) usan
+   nombres con punto: `matrices.A1`.
+
+Los valores exactos (`Fraction`, arreglos `dtype=object`) se emiten como texto `"p/q"` y
+las matrices dispersas (`sparse.CSRMatrix`) como objeto COO (`sparse.to_json`), en la cabecera.
+
+Referencia: https://github.com/ndjson/ndjson-spec
+"""
+
+import json
+from fractions import Fraction
+from typing import Any, Dict, Iterator, Mapping
+
+import numpy as np
+
+from ..core import sparse
+from . import responses
+from .parsing import format_number
+
+NDJSON_TYPE = "application/x-ndjson"
+
+# Filas codificadas por bloque enviado al cliente
+ROWS_PER_CHUNK = 64
+
+
+def wants_ndjson(query: Mapping[str, str], accept: str) -> bool:
+    """Indica si el cliente pidió streaming (`?stream=ndjson` o `Accept: application/x-ndjson`)."""
+    return query.get("stream") == "ndjson" or NDJSON_TYPE in (accept or "")
+
+
+def _plain(value: Any) -> Any:
+    """Convierte arreglos, escalares NumPy y `Fraction` a tipos serializables en JSON."""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return np.vectorize(format_number, otypes=[object])(value).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Fraction):
+        return format_number(value)
+    if sparse.is_sparse(value):
+        return sparse.to_json(value)
+    return value
+
+
+def _is_matrix(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and value.ndim == 2
+
+
+def _is_collection(value: Any) -> bool:
+    """Colección de matrices: iterador de pares `(nombre, matriz)` o dict de matrices."""
+    if isinstance(value, dict):
+        return bool(value) and all(_is_matrix(v) for v in value.values())
+    return hasattr(value, "__next__")
+
+
+def _matrix_items(result: Dict[str, Any]):
+    """Recorre `(nombre, matriz)` del resultado, incluidas colecciones de matrices anidadas."""
+    for key, value in result.items():
+        if _is_matrix(value):
+            yield key, value
+        elif _is_collection(value):
+            items = value.items() if isinstance(value, dict) else value
+            for name, M in items:
+                yield f"{key}.{name}", np.asarray(M)
+
+
+def _header(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Campos que no son matrices, con vectores y escalares NumPy convertidos a Python."""
+    head = {}
+    for key, value in result.items():
+        if _is_matrix(value) or _is_collection(value):
+            continue
+        head[key] = _plain(value)
+    return head
+
+
+def iter_ndjson(result: Dict[str, Any]) -> Iterator[bytes]:
+    """Genera el cuerpo NDJSON de `result` bloque a bloque (ver formato en el módulo)."""
+    yield (json.dumps(_header(result)) + "\n").encode()
+    for name, M in _matrix_items(result):
+        yield (json.dumps({"field": name, "shape": list(M.shape)}) + "\n").encode()
+        for start in range(0, M.shape[0], ROWS_PER_CHUNK):
+            block = M[start:start + ROWS_PER_CHUNK]
+            yield b"".join(responses.dumps(row) + b"\n" for row in block)
+
+
+def to_jsonable(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convierte un resultado con `np.ndarray` a listas para la respuesta JSON normal."""
+    out = {}
+    for key, value in result.items():
+        if _is_collection(value):
+            items = value.items() if isinstance(value, dict) else value
+            out[key] = {name: _plain(np.asarray(M)) for name, M in items}
+        else:
+            out[key] = _plain(value)
+    return out
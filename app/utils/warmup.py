@@ -0,0 +1,168 @@
+"""Arranque en frío: precalentamiento de rutinas y perfil de tiempos de inicio.
+
+En el plan gratuito de Render (`render.yaml`) la instancia se suspende sin tráfico y la
+primera petición tras despertar pagaba importar NumPy, arrancar los hilos de BLAS, la
+primera validación con Pydantic, la primera serialización y la primera llamada de cada
+rutina de `core`. Al iniciar la aplicación:
+
+- `StartupProfile` registra la duración de cada fase (importaciones, medidas desde el inicio
+  del proceso con `process_age`; carga de estáticos y cada paso de precalentamiento) y si
+  la instancia ya está lista.
+- `run` ejecuta los pasos de precalentamiento (`core_steps` más los que agrega `main`)
+  sobre matrices pequeñas, y un producto mediano que obliga a BLAS a crear sus hilos.
+  Al terminar escribe el desglose en el log y marca la instancia como lista.
+
+Modos (`config.WARMUP_MODE`, variable `CALC_WARMUP`):
+- `off`: sin precalentamiento; la instancia está lista de inmediato.
+- `background` (por defecto): precalienta en un hilo; `/health` responde 200 desde el inicio.
+- `gate`: igual, pero `/health` responde 503 hasta que el precalentamiento termina, de modo
+  que el balanceador no envía tráfico a una instancia fría.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..core import exact, linear_systems, matrix_ops, sparse
+
+WARMUP_MODES = ("off", "background", "gate")
+
+# Tamaño de las matrices de precalentamiento: recorre cada rutina sin costo perceptible
+WARMUP_N = 8
+# Producto por encima del umbral en que OpenBLAS reparte el trabajo y crea sus hilos
+BLAS_WARMUP_N = 256
+
+# Paso de precalentamiento: (nombre de la fase, función sin argumentos)
+Step = Tuple[str, Callable[[], Any]]
+
+# Con uvicorn, los mensajes de este logger aparecen junto a los de arranque del servidor
+logger = logging.getLogger("uvicorn.error")
+
+# Respaldo de `process_age` donde no hay `/proc`: momento en que se importó este módulo
+_IMPORTED = time.perf_counter()
+
+
+def process_age() -> float:
+    """Segundos desde el inicio del proceso (intérprete e importaciones incluidos).
+
+    En Linux se lee de `/proc` (resolución de un tick, ~10 ms); en otro sistema se mide
+    desde la importación de este módulo.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Campos tras el nombre del ejecutable, que va entre paréntesis; `starttime` es el 22.º
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):  # pragma: no cover - fuera de Linux
+        return time.perf_counter() - _IMPORTED
+
+
+class StartupProfile:
+    """Duración de las fases de arranque y estado de preparación de la instancia.
+
+    Parámetros:
+    - `clock`: reloj monotónico (inyectable en pruebas).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        # fase → segundos, en orden de ejecución
+        self.phases: Dict[str, float] = {}
+        self.ready = threading.Event()
+        self.error: Optional[str] = None
+
+    def record(self, name: str, seconds: float) -> None:
+        """Suma `seconds` a la fase `name`."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mide el bloque `with` como la fase `name` (también si lanza una excepción)."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - start)
+
+    def stats(self) -> Dict[str, Any]:
+        """`ready`, duración de cada fase y total (ms) y el error del precalentamiento, si hubo."""
+        with self._lock:
+            phases = {name: round(seconds * 1000.0, 3) for name, seconds in self.phases.items()}
+        return {
+            "ready": self.ready.is_set(),
+            "phases": phases,
+            "totalMs": round(sum(phases.values()), 3),
+            "error": self.error,
+        }
+
+
+def core_steps() -> List[Step]:
+    """Pasos que ejercitan cada rutina de `matrix_ops` y `linear_systems` (y sus vías por estructura)."""
+    n = WARMUP_N
+    rng = np.random.default_rng(0)
+    A = rng.random((n, n)) + n * np.eye(n)
+    S = A @ A.T
+    T = np.diag(np.full(n, 4.0)) + np.diag(np.ones(n - 1), 1) + np.diag(np.ones(n - 1), -1)
+    b = np.ones(n)
+    big = rng.random((BLAS_WARMUP_N, BLAS_WARMUP_N))
+
+    def dense():
+        matrix_ops.add(A, A)
+        matrix_ops.subtract(A, A)
+        matrix_ops.transpose(A)
+        matrix_ops.multiply_chain([A, A, A])
+        matrix_ops.power(A, 3)
+        matrix_ops.det(A)
+        for M in (A, S, T, np.tril(A), np.diag(np.diag(A))):
+            matrix_ops.inv(M)
+        matrix_ops.DenseLU(A).solve(b)
+
+    def systems():
+        linear_systems.cramer(A, b)
+        linear_systems.inverse_solve(A, b)
+        linear_systems.multi_solve(A, np.stack([b, b], axis=1), include_inverse=True)
+        list(linear_systems.solve_stream(A, [b]))
+        linear_systems.iterative_solve(S, b, method="cg")
+        linear_systems.iterative_solve(A, b, method="gmres")
+
+    def special():
+        exact.det(np.eye(3, dtype=int).astype(object))
+        sparse.det(sparse.CSRMatrix.from_dense(T))
+
+    return [
+        ("warmup.blas", lambda: matrix_ops.multiply(big, big)),
+        ("warmup.matrix_ops", dense),
+        ("warmup.linear_systems", systems),
+        ("warmup.exact_sparse", special),
+    ]
+
+
+def run(profile: StartupProfile, steps: List[Step]) -> None:
+    """Ejecuta `steps` midiendo cada uno, registra el desglose y marca la instancia lista.
+
+    Un paso que falla no impide que la instancia quede lista (sólo perdería el
+    precalentamiento): el error queda en `profile.error` y en el log.
+    """
+    try:
+        for name, fn in steps:
+            with profile.phase(name):
+                fn()
+    except Exception as e:  # noqa: BLE001 - el precalentamiento nunca debe tumbar el servidor
+        profile.error = f"{type(e).__name__}: {e}"
+        logger.warning("Precalentamiento interrumpido: %s", profile.error)
+    finally:
+        profile.ready.set()
+        stats = profile.stats()
+        logger.info(
+            "Arranque listo en %.1f ms (%s)",
+            stats["totalMs"], ", ".join(f"{name}={ms:.1f} ms" for name, ms in stats["phases"].items()),
+        )
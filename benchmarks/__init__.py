@@ -0,0 +1 @@
+"""Suites de rendimiento (no forman parte de la aplicación ni de `pytest`)."""
@@ -0,0 +1,288 @@
+"""Prueba de carga con una mezcla ponderada de peticiones a la API.
+
+Envía peticiones de `/api/matrix/operate`, `/api/linear/cramer`, `/api/linear/inverse` y
+`/api/vectors/calc` a la aplicación en el mismo proceso (`app.main.app` vía ASGI, sin red)
+o a un servidor uvicorn local (`--url`), y reporta en JSON el rendimiento (peticiones/s),
+la latencia p50/p95/p99 y la tasa de errores, en total y por escenario.
+
+Modelo de carga cerrado: `--concurrency` clientes envían una petición tras otra durante
+`--duration` segundos (o hasta `--requests` peticiones en total). Cada petición elige un
+escenario según los pesos de `--mix` y un tamaño de `--sizes`.
+
+Escenarios (`--mix nombre=peso,...`):
+- `operate:<op>`: `/api/matrix/operate` con `op` = `add`, `sub`, `mul`, `det`, `inv` o `trans`.
+- `cramer`: `/api/linear/cramer` (con las matrices `A_k` sólo hasta n = `CRAMER_MATRICES_MAX_N`,
+  como en sistemas del tamaño de la interfaz).
+- `inverse`: `/api/linear/inverse`.
+- `vectors`: `/api/vectors/calc` (vectores 2D; no depende del tamaño).
+
+Los cuerpos se generan antes de medir (`--variants` distintos por escenario y tamaño, como
+grillas de texto igual que la interfaz o numéricas con `--format numeric`). Con pocas
+variantes, las repeticiones aciertan en la caché de resultados: `--no-cache` la desactiva en
+el modo en proceso; contra `--url`, usar `CALC_CACHE_ENABLED=false` en el servidor.
+
+Uso:
+    python -m benchmarks.loadtest --duration 10 --concurrency 8
+    python -m benchmarks.loadtest --mix operate:mul=3,operate:inv=1,cramer=2,inverse=2,vectors=2 --sizes 10,100
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000 --output carga.json
+    python -m benchmarks.loadtest --max-error-rate 0.01     # código 1 si se supera
+
+Requiere `httpx` (el mismo cliente que usa `fastapi.testclient`). El modo en proceso no
+ejecuta el ciclo de vida de la aplicación (sin precalentamiento ni pool de procesos hasta el
+primer cálculo pesado); `--warmup` envía peticiones previas que no se cuentan.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_MIX = "operate:mul=3,operate:det=1,operate:inv=1,cramer=2,inverse=2,vectors=3"
+DEFAULT_SIZES = [3, 10, 50]
+OPERATE_OPS = ("add", "sub", "mul", "det", "inv", "trans")
+# Hasta este tamaño, Cramer pide también las matrices `A_k` (como la interfaz)
+CRAMER_MATRICES_MAX_N = 10
+# Percentiles reportados
+PERCENTILES = (50, 95, 99)
+
+# Escenario: (nombre, ruta, cuerpos por tamaño)
+Scenario = Tuple[str, str, Dict[int, List[bytes]]]
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Lee `nombre=peso,...`; `ValueError` si un escenario no existe o los pesos no son positivos."""
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.strip().partition("=")
+        kind, _, op = name.partition(":")
+        if kind == "operate" and op not in OPERATE_OPS:
+            raise ValueError(f"Operación desconocida en '{name}'; use una de {', '.join(OPERATE_OPS)}")
+        if kind not in ("operate", "cramer", "inverse", "vectors") or (op and kind != "operate"):
+            raise ValueError(f"Escenario desconocido: '{name}'")
+        try:
+            mix[name] = float(weight or 1)
+        except ValueError:
+            raise ValueError(f"Peso inválido en '{part.strip()}'")
+        if mix[name] <= 0:
+            raise ValueError(f"El peso de '{name}' debe ser positivo")
+    if not mix:
+        raise ValueError("La mezcla no tiene escenarios")
+    return mix
+
+
+def _grid(M: np.ndarray, numeric: bool) -> Any:
+    """Matriz o vector como lista JSON: números o textos (como los envía la interfaz)."""
+    return M.tolist() if numeric else np.vectorize(lambda x: f"{x:.6g}", otypes=[object])(M).tolist()
+
+
+def _body(name: str, n: int, rng: np.random.Generator, numeric: bool) -> Tuple[str, Dict[str, Any]]:
+    """Ruta y cuerpo de una petición del escenario `name` con matrices n×n bien condicionadas."""
+    kind, _, op = name.partition(":")
+    if kind == "vectors":
+        u, v = rng.uniform(0.5, 5.0, 2), rng.uniform(0.0, 360.0, 2)
+        return "/api/vectors/calc", {
+            "inputMode": "polar",
+            "v1": {"mag": f"{u[0]:.4g}", "deg": f"{v[0]:.4g}"},
+            "v2": {"mag": f"{u[1]:.4g}", "deg": f"{v[1]:.4g}"},
+            "show": {"parallelogram": True, "subtraction": False},
+        }
+    # Identidad más ruido acotado: invertible y con |A| sin desbordamiento (como `microbench`)
+    A = np.eye(n) + rng.normal(size=(n, n)) / (4.0 * np.sqrt(n))
+    if kind == "operate":
+        return "/api/matrix/operate", {"op": op, "A": _grid(A, numeric), "B": _grid(rng.normal(size=(n, n)), numeric)}
+    b = _grid(rng.normal(size=n), numeric)
+    if kind == "cramer":
+        return "/api/linear/cramer", {"A": _grid(A, numeric), "b": b, "includeMatrices": n <= CRAMER_MATRICES_MAX_N}
+    return "/api/linear/inverse", {"A": _grid(A, numeric), "b": b}
+
+
+def build_scenarios(mix: Dict[str, float], sizes: List[int], variants: int, numeric: bool = False,
+                    seed: int = 0) -> List[Scenario]:
+    """Genera `variants` cuerpos JSON por escenario y tamaño (antes de medir)."""
+    rng = np.random.default_rng(seed)
+    scenarios = []
+    for name in mix:
+        path, bodies = "", {}
+        for n in sizes:
+            if name == "vectors" and bodies:
+                bodies[n] = bodies[sizes[0]]
+                continue
+            encoded = []
+            for _ in range(variants):
+                path, body = _body(name, n, rng, numeric)
+                encoded.append(json.dumps(body).encode("utf-8"))
+            bodies[n] = encoded
+        scenarios.append((name, path, bodies))
+    return scenarios
+
+
+def _latency(samples: List[float]) -> Dict[str, float]:
+    """Percentiles, media y máximo de las latencias (ms)."""
+    if not samples:
+        return {}
+    ms = np.asarray(samples) * 1000.0
+    out = {f"p{p}": round(float(np.percentile(ms, p)), 3) for p in PERCENTILES}
+    out["mean"] = round(float(ms.mean()), 3)
+    out["max"] = round(float(ms.max()), 3)
+    return out
+
+
+def _summary(records: List[Tuple[str, int, float, int]], elapsed: float) -> Dict[str, Any]:
+    """Totales de `(escenario, tamaño, latencia, estado)`; estado 0 = error de conexión."""
+    errors = sum(1 for _, _, _, status in records if not 200 <= status < 300)
+    return {
+        "requests": len(records),
+        "errors": errors,
+        "errorRate": round(errors / len(records), 6) if records else 0.0,
+        "throughput": round(len(records) / elapsed, 3) if elapsed > 0 else 0.0,
+        "latencyMs": _latency([latency for _, _, latency, _ in records]),
+        "status": dict(sorted(Counter(str(status) for _, _, _, status in records).items())),
+    }
+
+
+async def _drive(client: Any, scenarios: List[Scenario], weights: List[float], sizes: List[int],
+                 concurrency: int, duration: float, total: Optional[int], seed: int) -> Tuple[list, float]:
+    """Ejecuta los clientes concurrentes y retorna los registros y el tiempo transcurrido."""
+    records: List[Tuple[str, int, float, int]] = []
+    issued = 0
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def worker(index: int) -> None:
+        nonlocal issued
+        rng = random.Random(seed + index)
+        while time.perf_counter() < deadline and (total is None or issued < total):
+            issued += 1
+            name, path, bodies = rng.choices(scenarios, weights)[0]
+            n = rng.choice(sizes)
+            body = rng.choice(bodies[n])
+            t0 = time.perf_counter()
+            try:
+                response = await client.post(path, content=body, headers={"content-type": "application/json"})
+                status = response.status_code
+            except Exception:  # noqa: BLE001 - conexión rechazada, tiempo agotado, etc.
+                status = 0
+            records.append((name, n, time.perf_counter() - t0, status))
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return records, time.perf_counter() - start
+
+
+async def _run(url: Optional[str], scenarios: List[Scenario], weights: List[float], sizes: List[int],
+               concurrency: int, duration: float, total: Optional[int], warmup: int, timeout: float,
+               seed: int) -> Tuple[list, float]:
+    import httpx
+
+    if url:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=concurrency))
+        base_url = url.rstrip("/")
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=timeout) as client:
+        if warmup:
+            await _drive(client, scenarios, weights, sizes, concurrency, float("inf"), warmup, seed - 1)
+        return await _drive(client, scenarios, weights, sizes, concurrency, duration, total, seed)
+
+
+def run(mix: Dict[str, float], sizes: List[int], concurrency: int = 4, duration: float = 10.0,
+        requests: Optional[int] = None, url: Optional[str] = None, variants: int = 8, numeric: bool = False,
+        warmup: int = 0, cache: bool = True, timeout: float = 60.0, seed: int = 0) -> Dict[str, Any]:
+    """Ejecuta la prueba y retorna `{"meta": ..., "total": ..., "scenarios": {nombre: {tamaño: ...}}}`.
+
+    Sin `url` se usa `app.main.app` en el mismo proceso; `cache=False` desactiva entonces su
+    caché de resultados durante la prueba.
+    """
+    scenarios = build_scenarios(mix, sizes, variants, numeric, seed)
+    weights = [mix[name] for name, _, _ in scenarios]
+    previous = None
+    if url is None and not cache:
+        from app.main import result_cache
+
+        previous, result_cache.enabled = result_cache.enabled, False
+    try:
+        records, elapsed = asyncio.run(
+            _run(url, scenarios, weights, sizes, concurrency, duration, requests, warmup, timeout, seed)
+        )
+    finally:
+        if previous is not None:
+            result_cache.enabled = previous
+    by_scenario: Dict[str, Dict[str, Any]] = {}
+    for name, _, _ in scenarios:
+        sizes_used = sizes[:1] if name == "vectors" else sizes
+        by_scenario[name] = {"all": _summary([r for r in records if r[0] == name], elapsed)}
+        if len(sizes_used) > 1:
+            for n in sizes_used:
+                by_scenario[name][str(n)] = _summary([r for r in records if r[0] == name and r[1] == n], elapsed)
+    meta = {
+        "target": url or "in-process",
+        "concurrency": concurrency,
+        "duration": round(elapsed, 3),
+        "mix": mix,
+        "sizes": sizes,
+        "variants": variants,
+        "format": "numeric" if numeric else "text",
+        "cache": cache if url is None else None,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+    }
+    return {"meta": meta, "total": _summary(records, elapsed), "scenarios": by_scenario}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="", help="servidor a probar (por defecto, la aplicación en proceso)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="escenarios y pesos: nombre=peso,...")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="tamaños n separados por comas")
+    parser.add_argument("--concurrency", type=int, default=4, help="clientes simultáneos")
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos de medición")
+    parser.add_argument("--requests", type=int, default=0, help="detener tras N peticiones (0 = sólo duración)")
+    parser.add_argument("--variants", type=int, default=8, help="cuerpos distintos por escenario y tamaño")
+    parser.add_argument("--format", choices=("text", "numeric"), default="text", help="grillas de texto o numéricas")
+    parser.add_argument("--warmup", type=int, default=0, help="peticiones previas no contadas")
+    parser.add_argument("--no-cache", action="store_true", help="desactivar la caché de resultados (en proceso)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="tiempo máximo por petición (s)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de cuerpos y elección de escenarios")
+    parser.add_argument("--output", default="", help="archivo JSON de resultados (por defecto, stdout)")
+    parser.add_argument("--max-error-rate", type=float, default=None, help="termina con código 1 si se supera")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+        sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    except ValueError as e:
+        parser.error(str(e))
+    if not sizes or min(sizes) < 1:
+        parser.error("--sizes debe contener enteros positivos")
+    report = run(
+        mix, sizes, concurrency=max(1, args.concurrency), duration=args.duration,
+        requests=args.requests or None, url=args.url or None, variants=max(1, args.variants),
+        numeric=args.format == "numeric", warmup=args.warmup, cache=not args.no_cache,
+        timeout=args.timeout, seed=args.seed,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.max_error_rate is not None and report["total"]["errorRate"] > args.max_error_rate:
+        print(f"Tasa de errores {report['total']['errorRate']:.2%} > {args.max_error_rate:.2%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
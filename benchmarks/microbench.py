@@ -0,0 +1,183 @@
+"""Microbenchmarks de las funciones numéricas y de parseo.
+
+Mide `parse_matrix`, `matrix_ops.det/inv/multiply`, `linear_systems.cramer/inverse_solve`
+y `vectors.plot_data` sobre una escalera de tamaños, guarda los tiempos en JSON y
+compara contra una línea base: si alguna función (tiempo mínimo) es más lenta que
+`base · (1 + threshold)`, el proceso termina con código 1.
+
+Uso:
+    python -m benchmarks.microbench                          # escalera por defecto, imprime JSON
+    python -m benchmarks.microbench --sizes 2,10,100 --output bench.json
+    python -m benchmarks.microbench --update-baseline        # guarda la línea base
+    python -m benchmarks.microbench --threshold 0.3          # compara (30 % de tolerancia)
+
+La línea base (`benchmarks/baseline.json`, versionada) depende de la máquina: se genera
+con `--update-baseline` en el mismo entorno donde se ejecutará la comparación (p. ej. el
+runner de CI) y registra ese entorno en `meta`; si no coincide se avisa por stderr. Con
+`--threshold` explícito, la falta de línea base es un error (código 2), no un aprobado.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core import linear_systems, matrix_ops, vectors
+from app.utils.parsing import parse_matrix
+
+DEFAULT_SIZES = [2, 4, 10, 50, 100, 500, 1000, 2000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Tiempo mínimo por muestra y número de muestras (se reporta la mediana)
+MIN_SAMPLE_TIME = 0.05
+SAMPLES = 5
+
+# Diferencia absoluta mínima (segundos) para considerar una regresión: evita falsos
+# positivos por ruido en funciones de microsegundos
+MIN_ABS_DIFF = 2e-6
+
+# Regresión tolerada por defecto (25 %)
+DEFAULT_THRESHOLD = 0.25
+
+# Datos del entorno que deben coincidir con los de la línea base para comparar tiempos
+META_KEYS = ("python", "numpy", "machine", "processor", "cpus")
+
+# Límites de tamaño por función para mantener la suite en minutos y no en horas
+MAX_SIZE = {"parse_matrix": 1000}
+
+
+def _time(fn: Callable[[], object]) -> Dict[str, float]:
+    """Mide `fn` con repeticiones adaptativas; retorna mediana y mínimo por llamada."""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= MIN_SAMPLE_TIME or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(SAMPLES - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - t0) / loops)
+    return {"median": statistics.median(samples), "min": min(samples), "loops": loops}
+
+
+def _cases(n: int, rng: np.random.Generator) -> Dict[str, Callable[[], object]]:
+    """Construye las funciones a medir para el tamaño `n` (entradas bien condicionadas)."""
+    # Identidad más ruido acotado: bien condicionada y con |A| sin desbordamiento
+    A = np.eye(n) + rng.normal(size=(n, n)) / (4.0 * np.sqrt(n))
+    B = rng.normal(size=(n, n))
+    b = rng.normal(size=n)
+    cells = [[f"{x:.6g}" for x in row] for row in A]
+    u = np.array([float(n), n / 2.0])
+    v = np.array([-n / 3.0, float(n)])
+    return {
+        "parse_matrix": lambda: parse_matrix(cells),
+        "matrix_ops.det": lambda: matrix_ops.det(A),
+        "matrix_ops.inv": lambda: matrix_ops.inv(A),
+        "matrix_ops.multiply": lambda: matrix_ops.multiply(A, B),
+        "linear_systems.cramer": lambda: linear_systems.cramer(A, b, include_matrices=False),
+        "linear_systems.inverse_solve": lambda: linear_systems.inverse_solve(A, b),
+        "vectors.plot_data": lambda: vectors.plot_data(u, v, {"parallelogram": True}),
+    }
+
+
+def run(sizes: List[int], only: Optional[List[str]] = None, seed: int = 0) -> Dict[str, object]:
+    """Ejecuta la suite y retorna `{"meta": ..., "results": {función: {tamaño: tiempos}}}`."""
+    rng = np.random.default_rng(seed)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for n in sizes:
+        for name, fn in _cases(n, rng).items():
+            if only and name not in only:
+                continue
+            if n > MAX_SIZE.get(name, n):
+                continue
+            results.setdefault(name, {})[str(n)] = _time(fn)
+    meta = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "system": platform.system(),
+        "sizes": sizes,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """Lista de regresiones: casos cuyo tiempo mínimo supera `base · (1 + threshold)`.
+
+    Se compara el mínimo de las muestras (más estable que la mediana ante ruido del
+    sistema) y se ignoran diferencias absolutas menores que `MIN_ABS_DIFF`.
+    """
+    regressions = []
+    base = baseline.get("results", {})
+    for name, by_size in current.get("results", {}).items():
+        for size, timing in by_size.items():
+            ref = base.get(name, {}).get(size)
+            if not ref:
+                continue
+            ratio = timing["min"] / ref["min"]
+            if ratio > 1.0 + threshold and timing["min"] - ref["min"] > MIN_ABS_DIFF:
+                regressions.append(f"{name} n={size}: {ratio:.2f}x ({ref['min']:.3e}s → {timing['min']:.3e}s)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="tamaños n separados por comas")
+    parser.add_argument("--only", default="", help="funciones a medir, separadas por comas")
+    parser.add_argument("--output", default="", help="archivo JSON de resultados (por defecto, stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="archivo JSON de línea base")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="regresión tolerada (por defecto 0.25 = 25 %%); exige que exista la línea base")
+    parser.add_argument("--update-baseline", action="store_true", help="guardar los resultados como línea base")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.only.split(",") if s.strip()] or None
+    current = run(sizes, only)
+    text = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Línea base guardada en {args.baseline}", file=sys.stderr)
+        return 0
+    if not os.path.exists(args.baseline):
+        if args.threshold is not None:
+            # Comparación pedida explícitamente (p. ej. en CI): sin línea base no se puede aprobar
+            print(f"ERROR: sin línea base en {args.baseline}; genérela con --update-baseline", file=sys.stderr)
+            return 2
+        print(f"Sin línea base en {args.baseline}; no se compara", file=sys.stderr)
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    for key in META_KEYS:
+        if baseline.get("meta", {}).get(key) != current["meta"][key]:
+            print(f"Aviso: la línea base es de otro entorno ({key}: {baseline.get('meta', {}).get(key)!r}"
+                  f" ≠ {current['meta'][key]!r}); los tiempos pueden no ser comparables", file=sys.stderr)
+    regressions = compare(current, baseline, DEFAULT_THRESHOLD if args.threshold is None else args.threshold)
+    for line in regressions:
+        print(f"REGRESIÓN {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import gzip
+
+from app.utils import assets
+from app.utils.assets import StaticAssets
+
+
+def test_assets_precompressed_with_etag(tmp_path):
+    (tmp_path / "app.js").write_text("console.log('hola');\n" * 200)
+    (tmp_path / "tiny.css").write_text("a{}")
+    static = StaticAssets(str(tmp_path))
+    js = static.get("app.js")
+    assert js.media_type.endswith("charset=utf-8")
+    resp = js.response({"accept-encoding": "gzip, deflate"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(resp.body) == js.bodies["identity"]
+    etag = resp.headers["etag"]
+    assert etag != js.etags["identity"] and resp.headers["vary"] == "Accept-Encoding"
+    assert js.response({"accept-encoding": "gzip", "if-none-match": etag}).status_code == 304
+    # Otra codificación es otra representación: el ETag de gzip no valida la identidad
+    plain = js.response({"accept-encoding": "gzip;q=0", "if-none-match": etag})
+    assert plain.status_code == 200 and "content-encoding" not in plain.headers
+    assert static.get("tiny.css").select("gzip, br") == "identity"
+    assert static.get("missing.js") is None
+    weights = assets.accepted_encodings("br;q=0.5, gzip;q=0")
+    assert weights == {"br": 0.5, "gzip": 0.0}
+    assert assets.accepts(weights, "br") and not assets.accepts(weights, "gzip")
+    assert assets.accepts(assets.accepted_encodings("*"), "gzip")
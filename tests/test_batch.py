@@ -0,0 +1,48 @@
+import numpy as np
+from app.core import batch
+
+
+def test_batch_stacked_matches_single():
+    rng = np.random.default_rng(0)
+    mats = [rng.normal(size=(3,3)) for _ in range(5)]
+    jobs = [("det", M, None) for M in mats] + [("inv", M, None) for M in mats]
+    jobs += [("mul", mats[i], mats[i+1]) for i in range(4)]
+    res = batch.run(jobs)
+    for M, r in zip(mats, res[:5]):
+        assert abs(r['scalar'] - np.linalg.det(M)) < 1e-9
+    for M, r in zip(mats, res[5:10]):
+        np.testing.assert_allclose(r['resultMatrix'], np.linalg.inv(M))
+    for i, r in enumerate(res[10:]):
+        np.testing.assert_allclose(r['resultMatrix'], mats[i].dot(mats[i+1]))
+
+
+def test_batch_errors_per_job():
+    S = np.array([[1,2],[2,4]], dtype=float)
+    I = np.eye(2)
+    res = batch.run([("inv", S, None), ("inv", I, None), ("add", I, np.ones((3,3))), ("det", np.ones((2,3)), None)])
+    assert 'error' in res[0]
+    np.testing.assert_allclose(res[1]['resultMatrix'], I)
+    assert 'error' in res[2]
+    assert 'error' in res[3]
+
+
+def test_batch_exact_jobs_run_individually():
+    from fractions import Fraction
+    from app.utils.parsing import parse_matrix
+    A = parse_matrix([["1/2", "1"], ["1/3", "1"]], exact=True)
+    res = batch.run([("det", A, None), ("det", A.copy(), None), ("inv", A, None)])
+    assert res[0]["scalar"] == res[1]["scalar"] == Fraction(1, 6)
+    assert res[2]["resultMatrix"][0, 0] == Fraction(6)
+
+
+def test_batch_pow_stacks_by_exponent():
+    rng = np.random.default_rng(1)
+    mats = [rng.normal(size=(3, 3)) + 3 * np.eye(3) for _ in range(3)]
+    jobs = [("pow", M, 5) for M in mats] + [("pow", M, -2) for M in mats[:2]] + [("pow", np.ones((2, 3)), 2)]
+    assert batch._group_key(jobs[0]) != batch._group_key(jobs[3])
+    res = batch.run(jobs)
+    for M, r in zip(mats, res[:3]):
+        np.testing.assert_allclose(r["resultMatrix"], np.linalg.matrix_power(M, 5))
+    for M, r in zip(mats, res[3:5]):
+        np.testing.assert_allclose(r["resultMatrix"], np.linalg.matrix_power(np.linalg.inv(M), 2))
+    assert "error" in res[5]
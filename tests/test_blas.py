@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from app.core import matrix_ops as mo
+from app.utils import blas
+from app.utils.scheduler import Scheduler
+
+
+class FakeBackend:
+    name = "fake"
+    version = None
+
+    def __init__(self):
+        self.threads = 8
+        self.history = []
+
+    def get(self):
+        return self.threads
+
+    def set(self, threads):
+        self.threads = threads
+        self.history.append(threads)
+
+
+def test_blas_threads_budget_and_limit():
+    ctl = FakeBackend()
+    bt = blas.BlasThreads(4, 1e6, ctl=ctl)
+    bt.apply()
+    assert ctl.threads == 4
+    assert bt.threads_for(1e3) == 1 and bt.threads_for(1e7) == 4
+    with bt.limit(4):
+        # Una llamada pequeña concurrente no reduce los hilos de la grande
+        with bt.limit(1):
+            assert ctl.threads == 4
+        assert ctl.threads == 4
+    with bt.limit(1):
+        assert ctl.threads == 1
+    assert ctl.threads == 4 and ctl.history == [4, 1, 4]
+    st = bt.stats()
+    assert st["backend"] == "fake" and st["single"] == 2 and st["parallel"] == 1 and st["active"] == 0
+    assert blas.default_budget(10 ** 6) == 1
+
+
+def test_scheduler_applies_blas_threads():
+    ctl = FakeBackend()
+    sched = Scheduler(workers=1, min_flops=1e9, max_pending=1, blas=blas.BlasThreads(2, 1e6, ctl=ctl))
+    A = np.array([[4.0, 7.0], [2.0, 6.0]])
+    assert sched.run(8.0, mo.det, A) == pytest.approx(10.0)
+    assert ctl.history == [1, 2]
+    try:
+        # En el pool, el trabajo se envuelve con `call_with_threads` (serializable)
+        assert sched.run(1e9, mo.det, A) == pytest.approx(10.0)
+    finally:
+        sched.shutdown()
+    assert sched.stats()["offloaded"] == 1
@@ -0,0 +1,32 @@
+import numpy as np
+from app.utils.cache import ResultCache
+
+
+def test_cache_hits_and_lru_eviction():
+    cache = ResultCache(max_entries=2, max_bytes=10**6)
+    A = np.eye(3)
+    calls = []
+
+    def compute(M):
+        calls.append(1)
+        return {"resultMatrix": M * 2}
+
+    for M in (A, A.copy(), 2 * A, A, 3 * A, 2 * A):
+        cache.get_or_compute("op", {"op": "x"}, {"A": M}, lambda: compute(M))
+    # A (miss), A (hit), 2A (miss), A (hit), 3A (miss, expulsa 2A), 2A (miss)
+    assert len(calls) == 4
+    st = cache.stats()
+    assert st["hits"] == 2 and st["misses"] == 4 and st["entries"] == 2 and st["evictions"] == 2
+
+
+def test_cache_byte_bound_and_disabled():
+    cache = ResultCache(max_entries=10, max_bytes=100)
+    big = {"resultMatrix": np.zeros((10, 10))}
+    assert cache.put("k", big) is not None
+    assert cache.stats()["entries"] == 0
+    gen = ((f"A{k}", np.zeros((10, 10))) for k in range(3))
+    out = cache.put("k2", {"matrices": gen})
+    assert len(list(out["matrices"])) == 3
+    off = ResultCache(10, 10**6, enabled=False)
+    off.get_or_compute("op", {}, {"A": np.eye(2)}, lambda: {"x": 1})
+    assert off.stats()["misses"] == 0 and off.stats()["entries"] == 0
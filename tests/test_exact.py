@@ -0,0 +1,35 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from app.core import exact, matrix_ops as mo, linear_systems as ls
+from app.utils.parsing import parse_matrix, parse_vector
+
+
+def test_exact_det_inv():
+    A = parse_matrix([["1/2", "1/3"], ["1/4", "1/5"]], exact=True)
+    assert mo.det(A) == Fraction(1, 10) - Fraction(1, 12)
+    inv = mo.inv(A)
+    assert (inv.dot(A) == np.eye(2, dtype=int)).all()
+    with pytest.raises(ValueError):
+        mo.inv(parse_matrix([["1", "2"], ["2", "4"]], exact=True))
+
+
+def test_exact_det_matches_fraction_hilbert():
+    n = 8
+    H = np.array([[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)], dtype=object)
+    d = exact.det(H)
+    assert d > 0 and d.numerator == 1
+    dA, X = exact.solve(H, np.array([Fraction(1)] * n, dtype=object))
+    assert dA == d
+    assert (H.dot(X) == 1).all()
+
+
+def test_exact_linear_systems():
+    A = parse_matrix([["2", "1"], ["5", "3"]], exact=True)
+    b = parse_vector(["1", "2"], exact=True)
+    res = ls.cramer(A, b)
+    assert res['solution'] == [1, -1]
+    assert res['detA'] == 1 and res['dets'] == [1, -1]
+    res = ls.multi_solve(A, np.array([[1, 0], [2, 1]], dtype=object), include_inverse=True)
+    assert res['Ainv'] == [[3, -1], [-5, 2]]
+    assert 'error' in ls.inverse_solve(parse_matrix([["1", "2"], ["2", "4"]], exact=True), b)
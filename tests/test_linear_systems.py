@@ -31,4 +31,30 @@ def test_inverse_solve_singular():
     A = np.array([[1,2],[2,4]], dtype=float)
     b = np.array([1,1], dtype=float)
     res = ls.inverse_solve(A,b)
-    assert 'error' in res
\ No newline at end of file
+    assert 'error' in res
+
+def test_cramer_matches_column_determinants():
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(6,6))
+    b = rng.normal(size=6)
+    res = ls.cramer(A,b)
+    assert abs(res['detA'] - np.linalg.det(A)) < 1e-9
+    for k in range(6):
+        Ak = A.copy()
+        Ak[:, k] = b
+        assert abs(res['dets'][k] - np.linalg.det(Ak)) < 1e-8
+        np.testing.assert_allclose(res['matrices'][f"A{k+1}"], Ak)
+    assert 'matrices' not in ls.cramer(A, b, include_matrices=False)
+
+
+def test_multi_solve_and_stream():
+    rng = np.random.default_rng(3)
+    A = rng.normal(size=(5,5))
+    B = rng.normal(size=(5,4))
+    res = ls.multi_solve(A, B)
+    np.testing.assert_allclose(res['solution'], np.linalg.solve(A, B))
+    assert 'Ainv' not in res
+    np.testing.assert_allclose(ls.multi_solve(A, B, include_inverse=True)['Ainv'], np.linalg.inv(A))
+    xs = list(ls.solve_stream(A, (B[:, j] for j in range(4))))
+    np.testing.assert_allclose(np.column_stack(xs), np.linalg.solve(A, B))
+    assert 'error' in ls.multi_solve(np.array([[1.,2.],[2.,4.]]), np.ones((2,2)))
@@ -0,0 +1,21 @@
+import pytest
+from benchmarks import loadtest
+
+
+def test_parse_mix():
+    assert loadtest.parse_mix("operate:mul=3,vectors") == {"operate:mul": 3.0, "vectors": 1.0}
+    for bad in ("operate:pow=1", "cramer:x=1", "foo=1", "inverse=0", ""):
+        with pytest.raises(ValueError):
+            loadtest.parse_mix(bad)
+
+
+def test_loadtest_in_process():
+    mix = loadtest.parse_mix("operate:inv=1,cramer=1,inverse=1,vectors=1")
+    report = loadtest.run(mix, [2, 4], concurrency=2, duration=30.0, requests=24, variants=2, cache=False)
+    total = report["total"]
+    assert total["requests"] == 24 and total["errors"] == 0 and total["status"] == {"200": 24}
+    assert set(total["latencyMs"]) == {"p50", "p95", "p99", "mean", "max"}
+    assert total["latencyMs"]["p50"] <= total["latencyMs"]["p99"]
+    assert sum(s["all"]["requests"] for s in report["scenarios"].values()) == 24
+    assert set(report["scenarios"]["cramer"]) == {"all", "2", "4"}
+    assert set(report["scenarios"]["vectors"]) == {"all"}
@@ -28,4 +28,111 @@ def test_det_inv_trans():
     np.testing.assert_allclose(inv.dot(A), np.eye(2), atol=1e-9)
     np.testing.assert_allclose(mo.transpose(A), A.T)
     with pytest.raises(ValueError):
-        mo.inv(np.array([[1,2],[2,4]], dtype=float))
\ No newline at end of file
+        mo.inv(np.array([[1,2],[2,4]], dtype=float))
+
+def test_add_subtract_inplace():
+    A = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+    B = np.ones((2, 2), dtype=np.float32)
+    out = mo.add(A, B, inplace=True)
+    assert out is A and out.dtype == np.float32
+    np.testing.assert_allclose(A, [[2, 3], [4, 5]])
+    assert mo.subtract(A, B, inplace=True) is A
+    # De sólo lectura o de tipo menor que el resultado: se reserva una matriz nueva
+    A.setflags(write=False)
+    assert mo.add(A, B, inplace=True) is not A
+    C = np.ones((2, 2), dtype=np.float32)
+    out = mo.add(C, np.ones((2, 2)), inplace=True)
+    assert out is not C and out.dtype == np.float64
+
+
+def test_dense_lu_solve_det_float32():
+    rng = np.random.default_rng(2)
+    A = rng.normal(size=(150,150))
+    lu = mo.DenseLU(A)
+    assert abs(lu.det / np.linalg.det(A) - 1) < 1e-9
+    assert mo.det(A) == lu.det
+    b = rng.normal(size=(150,3))
+    np.testing.assert_allclose(lu.solve(b), np.linalg.solve(A, b), atol=1e-9)
+    np.testing.assert_allclose(lu.solve(b[:, 0]), np.linalg.solve(A, b[:, 0]), atol=1e-9)
+    np.testing.assert_allclose(mo.inv(A), np.linalg.inv(A), atol=1e-9)
+    lu32 = mo.DenseLU(A.astype(np.float32))
+    assert lu32.inverse().dtype == np.float32
+    np.testing.assert_allclose(lu32.solve(b.astype(np.float32)), np.linalg.solve(A, b), atol=1e-2)
+
+
+def test_dense_lu_logdet_rcond_inverse():
+    rng = np.random.default_rng(3)
+    A = rng.normal(size=(120, 120)) * 1e3
+    lu = mo.DenseLU(A)
+    sign, logabs = np.linalg.slogdet(A)
+    assert lu.sign == sign and np.isclose(lu.logabsdet, logabs)
+    # |A| ≈ 10^(3·120) no cabe en float: el logaritmo sí
+    assert lu.det is None and mo.det(A) is None
+    exact_rcond = 1 / (np.linalg.norm(A, 1) * np.linalg.norm(np.linalg.inv(A), 1))
+    assert exact_rcond / 3 <= lu.rcond <= exact_rcond * (1 + 1e-9)
+    np.testing.assert_allclose(lu.inverse() @ A, np.eye(120), atol=1e-9)
+    np.testing.assert_allclose(lu.solve(A[:, :2]), np.eye(120)[:, :2], atol=1e-9)
+    # La singularidad no depende de la escala: |S| = -2e-12 pero S está bien condicionada
+    S = 1e-6 * np.array([[1.0, 2.0], [3.0, 4.0]])
+    np.testing.assert_allclose(mo.inv(S) @ S, np.eye(2), atol=1e-9)
+    assert not mo.DenseLU(S).singular
+    for S in (np.arange(9.0).reshape(3, 3), np.ones((4, 4))):
+        assert mo.DenseLU(S).singular
+        with pytest.raises(ValueError):
+            mo.inv(S)
+
+
+def test_multiply_chain_order():
+    rng = np.random.default_rng(0)
+    mats = [rng.random((10, 100)), rng.random((100, 5)), rng.random((5, 50))]
+    P, info = mo.multiply_chain(mats, return_order=True)
+    np.testing.assert_allclose(P, mats[0] @ mats[1] @ mats[2])
+    assert info["order"] == "((A1·A2)·A3)"
+    assert info["cost"] == 10 * 100 * 5 + 10 * 5 * 50
+    # El orden izquierda a derecha no siempre es óptimo
+    cost, split = mo.chain_order([(50, 5), (5, 100), (100, 10)])
+    assert cost == 5 * 100 * 10 + 50 * 5 * 10 and split[0][2] == 0
+    with pytest.raises(ValueError):
+        mo.multiply_chain([np.ones((2, 3)), np.ones((2, 3))])
+
+
+def test_power_methods():
+    rng = np.random.default_rng(1)
+    P = rng.random((4, 4))
+    P /= P.sum(axis=1, keepdims=True)  # matriz de Markov
+    res, method = mo.power(P, 37, return_method=True)
+    assert method == "squaring"
+    np.testing.assert_allclose(res, np.linalg.matrix_power(P, 37))
+    S = P + P.T
+    res, method = mo.power(S, 40, return_method=True)
+    assert method == "eigh"
+    np.testing.assert_allclose(res, np.linalg.matrix_power(S, 40), rtol=1e-9)
+    assert mo.power(np.diag([2.0, 3.0]), 3, return_method=True)[1] == "diagonal"
+    np.testing.assert_allclose(mo.power(P, -2), np.linalg.matrix_power(np.linalg.inv(P), 2))
+    np.testing.assert_allclose(mo.power(P, 0), np.eye(4))
+    with pytest.raises(ValueError):
+        mo.power(np.ones((2, 3)), 2)
+
+
+def test_dense_lu_numpy_fallback(monkeypatch):
+    monkeypatch.setattr(mo.lapack, "available", lambda: False)
+    A = np.array([[4.0, 7.0], [2.0, 6.0]])
+    lu = mo.DenseLU(A)
+    assert lu.det == pytest.approx(10.0)
+    np.testing.assert_allclose(lu.inverse() @ A, np.eye(2), atol=1e-12)
+    np.testing.assert_allclose(lu.solve(np.array([1.0, 0.0])), np.linalg.solve(A, [1.0, 0.0]))
+    assert mo.DenseLU(np.ones((3, 3))).singular
+
+
+def test_dense_lu_numpy_fallback_factorizes_once(monkeypatch):
+    monkeypatch.setattr(mo.lapack, "available", lambda: False)
+    calls = []
+    for name in ("slogdet", "inv"):
+        fn = getattr(np.linalg, name)
+        monkeypatch.setattr(np.linalg, name, lambda A, fn=fn, name=name: calls.append(name) or fn(A))
+    A = np.array([[4.0, 7.0], [2.0, 6.0]])
+    mo.det(A)
+    assert calls == ["slogdet"]
+    calls.clear()
+    mo.DenseLU(A).inverse()
+    assert calls == ["inv"]
@@ -0,0 +1,67 @@
+from app.utils import metrics
+
+
+def test_size_bucket():
+    assert metrics.size_bucket(1) == "1-4"
+    assert metrics.size_bucket(16) == "5-16"
+    assert metrics.size_bucket(17) == "17-64"
+    assert metrics.size_bucket(5000) == ">1024"
+
+
+def test_stage_records_only_inside_request():
+    with metrics.stage("parse"):
+        pass  # sin petición activa no falla ni registra
+    timings = metrics.RequestTimings()
+    token = metrics._current.set(timings)
+    try:
+        with metrics.stage("parse"):
+            pass
+        with metrics.stage("parse"):
+            pass
+        metrics.annotate(op="det", size=100)
+    finally:
+        metrics._current.reset(token)
+    assert list(timings.stages) == ["parse"]
+    assert timings.labels == {"op": "det", "size": "65-256"}
+    assert metrics.server_timing(timings).startswith("parse;dur=")
+
+
+def test_registry_render_prometheus():
+    reg = metrics.Registry()
+    timings = metrics.RequestTimings()
+    timings.stages = {"compute": 0.003, "total": 0.02}
+    timings.labels = {"op": "inv", "size": "1-4"}
+    reg.observe("/api/matrix/operate", 200, timings)
+    reg.observe("/api/matrix/operate", 200, timings)
+    text = reg.render({"calc_cache_bytes": ("gauge", "Bytes.", {"": 42})})
+    assert 'calc_requests_total{endpoint="/api/matrix/operate",status="200"} 2' in text
+    labels = 'endpoint="/api/matrix/operate",op="inv",size="1-4",stage="compute"'
+    assert f'calc_request_stage_seconds_bucket{{{labels},le="0.0025"}} 0' in text
+    assert f'calc_request_stage_seconds_bucket{{{labels},le="0.005"}} 2' in text
+    assert f'calc_request_stage_seconds_count{{{labels}}} 2' in text
+    assert "calc_cache_bytes 42" in text
+
+
+def test_endpoint_label_uses_route_template():
+    class Route:
+        path = "/api/matrix/store/{mid}"
+
+    assert metrics.endpoint_label({"path": "/api/matrix/store/abc123", "route": Route()}) == Route.path
+    assert metrics.endpoint_label({"path": "/api/nope"}) == "other"
+
+
+def test_records_validation_from_body_arrival():
+    @metrics.records_validation
+    def endpoint(x):
+        return x * 2
+
+    timings = metrics.RequestTimings()
+    token = metrics._current.set(timings)
+    try:
+        assert endpoint(2) == 4  # sin cuerpo recibido no se registra
+        assert "validate" not in timings.stages
+        timings.body_received = metrics.time.perf_counter()
+        endpoint(1)
+    finally:
+        metrics._current.reset(token)
+    assert timings.stages["validate"] >= 0.0
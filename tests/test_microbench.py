@@ -0,0 +1,21 @@
+from benchmarks import microbench
+
+
+def test_microbench_run_and_compare(monkeypatch):
+    monkeypatch.setattr(microbench, "MIN_SAMPLE_TIME", 0.0)
+    monkeypatch.setattr(microbench, "SAMPLES", 1)
+    res = microbench.run([2, 3], only=["matrix_ops.det", "parse_matrix"])
+    assert set(res["results"]) == {"matrix_ops.det", "parse_matrix"}
+    assert set(res["results"]["matrix_ops.det"]) == {"2", "3"}
+    slow = {"results": {"matrix_ops.det": {"2": {"median": 1.0, "min": 1.0}}}}
+    fast = {"results": {"matrix_ops.det": {"2": {"median": 0.5, "min": 0.5}}}}
+    assert microbench.compare(slow, fast, 0.25)
+    assert not microbench.compare(fast, slow, 0.25)
+
+
+def test_microbench_missing_baseline_fails_with_threshold(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(microbench, "MIN_SAMPLE_TIME", 0.0)
+    monkeypatch.setattr(microbench, "SAMPLES", 1)
+    args = ["--sizes", "2", "--only", "matrix_ops.det", "--baseline", str(tmp_path / "none.json")]
+    assert microbench.main(args) == 0
+    assert microbench.main(args + ["--threshold", "0.25"]) == 2
@@ -22,4 +22,14 @@ def test_parse_matrix_and_vector():
     A = parse_matrix([["1","2/3"],["-1","0"]])
     assert A.shape == (2,2)
     b = parse_vector(["3","1/2"])
-    assert b.shape == (2,)
\ No newline at end of file
+    assert b.shape == (2,)
+
+def test_parse_matrix_bulk_matches_cellwise():
+    cells = [["1", " 2.5 ", "-3/4", "1/3"], ["1/3", "0", "7/2", "-1e2"]]
+    A = parse_matrix(cells)
+    expected = np.array([[parse_number(c) for c in r] for r in cells])
+    np.testing.assert_array_equal(A, expected)
+    with pytest.raises(ValueError, match="'x'"):
+        parse_matrix([["1/2", "x"], ["1", "2"]])
+    with pytest.raises(ValueError, match="vacío"):
+        parse_vector(["1", " "])
@@ -0,0 +1,120 @@
+import io
+import json
+import numpy as np
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing import List, Literal
+from app.utils.payloads import RawPayload, decode
+
+
+class Opts(BaseModel):
+    op: Literal["det", "add"]
+
+
+class Req(Opts):
+    A: List[List[str]]
+    b: List[str]
+
+
+KINDS = {"A": "matrix", "b": "vector"}
+
+
+def raw(body, content_type="application/json", query=None, headers=None):
+    return RawPayload(content_type, body, query or {}, headers or {})
+
+
+def test_decode_string_and_numeric_json():
+    opts, arrs = decode(raw(json.dumps({"A": [["1", "1/2"], ["0", "2"]], "b": ["1", "2"], "op": "det"}).encode()), Opts, Req, KINDS)
+    assert opts.op == "det"
+    np.testing.assert_allclose(arrs["A"], [[1, 0.5], [0, 2]])
+    _, arrs = decode(raw(json.dumps({"A": [[1, 2], [3, 4]], "b": [1, 2], "op": "add"}).encode()), Opts, Req, KINDS)
+    np.testing.assert_allclose(arrs["A"], [[1, 2], [3, 4]])
+    with pytest.raises(ValidationError):
+        decode(raw(json.dumps({"A": [[1]], "b": [1], "op": "mul"}).encode()), Opts, Req, KINDS)
+
+
+def test_decode_rejects_invalid_numeric_cells():
+    def error(body, *args):
+        with pytest.raises(ValueError) as e:
+            decode(raw(body, *args), Opts, Req, KINDS)
+        return str(e.value)
+
+    assert "A[0][1]" in error(json.dumps({"A": [[1, "1/2"]], "b": [1], "op": "det"}).encode())
+    assert "mismo número de columnas" in error(json.dumps({"A": [[1, 2], [3]], "b": [1], "op": "det"}).encode())
+    assert "no finito" in error(b'{"A": [[1, NaN]], "b": [1], "op": "det"}')
+    # Los formatos binarios aplican las mismas comprobaciones
+    buf = io.BytesIO()
+    np.save(buf, np.array([[1.0, np.inf]]))
+    assert "no finito" in error(buf.getvalue(), "application/x-npy", {"op": "det"})
+    buf = io.BytesIO()
+    np.savez(buf, A=np.array([[np.nan]]))
+    assert "no finito" in error(buf.getvalue(), "application/x-npz", {"op": "det"})
+    body = np.array([1.0, np.nan, 3.0, 4.0]).tobytes()
+    assert "no finito" in error(body, "application/octet-stream", {"op": "det"}, {"x-matrix-shape": "2x2"})
+    buf = io.BytesIO()
+    np.save(buf, np.zeros((2, 2), dtype=[("x", "f8"), ("y", "f8")]))
+    assert "no numérico" in error(buf.getvalue(), "application/x-npy", {"op": "det"})
+
+
+def test_decode_binary_formats():
+    buf = io.BytesIO()
+    np.save(buf, np.array([[2.0, 1.0, 1.0], [5.0, 3.0, 2.0]]))
+    _, arrs = decode(raw(buf.getvalue(), "application/x-npy", {"op": "det"}), Opts, Req, KINDS)
+    np.testing.assert_allclose(arrs["A"], [[2, 1], [5, 3]])
+    np.testing.assert_allclose(arrs["b"], [1, 2])
+    body = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]).tobytes()
+    _, arrs = decode(raw(body, "application/octet-stream", {"op": "det"}, {"x-matrix-shape": "A=2x2;b=2"}), Opts, Req, KINDS)
+    np.testing.assert_allclose(arrs["A"], [[1, 2], [3, 4]])
+    np.testing.assert_allclose(arrs["b"], [5, 6])
+    with pytest.raises(ValueError):
+        decode(raw(body, "application/octet-stream", {"op": "det"}, {"x-matrix-shape": "3x3"}), Opts, Req, KINDS)
+
+
+def test_decode_sparse_json():
+    body = {"A": {"format": "coo", "shape": [2, 2], "row": [0, 1], "col": [1, 0], "data": [2, 3]}, "b": [1, 2], "op": "det"}
+    _, arrs = decode(raw(json.dumps(body).encode()), Opts, Req, KINDS)
+    np.testing.assert_allclose(arrs["A"].to_dense(), [[0, 2], [3, 0]])
+    body["b"] = {"format": "coo", "shape": [2, 1], "row": [0], "col": [0], "data": [1]}
+    with pytest.raises(ValueError):
+        decode(raw(json.dumps(body).encode()), Opts, Req, KINDS)
+
+
+def test_decode_stored_handles():
+    from app.utils.store import MatrixStore
+    store = MatrixStore(10**6, 60)
+    mid = store.put(np.array([[2.0, 0.0], [0.0, 4.0]]))["id"]
+    _, arrs = decode(raw(json.dumps({"A": mid, "b": ["1", "1/2"], "op": "det"}).encode()), Opts, Req, KINDS, store=store)
+    np.testing.assert_allclose(arrs["A"], [[2, 0], [0, 4]])
+    np.testing.assert_allclose(arrs["b"], [1, 0.5])
+    with pytest.raises(ValueError):
+        decode(raw(json.dumps({"A": [["1"]], "b": mid, "op": "det"}).encode()), Opts, Req, KINDS, store=store)
+    with pytest.raises(ValueError):
+        decode(raw(json.dumps({"A": "m_missing", "b": ["1"], "op": "det"}).encode()), Opts, Req, KINDS, store=store)
+
+
+class PrecisionOpts(Opts):
+    exact: bool = False
+    dtype: Literal["float64", "float32"] = "float64"
+
+
+class PrecisionReq(PrecisionOpts):
+    A: List[List[str]]
+    b: List[str]
+
+
+def test_decode_float32():
+    text = {"A": [["1", "1/3"], ["0", "2"]], "b": ["1", "2"], "op": "det", "dtype": "float32"}
+    _, arrs = decode(raw(json.dumps(text).encode()), PrecisionOpts, PrecisionReq, KINDS)
+    assert arrs["A"].dtype == np.float32 and arrs["b"].dtype == np.float32
+    np.testing.assert_allclose(arrs["A"], [[1, 1 / 3], [0, 2]], rtol=1e-7)
+    _, arrs = decode(raw(json.dumps({"A": [[1, 2], [3, 4]], "b": [1, 2], "op": "add", "dtype": "float32"}).encode()),
+                     PrecisionOpts, PrecisionReq, KINDS)
+    assert arrs["A"].dtype == np.float32
+    # Búfer plano en float32: la mitad de bytes que en float64
+    body = np.arange(1.0, 7.0, dtype="<f4").tobytes()
+    _, arrs = decode(raw(body, "application/octet-stream", {"op": "det", "dtype": "float32"},
+                         {"x-matrix-shape": "A=2x2;b=2"}), PrecisionOpts, PrecisionReq, KINDS)
+    assert arrs["A"].dtype == np.float32
+    np.testing.assert_allclose(arrs["b"], [5, 6])
+    with pytest.raises(ValueError):
+        decode(raw(json.dumps({**text, "exact": True}).encode()), PrecisionOpts, PrecisionReq, KINDS)
@@ -0,0 +1,65 @@
+import gzip
+import json
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from app.core.sparse import CSRMatrix
+from app.utils import responses
+from app.utils.responses import ArrayJSONResponse
+
+
+def test_dumps_arrays_and_special_values():
+    A = np.arange(6.0).reshape(2, 3)
+    content = {
+        "T": A.T,  # no C-contigua
+        "exact": np.array([[Fraction(7, 3)]], dtype=object),
+        "scalar": np.float64(1.5),
+        "sparse": CSRMatrix.from_dense(np.eye(2)),
+        "matrices": iter([("A1", A)]),
+    }
+    out = json.loads(responses.dumps(content))
+    assert out["T"] == A.T.tolist()
+    assert out["exact"] == [["7/3"]] and out["scalar"] == 1.5
+    assert out["sparse"]["format"] == "coo"
+    assert out["matrices"] == {"A1": A.tolist()}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_nonfinite_as_null(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    elif responses.orjson is None:
+        pytest.skip("orjson no instalado")
+    content = {
+        "x": float("nan"), "y": np.float64(np.inf), "z": np.float32(-np.inf),
+        "M": np.array([[1.0, np.nan], [np.inf, 2.0]]), "T": np.array([[1.0, np.nan]]).T,
+        "matrices": iter([("A1", np.array([np.nan]))]),
+    }
+    out = json.loads(responses.dumps(content))
+    assert out["x"] is None and out["y"] is None and out["z"] is None
+    assert out["M"] == [[1.0, None], [None, 2.0]] and out["T"] == [[1.0], [None]]
+    assert out["matrices"] == {"A1": [None]}
+
+
+def test_precision_and_gzip():
+    assert responses.parse_precision({}) is None
+    assert responses.parse_precision({"precision": "3"}) == 3
+    with pytest.raises(ValueError):
+        responses.parse_precision({"precision": "18"})
+    rounded = responses.round_floats({"x": 1 / 3, "M": np.full((2, 2), 2 / 3), "n": 4}, 2)
+    assert rounded["x"] == 0.33 and rounded["M"][0, 0] == 0.67 and rounded["n"] == 4
+    big = {"M": np.random.default_rng(0).random((100, 100))}
+    resp = ArrayJSONResponse(big, accept_encoding="gzip, br")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(resp.body))["M"] == big["M"].tolist()
+    assert "content-encoding" not in ArrayJSONResponse(big, accept_encoding="gzip;q=0").headers
+    assert "content-encoding" not in ArrayJSONResponse({"x": 1}, accept_encoding="gzip").headers
+
+
+def test_cast_floats_float32():
+    A = np.array([[0.1, 1 / 3]])
+    out = responses.cast_floats({"M": A, "n": np.arange(2), "detA": 1e300, "matrices": iter([("A1", A)])}, np.float32)
+    assert out["M"].dtype == np.float32 and out["n"].dtype.kind == "i" and out["detA"] == 1e300
+    body = json.loads(responses.dumps(out))
+    assert body["M"] == [[0.1, 0.33333334]] and body["matrices"] == {"A1": [[0.1, 0.33333334]]}
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from app.core import matrix_ops as mo
+from app.utils.scheduler import Scheduler, SchedulerBusy, estimate_flops
+
+
+def test_estimate_flops():
+    assert estimate_flops("inv", (100, 100)) == 1e6
+    assert estimate_flops("mul", (10, 20), (20, 30)) == 2 * 10 * 20 * 30
+    assert estimate_flops("add", (10, 20), (10, 20)) == 200
+    assert estimate_flops("det", (10, 10), exact=True) > estimate_flops("det", (10, 10))
+
+
+def test_scheduler_inline_and_offload():
+    sched = Scheduler(workers=1, min_flops=1e4, max_pending=1)
+    A = np.array([[4.0, 7.0], [2.0, 6.0]])
+    assert sched.run(estimate_flops("det", A.shape), mo.det, A) == pytest.approx(10.0)
+    B = np.eye(30) * 2
+    try:
+        np.testing.assert_allclose(sched.run(estimate_flops("inv", B.shape), mo.inv, B), np.eye(30) / 2)
+        with pytest.raises(ValueError):
+            sched.run(1e9, mo.inv, np.zeros((30, 30)))
+    finally:
+        sched.shutdown()
+    st = sched.stats()
+    assert st["inline"] == 1 and st["offloaded"] == 2 and st["pending"] == 0
+    sched._pending = 1
+    with pytest.raises(SchedulerBusy):
+        sched.run(1e9, mo.inv, B)
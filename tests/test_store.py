@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from app.utils.store import MatrixStore, is_handle
+
+
+def test_store_dedup_ttl_and_lru():
+    now = [0.0]
+    store = MatrixStore(max_bytes=2 * 8 * 100, ttl=10, clock=lambda: now[0])
+    a, b, c = np.zeros((10, 10)), np.ones((10, 10)), np.full((10, 10), 2.0)
+    ia = store.put(a)["id"]
+    assert is_handle(ia) and store.put(a.copy())["id"] == ia
+    ib = store.put(b)["id"]
+    now[0] = 5.0
+    store.get(ia)  # `a` pasa a ser la más reciente
+    store.put(c)  # excede el límite: se expulsa `b` (LRU)
+    with pytest.raises(ValueError):
+        store.get(ib)
+    assert store.get(ia) is not None and not store.get(ia).flags.writeable
+    now[0] = 20.0  # `a` y `c` llevan más de 10 s sin uso
+    with pytest.raises(ValueError):
+        store.get(ia)
+    st = store.stats()
+    assert st["entries"] == 0 and st["evictions"] == 1 and st["expirations"] == 2
+    assert store.put(np.zeros((100, 100))) is None
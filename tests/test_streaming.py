@@ -0,0 +1,20 @@
+import json
+import numpy as np
+from app.core import linear_systems as ls
+from app.utils import streaming
+
+
+def test_iter_ndjson_rows():
+    M = np.arange(200, dtype=float).reshape(100, 2)
+    lines = b"".join(streaming.iter_ndjson({"detA": 1.5, "Ainv": M})).decode().splitlines()
+    assert json.loads(lines[0]) == {"detA": 1.5}
+    assert json.loads(lines[1]) == {"field": "Ainv", "shape": [100, 2]}
+    np.testing.assert_allclose([json.loads(l) for l in lines[2:]], M)
+
+
+def test_cramer_arrays_jsonable_matches_lists():
+    A = np.array([[2, 1], [5, 3]], dtype=float)
+    b = np.array([1, 2], dtype=float)
+    assert streaming.to_jsonable(ls.cramer(A, b, as_arrays=True)) == ls.cramer(A, b)
+    lines = b"".join(streaming.iter_ndjson(ls.cramer(A, b, as_arrays=True))).decode().splitlines()
+    assert json.loads(lines[1]) == {"field": "matrices.A1", "shape": [2, 2]}
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from app.core import linear_systems, matrix_ops, structure
+
+
+def make(kind, n, rng):
+    M = rng.normal(size=(n, n))
+    return {
+        "diagonal": np.diag(rng.random(n) + 1.0),
+        "lower": np.tril(M) + n * np.eye(n),
+        "upper": np.triu(M) + n * np.eye(n),
+        "tridiagonal": np.diag(np.full(n, 4.0)) + np.diag(np.ones(n - 1), 1) - np.diag(np.ones(n - 1), -1),
+        "spd": M @ M.T + n * np.eye(n),
+        "general": M,
+    }[kind]
+
+
+@pytest.mark.parametrize("kind,method", [
+    ("diagonal", "diagonal"), ("lower", "triangular"), ("upper", "triangular"),
+    ("tridiagonal", "thomas"), ("spd", "cholesky"), ("general", "lu"),
+])
+def test_dispatch_by_structure(kind, method):
+    rng = np.random.default_rng(0)
+    A = make(kind, 40, rng)
+    b = rng.normal(size=40)
+    assert structure.detect(A) == kind
+    res = linear_systems.multi_solve(A, b, as_arrays=True)
+    assert res["method"] == method
+    np.testing.assert_allclose(A @ res["solution"][:, 0], b, atol=1e-9)
+    assert np.isclose(res["detA"], np.linalg.det(A), rtol=1e-8)
+    inv = linear_systems.inverse_solve(A, b, as_arrays=True)
+    assert inv["method"] == method
+    np.testing.assert_allclose(inv["Ainv"] @ A, np.eye(40), atol=1e-9)
+    Ainv, used = matrix_ops.inv(A, return_method=True)
+    assert used == method
+    np.testing.assert_allclose(Ainv, inv["Ainv"], atol=1e-9)
+
+
+def test_fallbacks_and_singular():
+    # Simétrica con diagonal positiva pero indefinida: Cholesky falla y se usa LU
+    A = np.array([[1.0, 2.0, 0.5], [2.0, 1.0, 0.5], [0.5, 0.5, 1.0]])
+    assert structure.detect(A) == "spd"
+    res = linear_systems.cramer(A, np.ones(3))
+    assert res["method"] == "lu"
+    # Tridiagonal no dominante: Thomas no aplica
+    T = np.array([[1.0, 3.0, 0.0], [3.0, 1.0, 3.0], [0.0, 3.0, 1.0]])
+    assert linear_systems.cramer(T, np.ones(3))["method"] == "lu"
+    # Triangular singular
+    U = np.triu(np.ones((3, 3)))
+    U[1, 1] = 0.0
+    assert "error" in linear_systems.cramer(U, np.ones(3))
+    with pytest.raises(ValueError):
+        matrix_ops.inv(np.diag([1.0, 0.0]))
+
+
+def test_structured_det_log_space_and_conditioning():
+    n = 400
+    # Π diag desborda (10⁴⁰⁰) o se anula (10⁻⁴⁰⁰): |A| no es representable, no `inf`/`0.0`
+    for d in (10.0, 0.1):
+        res = linear_systems.cramer(np.diag(np.full(n, d)), np.ones(n), include_matrices=False)
+        assert res["detA"] is None and "error" not in res
+    L = np.tril(np.ones((n, n))) + np.eye(n)
+    assert linear_systems.multi_solve(L, np.ones(n))["detA"] == pytest.approx(2.0 ** n)
+    spd = 50.0 * np.eye(300)
+    spd[0, 1] = spd[1, 0] = 1.0
+    assert structure.solve(spd, np.ones(300), "spd")[0] is None
+    # Casi singulares: pivotes no nulos pero condición < RCOND_MIN, igual que en la LU general
+    D = np.diag([1.0, 1e-17, 1.0])
+    U = np.triu(np.ones((3, 3)))
+    U[1, 1] = 1e-17
+    for M in (D, U):
+        assert "error" in linear_systems.cramer(M, np.ones(3))
+        assert "error" in linear_systems.inverse_solve(M, np.ones(3))
+        with pytest.raises(ValueError):
+            matrix_ops.inv(M)
+
+
+@pytest.mark.parametrize("lower", [True, False])
+def test_tri_solver_blocks_and_transpose(lower):
+    rng = np.random.default_rng(4)
+    n = 150  # varios bloques de `TRI_BLOCK` y uno parcial
+    T = rng.normal(size=(n, n)) + n * np.eye(n)
+    T = np.tril(T) if lower else np.triu(T)
+    B = rng.normal(size=(n, 3))
+    solve = structure.tri_solver(T, lower)
+    np.testing.assert_allclose(T @ solve(B), B, atol=1e-10)
+    np.testing.assert_allclose(T.T @ solve(B[:, 0], True), B[:, 0], atol=1e-10)
+    np.testing.assert_allclose(structure.tri_solve(T, B, lower), solve(B))
+
+
+def test_thomas_recurrences_vector_and_matrix():
+    rng = np.random.default_rng(5)
+    n = 300
+    T = np.diag(rng.uniform(4, 5, n)) + np.diag(rng.uniform(-1, 1, n - 1), 1) + np.diag(rng.uniform(-1, 1, n - 1), -1)
+    f = structure._thomas(T)
+    b = rng.normal(size=n)
+    # Vector y pocas columnas: barrido de prefijos; muchas columnas: recorrido por filas
+    for B in (b, rng.normal(size=(n, 2)), rng.normal(size=(n, structure.SCAN_MAX_COLS + 1))):
+        np.testing.assert_allclose(T @ structure._thomas_solve(f, B), B, atol=1e-10)
+        np.testing.assert_allclose(T.T @ structure._thomas_solve(f, B, transpose=True), B, atol=1e-10)
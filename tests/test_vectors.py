@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from app.core import vectors as vec
 
 
@@ -18,4 +19,58 @@ def test_ops():
     assert np.allclose(s, [4,6])
     assert np.allclose(d, [-2,-2])
     assert abs(dp - (1*3+2*4)) < 1e-9
-    assert abs(cp - (1*4-2*3)) < 1e-9
\ No newline at end of file
+    assert abs(cp - (1*4-2*3)) < 1e-9
+
+def test_batch_matches_scalar_ops():
+    rng = np.random.default_rng(0)
+    U = rng.normal(size=(500, 2))
+    V = rng.normal(size=(500, 2))
+    out = vec.batch(U, V)
+    assert np.allclose(out["dot"], [vec.dot(u, v) for u, v in zip(U, V)])
+    assert np.allclose(out["cross"], [vec.cross(u, v) for u, v in zip(U, V)])
+    assert np.allclose(out["uPolar"][7], vec.from_components(*U[7]))
+    assert np.allclose(out["resultant"], U.sum(axis=0))
+    back = vec.to_components_batch(out["vPolar"])
+    assert np.allclose(back, V)
+
+
+def test_batch_3d_spherical_roundtrip():
+    rng = np.random.default_rng(1)
+    U = rng.normal(size=(100, 3))
+    V = rng.normal(size=(100, 3))
+    out = vec.batch(U, V)
+    assert np.allclose(out["cross"], np.cross(U, V))
+    assert np.allclose(vec.to_components_batch(out["uPolar"]), U)
+    assert np.allclose(vec.from_components_batch(np.zeros((1, 3))), 0.0)
+    with pytest.raises(ValueError):
+        vec.batch(U, V[:, :2])
+    with pytest.raises(ValueError):
+        vec.batch(np.ones((3, 4)))
+
+
+def test_plot_grid_modes():
+    u = np.array([3.0, 4.0])
+    v = np.array([-1.0, 2.0])
+    cfg = {"mainStepX": 1, "mainStepY": 1, "minorFactor": 2}
+    axis = vec.plot_data(u, v, {"grid": {**cfg, "mode": "axis"}})["layout"]
+    assert axis["shapes"] == []
+    assert axis["xaxis"]["dtick"] == 1 and axis["xaxis"]["minor"]["dtick"] == 0.5
+    # Por defecto, una línea por `shape` (formato original)
+    lines = vec.plot_data(u, v, {"grid": cfg})["layout"]["shapes"]
+    assert lines == vec.plot_data(u, v, {"grid": {**cfg, "mode": "shapes"}})["layout"]["shapes"]
+    paths = vec.plot_data(u, v, {"grid": {**cfg, "mode": "path"}})["layout"]["shapes"]
+    assert len(paths) == 2
+    # Mismos segmentos: cada línea individual es un comando `M` del trazo compacto
+    assert sum(p["path"].count("M") for p in paths) == len(lines)
+    with pytest.raises(ValueError):
+        vec.plot_data(u, v, {"grid": {"mode": "svg"}})
+
+
+def test_plot_grid_axis_mode_density_cap():
+    u = np.array([300.0, 400.0])
+    v = np.array([-100.0, 200.0])
+    layout = vec.plot_data(u, v, {"grid": {"mode": "axis", "minorStepX": 0.1, "minorStepY": 0.1}})["layout"]
+    for axis in ("xaxis", "yaxis"):
+        lo, hi = layout[axis]["range"]
+        assert (hi - lo) / layout[axis]["dtick"] + 1 <= vec.GRID_MAX_LINES
+        assert (hi - lo) / layout[axis]["minor"]["dtick"] + 1 <= vec.GRID_MAX_LINES
@@ -0,0 +1,29 @@
+from app.utils import warmup
+
+
+def test_startup_profile_phases():
+    ticks = iter([0.0, 0.5, 1.0, 1.25])
+    profile = warmup.StartupProfile(clock=lambda: next(ticks))
+    with profile.phase("static"):
+        pass
+    with profile.phase("static"):
+        pass
+    profile.record("imports", 0.1)
+    stats = profile.stats()
+    assert stats["phases"] == {"static": 750.0, "imports": 100.0}
+    assert stats["totalMs"] == 850.0 and not stats["ready"]
+    # El proceso empezó antes de importar `warmup` (y hace menos de una hora)
+    assert 0.0 <= warmup.process_age() < 3600.0
+
+
+def test_run_core_steps_and_failure():
+    profile = warmup.StartupProfile()
+    warmup.run(profile, warmup.core_steps())
+    stats = profile.stats()
+    assert stats["ready"] and stats["error"] is None
+    assert {"warmup.blas", "warmup.matrix_ops", "warmup.linear_systems"} <= set(stats["phases"])
+    # Un paso que falla corta el precalentamiento pero la instancia queda lista
+    profile = warmup.StartupProfile()
+    warmup.run(profile, [("warmup.bad", lambda: 1 / 0), ("warmup.never", lambda: None)])
+    assert profile.ready.is_set() and profile.error.startswith("ZeroDivisionError")
+    assert "warmup.bad" in profile.phases and "warmup.never" not in profile.phases